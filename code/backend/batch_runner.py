@@ -0,0 +1,223 @@
+"""
+Batch steganography jobs for StegoCrypt Suite
+
+Runs a manifest of encode jobs (JSON or CSV) on a process pool, reporting
+one record per job as it completes. Every successful job is appended to a
+journal next to the manifest, so a batch interrupted by a crash or reboot
+can be re-run and only the unfinished jobs are processed again.
+"""
+
+import csv
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Optional
+
+import logs
+from hash_cache import get_hash_cache
+
+CARRIERS = ("image", "audio", "video", "text")
+JOB_FIELDS = ("carrier", "input", "output", "message", "algorithm")
+DEFAULT_BATCH_WORKERS = os.cpu_count() or 1
+JOURNAL_SUFFIX = ".journal"
+
+
+def load_jobs(manifest_path: str) -> list:
+    """
+    Read jobs from a JSON manifest (a list of objects, or {"jobs": [...]})
+    or a CSV manifest with a header row. Each job needs carrier, input,
+    output, message and algorithm; password and id are optional. The id
+    defaults to the output path, which must be unique within the batch.
+    """
+    if manifest_path.lower().endswith(".csv"):
+        with open(manifest_path, "r", encoding="utf-8", newline="") as f:
+            jobs = [dict(row) for row in csv.DictReader(f)]
+    else:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        jobs = data.get("jobs") if isinstance(data, dict) else data
+        if not isinstance(jobs, list):
+            raise ValueError("JSON manifest must be a list of jobs or an object with a 'jobs' list")
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    seen = set()
+    for number, job in enumerate(jobs, 1):
+        if not isinstance(job, dict):
+            raise ValueError(f"Job {number} is not an object")
+        missing = [field for field in JOB_FIELDS if not job.get(field)]
+        if missing:
+            raise ValueError(f"Job {number} is missing {', '.join(missing)}")
+        job["carrier"] = job["carrier"].lower()
+        if job["carrier"] not in CARRIERS:
+            raise ValueError(f"Job {number} has unsupported carrier: {job['carrier']}")
+        # Relative paths are relative to the manifest, not the working directory
+        for field in ("input", "output"):
+            job[field] = os.path.join(base_dir, job[field])
+        if job["carrier"] == "image" and not job["output"].lower().endswith(".png"):
+            job["output"] += ".png"
+        job["id"] = str(job.get("id") or job["output"])
+        if job["id"] in seen:
+            raise ValueError(f"Job {number} has a duplicate id: {job['id']}")
+        seen.add(job["id"])
+    return jobs
+
+
+def read_journal(journal_path: str) -> dict:
+    """Return {job id: journal record} for every completed job"""
+    completed = {}
+    if not os.path.exists(journal_path):
+        return completed
+    with open(journal_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A crash can leave a partial last line; that job simply runs again
+                continue
+            completed[record["id"]] = record
+    return completed
+
+
+def encode_carrier(carrier: str, input_path: str, message: str, algorithm: str,
+                   password: Optional[str] = None, salt: Optional[bytes] = None) -> bytes:
+    """Encrypt a message and hide it in the carrier file; returns the stego file's bytes"""
+    # Imported here to keep importing this module light
+    from cryptography.message_crypto import encrypt_message
+    from steganography.image_stego import encode_image
+    from steganography.audio_stego import encode_audio
+    from steganography.video_stego import encode_video
+    from steganography.text_stego import encode_text_data
+    from utilities.timing import phase, record_size
+
+    if carrier not in CARRIERS:
+        raise ValueError(f"Unsupported carrier: {carrier}")
+    encrypted = encrypt_message(message, algorithm, password, salt)
+    if carrier == "text":
+        with phase("load_carrier"), open(input_path, "r", encoding="utf-8") as f:
+            cover_text = f.read()
+        record_size("carrier_bytes", len(cover_text.encode("utf-8")))
+        with phase("embed"):
+            return encode_text_data(encrypted, cover_text).encode("utf-8")
+    encoder = {"image": encode_image, "audio": encode_audio, "video": encode_video}[carrier]
+    return encoder(input_path, encrypted)
+
+
+def _encode(job: dict):
+    # No salt is passed, so every job's AES payload gets a fresh random salt
+    data = encode_carrier(job["carrier"], job["input"], job["message"], job["algorithm"],
+                          job.get("password"))
+    output_dir = os.path.dirname(job["output"])
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    tmp_path = job["output"] + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, job["output"])
+    return len(data)
+
+
+def run_job(job: dict) -> dict:
+    """Run one encode job in a worker process and return its result record"""
+    operation = f"ENCODE_{job['carrier'].upper()}"
+    details = {"filename": os.path.basename(job["input"]), "batch": True}
+    try:
+        logs.log_operation(operation, "STARTED", details)
+        input_digest = get_hash_cache().get_file_digest(job["input"])
+        output_bytes = _encode(job)
+        logs.log_operation(operation, "SUCCESS", {**details, "filename": os.path.basename(job["output"])})
+        return {
+            "type": "job",
+            "id": job["id"],
+            "status": "success",
+            "carrier": job["carrier"],
+            "input": job["input"],
+            "output": job["output"],
+            "input_sha256": input_digest,
+            "output_bytes": output_bytes,
+        }
+    except Exception as e:
+        logs.log_operation(operation, "FAILED", {**details, "error": str(e)})
+        return {"type": "job", "id": job["id"], "status": "error", "carrier": job["carrier"],
+                "input": job["input"], "message": str(e)}
+    finally:
+        # Pool workers exit without running atexit handlers, so write the
+        # queued log entries before handing the result back
+        logs.flush_logs()
+
+
+def run_batch(manifest_path: str, workers: int = DEFAULT_BATCH_WORKERS, journal_path: Optional[str] = None,
+              resume: bool = True, progress: Optional[Callable[[dict], None]] = None) -> dict:
+    """
+    Run every job in a batch manifest on a process pool
+
+    Args:
+        manifest_path: JSON or CSV job manifest
+        workers: Number of worker processes
+        journal_path: Completed-job journal (default: the manifest path + ".journal")
+        resume: Skip jobs already in the journal whose output still exists;
+            with resume=False the journal is started afresh
+        progress: Called with one record per job as it completes or is skipped
+
+    Returns:
+        Summary with total, succeeded, failed and skipped counts
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    jobs = load_jobs(manifest_path)
+    journal_path = journal_path or manifest_path + JOURNAL_SUFFIX
+    if not resume and os.path.exists(journal_path):
+        os.remove(journal_path)
+    completed = read_journal(journal_path)
+
+    summary = {"total": len(jobs), "succeeded": 0, "failed": 0, "skipped": 0}
+    pending_jobs = []
+    for job in jobs:
+        if job["id"] in completed and os.path.exists(job["output"]):
+            summary["skipped"] += 1
+            if progress:
+                progress({"type": "job", "id": job["id"], "status": "skipped", "output": job["output"],
+                          "done": summary["skipped"], "total": summary["total"]})
+        else:
+            pending_jobs.append(job)
+
+    max_in_flight = workers * 4
+    with open(journal_path, "a", encoding="utf-8") as journal:
+
+        def on_result(job, future):
+            try:
+                record = future.result()
+            except Exception as e:
+                # The worker process itself died (e.g. out of memory)
+                record = {"type": "job", "id": job["id"], "status": "error",
+                          "carrier": job["carrier"], "input": job["input"], "message": str(e)}
+            if record["status"] == "success":
+                summary["succeeded"] += 1
+                journal.write(json.dumps(record) + "\n")
+                journal.flush()
+            else:
+                summary["failed"] += 1
+            record["done"] = summary["succeeded"] + summary["failed"] + summary["skipped"]
+            record["total"] = summary["total"]
+            if progress:
+                progress(record)
+
+        if pending_jobs:
+            # Spawned rather than forked workers: the parent's log writer
+            # thread and SQLite connections must not be copied into children
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=min(workers, len(pending_jobs)), mp_context=context) as pool:
+                pending = {}
+                for job in pending_jobs:
+                    pending[pool.submit(run_job, job)] = job
+                    if len(pending) >= max_in_flight:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            on_result(pending.pop(future), future)
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        on_result(pending.pop(future), future)
+
+    summary["journal"] = journal_path
+    return summary
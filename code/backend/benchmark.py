@@ -0,0 +1,306 @@
+"""
+On-device engine benchmarks for StegoCrypt Suite
+
+Times every engine on generated data so operators can see how fast a
+workstation is before starting a batch job. Results are cached as JSON so
+the frontend can show them without re-running the benchmark.
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import tempfile
+import time
+import wave
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from hash_cache import CACHE_DIR
+from hashing import hash_file, get_supported_algorithms
+from steganography.image_stego import encode_image, decode_image
+from steganography.audio_stego import encode_audio, decode_audio
+from steganography.video_stego import encode_video, decode_video
+from steganography.text_stego import encode_text_data, decode_text_data
+from cryptography.aes_crypto import get_key_from_password, encrypt_aes, decrypt_aes
+from cryptography.rsa_crypto import encrypt_rsa_payload, decrypt_rsa_payload, max_oaep_message_size
+
+BENCH_CACHE_FILE = os.path.join(CACHE_DIR, "bench_results.json")
+ENGINES = ("image_lsb", "audio_lsb", "video_lsb", "text_zwc", "aes_pbkdf2", "rsa_oaep", "x25519_file", "hash")
+DEFAULT_REPEAT = 3
+
+# Generated workloads
+IMAGE_MEGAPIXELS = 1
+WAV_SECONDS = 10
+VIDEO_SHAPE = (320, 240, 30)
+TEXT_WORDS = 10_000
+DATA_MEGABYTES = 16
+CRYPTO_PAYLOAD_BYTES = 1024 * 1024
+MESSAGE = "StegoCrypt benchmark payload " * 7
+
+_WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+          "tempor incididunt ut labore et dolore magna aliqua").split()
+
+
+def make_image(path, megapixels):
+    """Write a square PNG of random pixels."""
+    side = max(1, int(math.sqrt(megapixels * 1_000_000)))
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (side, side, 3), dtype=np.uint8)
+    Image.fromarray(pixels).save(path, compress_level=1)
+
+
+def make_wav(path, seconds, rate=44100):
+    """Write a 16-bit stereo WAV (a noisy tone), a minute at a time."""
+    rng = np.random.default_rng(0)
+    with wave.open(str(path), "wb") as out:
+        out.setnchannels(2)
+        out.setsampwidth(2)
+        out.setframerate(rate)
+        for start in range(0, seconds, 60):
+            frames = rate * min(60, seconds - start)
+            t = np.arange(frames) / rate
+            tone = 8000 * np.sin(2 * np.pi * 440 * t) + rng.normal(0, 200, frames)
+            samples = np.repeat(tone.astype(np.int16)[:, None], 2, axis=1)
+            out.writeframes(samples.tobytes())
+
+
+def make_avi(path, width, height, frames, fps=25.0) -> bool:
+    """Write a lossless (FFV1) AVI; returns False if OpenCV has no FFV1 encoder."""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"FFV1"), fps, (width, height))
+    if not writer.isOpened():
+        return False
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    for index in range(frames):
+        writer.write(np.roll(base, index, axis=1))
+    writer.release()
+    return True
+
+
+def make_cover_text(path, words):
+    """Write a cover text of the given number of words."""
+    repeats = words // len(_WORDS) + 1
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(" ".join((_WORDS * repeats)[:words]))
+
+
+def make_data(path, megabytes):
+    """Write pseudo-random data."""
+    chunk = np.random.default_rng(0).integers(0, 256, 1024 * 1024, dtype=np.uint8).tobytes()
+    with open(path, "wb") as f:
+        for _ in range(megabytes):
+            f.write(chunk)
+
+
+def _measure(func: Callable, processed_bytes: Optional[int] = None, repeat: int = DEFAULT_REPEAT) -> dict:
+    """Median wall time of `repeat` calls, as ops/s and (given a size) MB/s."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    seconds = statistics.median(times)
+    result = {"seconds": round(seconds, 6), "ops_per_s": round(1 / seconds, 3) if seconds else None}
+    if processed_bytes is not None:
+        result["bytes"] = processed_bytes
+        result["mb_per_s"] = round(processed_bytes / seconds / 1_000_000, 3) if seconds else None
+    return result
+
+
+def _bench_image(workdir, repeat):
+    cover = os.path.join(workdir, "cover.png")
+    make_image(cover, IMAGE_MEGAPIXELS)
+    stego = os.path.join(workdir, "stego.png")
+    with open(stego, "wb") as f:
+        f.write(encode_image(cover, MESSAGE))
+    return {
+        "carrier": f"{IMAGE_MEGAPIXELS} MP PNG",
+        "encode": _measure(lambda: encode_image(cover, MESSAGE), os.path.getsize(cover), repeat),
+        "decode": _measure(lambda: decode_image(stego), os.path.getsize(stego), repeat),
+    }
+
+
+def _bench_audio(workdir, repeat):
+    cover = os.path.join(workdir, "cover.wav")
+    make_wav(cover, WAV_SECONDS)
+    stego = os.path.join(workdir, "stego.wav")
+    with open(stego, "wb") as f:
+        f.write(encode_audio(cover, MESSAGE))
+    return {
+        "carrier": f"{WAV_SECONDS} s stereo WAV",
+        "encode": _measure(lambda: encode_audio(cover, MESSAGE), os.path.getsize(cover), repeat),
+        "decode": _measure(lambda: decode_audio(stego), os.path.getsize(stego), repeat),
+    }
+
+
+def _bench_video(workdir, repeat):
+    cover = os.path.join(workdir, "cover.avi")
+    if not make_avi(cover, *VIDEO_SHAPE):
+        return {"status": "unavailable", "reason": "OpenCV has no FFV1 encoder"}
+    stego = encode_video(cover, MESSAGE)
+    return {
+        "carrier": "{}x{} FFV1 AVI, {} frames".format(*VIDEO_SHAPE),
+        "encode": _measure(lambda: encode_video(cover, MESSAGE), os.path.getsize(cover), repeat),
+        "decode": _measure(lambda: decode_video(stego), len(stego), repeat),
+    }
+
+
+def _bench_text(workdir, repeat):
+    path = os.path.join(workdir, "cover.txt")
+    make_cover_text(path, TEXT_WORDS)
+    with open(path, encoding="utf-8") as f:
+        cover = f.read()
+    stego = encode_text_data(MESSAGE, cover)
+    return {
+        "carrier": f"{TEXT_WORDS} word text",
+        "encode": _measure(lambda: encode_text_data(MESSAGE, cover), len(cover.encode("utf-8")), repeat),
+        "decode": _measure(lambda: decode_text_data(stego), len(stego.encode("utf-8")), repeat),
+    }
+
+
+def _bench_aes(workdir, repeat):
+    message = "A" * CRYPTO_PAYLOAD_BYTES
+    key, _ = get_key_from_password("benchmark", os.urandom(16))
+    ciphertext = encrypt_aes(key, message)
+    return {
+        # A random salt each time defeats the derived key cache, as for a new encryption
+        "pbkdf2": _measure(lambda: get_key_from_password("benchmark"), repeat=repeat),
+        "encrypt": _measure(lambda: encrypt_aes(key, message), CRYPTO_PAYLOAD_BYTES, repeat),
+        "decrypt": _measure(lambda: decrypt_aes(key, ciphertext), CRYPTO_PAYLOAD_BYTES, repeat),
+    }
+
+
+def _bench_rsa(workdir, repeat):
+    from Crypto.PublicKey import RSA
+
+    key = RSA.generate(2048)
+    public_key = key.publickey()
+    block = "A" * max_oaep_message_size(key)
+    ciphertext = encrypt_rsa_payload(public_key, block)
+    large = "A" * CRYPTO_PAYLOAD_BYTES
+    envelope = encrypt_rsa_payload(public_key, large)
+    return {
+        "key_bits": 2048,
+        "encrypt": _measure(lambda: encrypt_rsa_payload(public_key, block), len(block), repeat),
+        "decrypt": _measure(lambda: decrypt_rsa_payload(key, ciphertext), len(block), repeat),
+        "hybrid_encrypt": _measure(lambda: encrypt_rsa_payload(public_key, large), CRYPTO_PAYLOAD_BYTES, repeat),
+        "hybrid_decrypt": _measure(lambda: decrypt_rsa_payload(key, envelope), CRYPTO_PAYLOAD_BYTES, repeat),
+    }
+
+
+def _bench_x25519(workdir, repeat):
+    try:
+        # The module prints to stdout and exits when pyca/cryptography cannot
+        # be imported; keep that out of the CLI's JSON output
+        with contextlib.redirect_stdout(io.StringIO()):
+            from filesecuritywithx25519 import X25519FileEncryption
+    except (ImportError, SystemExit):
+        return {"status": "unavailable", "reason": "filesecuritywithx25519 needs pyca/cryptography"}
+
+    source = os.path.join(workdir, "data.bin")
+    if not os.path.exists(source):
+        make_data(source, DATA_MEGABYTES)
+    encrypted = os.path.join(workdir, "data.x25f")
+    decrypted = os.path.join(workdir, "data.out")
+    engine = X25519FileEncryption()
+    public_key, private_key, _ = engine.generate_keypair()
+    engine.encrypt_file(source, encrypted, public_key)
+    size = os.path.getsize(source)
+    return {
+        "encrypt": _measure(lambda: engine.encrypt_file(source, encrypted, public_key), size, repeat),
+        "decrypt": _measure(lambda: engine.decrypt_file(encrypted, decrypted, private_key), size, repeat),
+    }
+
+
+def _bench_hash(workdir, repeat):
+    source = os.path.join(workdir, "data.bin")
+    if not os.path.exists(source):
+        make_data(source, DATA_MEGABYTES)
+    size = os.path.getsize(source)
+    return {name: _measure(lambda name=name: hash_file(source, [name]), size, repeat)
+            for name in get_supported_algorithms()}
+
+
+_RUNNERS = {
+    "image_lsb": _bench_image,
+    "audio_lsb": _bench_audio,
+    "video_lsb": _bench_video,
+    "text_zwc": _bench_text,
+    "aes_pbkdf2": _bench_aes,
+    "rsa_oaep": _bench_rsa,
+    "x25519_file": _bench_x25519,
+    "hash": _bench_hash,
+}
+
+
+def load_cached_results() -> Optional[dict]:
+    """Return the last saved benchmark results, or None."""
+    try:
+        with open(BENCH_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_results(results: dict):
+    os.makedirs(os.path.dirname(BENCH_CACHE_FILE), exist_ok=True)
+    tmp_path = BENCH_CACHE_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(results, f)
+    os.replace(tmp_path, BENCH_CACHE_FILE)
+
+
+def run_benchmarks(engines: Optional[Iterable[str]] = None, repeat: int = DEFAULT_REPEAT,
+                   save: bool = True) -> dict:
+    """
+    Benchmark the selected engines (default: all) on generated data
+
+    Args:
+        engines: Engine names from ENGINES
+        repeat: Timed runs per measurement; the median is reported
+        save: Merge the results into the cached results file
+
+    Returns:
+        Machine description, timestamp and per-engine results
+    """
+    engines = list(engines or ENGINES)
+    unknown = [name for name in engines if name not in _RUNNERS]
+    if unknown:
+        raise ValueError(f"Unknown engine(s): {', '.join(unknown)}. Available: {', '.join(ENGINES)}")
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="stegocrypt-bench-") as workdir:
+        for name in engines:
+            try:
+                results[name] = _RUNNERS[name](workdir, repeat)
+            except Exception as e:
+                results[name] = {"status": "error", "message": str(e)}
+
+    report = {
+        "generated_at": datetime.utcnow().isoformat(),
+        "machine": {
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "repeat": repeat,
+        "results": results,
+    }
+    if save:
+        # Keep results for engines that were not re-run this time
+        cached = load_cached_results() or {}
+        merged = dict(cached.get("results", {}))
+        merged.update(results)
+        _save_results({**report, "results": merged})
+    return report
@@ -0,0 +1,334 @@
+"""
+Carrier capacity analysis for StegoCrypt Suite
+
+Reports how large a message each cover can hold without attempting an
+encode. Only headers are read:
+
+    image  PIL's lazy open (PNG IHDR and the like), no pixel data
+    audio  the WAV header, or ffprobe JSON for compressed formats
+    video  the AVI main header (the OpenDML dmlh frame count when present),
+           or ffprobe JSON / OpenCV container metadata
+    text   a streamed word count
+
+For each bit depth (LSB bits per sample/channel; mode for text) the
+report gives the stego payload that fits, in bytes of ciphertext, and
+the largest message that still fits after AES or RSA encryption and
+base64 encoding. The image, audio and video engines embed 1 bit per
+sample; larger depths show what a multi-bit embedder would fit.
+"""
+
+import json
+import os
+import shutil
+import struct
+import subprocess
+import wave
+from functools import partial
+from typing import Callable, Iterable, Iterator, Optional
+
+from cryptography.rsa_crypto import HYBRID_MAGIC, HYBRID_NONCE_SIZE, HYBRID_TAG_SIZE
+from cryptography.rsa_pool import DEFAULT_KEY_SIZE
+from manifest import DEFAULT_WORKERS, _run_pool, iter_tree_files
+from steganography.text_stego import (
+    BINARY_HEADER_BYTES,
+    BITS_PER_CHAR,
+    DEFAULT_SYMBOLS_PER_WORD,
+    SUPPORTED_SYMBOL_BITS,
+    TEXT_CHUNK_SIZE,
+)
+from utilities.text_utils import add_delimiter
+from validation.errors import MissingDependencyError
+
+CARRIER_EXTENSIONS = {
+    "image": {".png", ".bmp", ".tif", ".tiff", ".jpg", ".jpeg", ".webp", ".gif"},
+    "audio": {".wav", ".mp3", ".flac", ".ogg", ".m4a", ".aac"},
+    "video": {".avi", ".mp4", ".mkv", ".mov", ".webm"},
+    "text": {".txt", ".md"},
+}
+LSB_DEPTHS = (1, 2, 3, 4)
+# Payload framing of each engine
+IMAGE_DELIMITER_CHARS = len(add_delimiter(""))
+# decode_image gives up after this many characters, delimiter included
+IMAGE_DECODE_MAX_CHARS = 1000
+AUDIO_DELIMITER_CHARS = len("###")
+VIDEO_HEADER_BYTES = 4
+# encrypt_message: PBKDF2 salt + EAX nonce + tag ahead of the ciphertext
+AES_OVERHEAD_BYTES = 16 + 16 + 16
+# PKCS1_OAEP with SHA-1
+OAEP_OVERHEAD_BYTES = 2 * 20 + 2
+FFPROBE_TIMEOUT = 30
+# The AVI hdrl list is a few KB; anything larger is not trusted
+AVI_HEADER_LIMIT = 1024 * 1024
+
+
+def carrier_for_path(path: str, extensions_by_carrier: dict = CARRIER_EXTENSIONS) -> Optional[str]:
+    """Guess the carrier type from the file extension"""
+    ext = os.path.splitext(path)[1].lower()
+    for carrier, extensions in extensions_by_carrier.items():
+        if ext in extensions:
+            return carrier
+    return None
+
+
+def max_message_bytes(payload_chars: int, algorithm: str, rsa_key_bits: int = DEFAULT_KEY_SIZE) -> int:
+    """
+    Largest UTF-8 message whose base64 ciphertext fits in payload_chars
+
+    RSA messages that fit one OAEP block are encrypted directly, longer
+    ones with the hybrid RSA+AES-GCM envelope.
+    """
+    raw = max(0, payload_chars) // 4 * 3
+    if algorithm.upper() == "AES":
+        return max(0, raw - AES_OVERHEAD_BYTES)
+    if algorithm.upper() != "RSA":
+        raise ValueError(f"Unsupported encryption method: {algorithm}")
+    key_bytes = rsa_key_bits // 8
+    best = raw - (len(HYBRID_MAGIC) + 2 + key_bytes + HYBRID_NONCE_SIZE + HYBRID_TAG_SIZE)
+    if raw >= key_bytes:
+        best = max(best, key_bytes - OAEP_OVERHEAD_BYTES)
+    return max(0, best)
+
+
+def _capacity_entry(payload_chars: int, rsa_key_bits: int, **fields) -> dict:
+    payload_chars = max(0, payload_chars)
+    return {
+        **fields,
+        "payload_bytes": payload_chars,
+        "AES": max_message_bytes(payload_chars, "AES"),
+        "RSA": max_message_bytes(payload_chars, "RSA", rsa_key_bits),
+    }
+
+
+def _ffprobe(path: str) -> dict:
+    ffprobe = shutil.which("ffprobe")
+    if not ffprobe:
+        raise MissingDependencyError("ffprobe not available to read media headers")
+    result = subprocess.run(
+        [ffprobe, "-v", "error", "-print_format", "json", "-show_streams", "-show_format", path],
+        capture_output=True, timeout=FFPROBE_TIMEOUT, check=False,
+    )
+    if result.returncode != 0:
+        raise ValueError(f"ffprobe could not read {os.path.basename(path)}: "
+                         f"{result.stderr.decode('utf-8', 'replace').strip()}")
+    return json.loads(result.stdout)
+
+
+def _first_stream(info: dict, codec_type: str) -> dict:
+    for stream in info.get("streams", []):
+        if stream.get("codec_type") == codec_type:
+            return stream
+    raise ValueError(f"No {codec_type} stream found")
+
+
+def _duration(stream: dict, info: dict) -> float:
+    return float(stream.get("duration") or info.get("format", {}).get("duration") or 0)
+
+
+def _image_header(path: str) -> dict:
+    from PIL import Image
+
+    # Image.open parses the header only; pixels are decoded on first access
+    with Image.open(path) as img:
+        width, height = img.size
+        image_format = img.format
+    return {"format": image_format, "width": width, "height": height,
+            "carrier_bits": width * height * 3, "estimated": False}
+
+
+def _audio_header(path: str) -> dict:
+    if path.lower().endswith(".wav"):
+        try:
+            with wave.open(path, "rb") as song:
+                frame_bytes = song.getnframes() * song.getsampwidth() * song.getnchannels()
+                return {"format": "wav", "sample_rate": song.getframerate(), "channels": song.getnchannels(),
+                        "sample_width": song.getsampwidth(), "carrier_bits": frame_bytes, "estimated": False}
+        except wave.Error:
+            pass  # e.g. WAVE_FORMAT_EXTENSIBLE on older Pythons; ask ffprobe
+
+    info = _ffprobe(path)
+    stream = _first_stream(info, "audio")
+    # Same sample width pydub picks when encode_audio converts to WAV
+    if stream.get("sample_fmt") == "fltp" and stream.get("codec_name") in ("mp3", "mp4", "aac", "webm", "ogg"):
+        sample_bits = 16
+    else:
+        sample_bits = int(stream.get("bits_per_sample") or stream.get("bits_per_raw_sample") or 16)
+    rate, channels = int(stream.get("sample_rate") or 0), int(stream.get("channels") or 0)
+    frames = int(_duration(stream, info) * rate)
+    return {"format": stream.get("codec_name"), "sample_rate": rate, "channels": channels,
+            "sample_width": sample_bits // 8, "carrier_bits": frames * channels * (sample_bits // 8),
+            "estimated": True}
+
+
+def _riff_chunks(data: bytes, start: int, end: int) -> Iterator[tuple]:
+    """Yield (chunk id, data offset, size) for the RIFF chunks in data[start:end]"""
+    while start + 8 <= end:
+        chunk_id, size = struct.unpack_from("<4sI", data, start)
+        yield chunk_id, start + 8, size
+        start += 8 + size + (size & 1)
+
+
+def _avi_header(path: str) -> Optional[dict]:
+    # RIFF 'AVI ' LIST 'hdrl' 'avih' <size> MainAVIHeader ... [LIST 'odml' 'dmlh']
+    with open(path, "rb") as f:
+        head = f.read(72)
+        if len(head) < 72 or head[:4] != b"RIFF" or head[8:12] != b"AVI " or head[24:28] != b"avih":
+            return None
+        riff_size, hdrl_size = struct.unpack_from("<I", head, 4)[0], struct.unpack_from("<I", head, 16)[0]
+        f.seek(12)
+        hdrl = f.read(8 + min(hdrl_size, AVI_HEADER_LIMIT))
+        file_size = os.fstat(f.fileno()).st_size
+    fields = struct.unpack("<10I", head[32:72])
+    frames, width, height = fields[4], fields[8], fields[9]
+
+    # avih counts only the frames of the first RIFF segment; an OpenDML
+    # file carries its total in dmlh, and one without it is estimated
+    extended = None
+    for chunk_id, offset, size in _riff_chunks(hdrl, 12, len(hdrl)):
+        if chunk_id == b"LIST" and hdrl[offset:offset + 4] == b"odml":
+            for inner_id, inner_offset, inner_size in _riff_chunks(hdrl, offset + 4, offset + size):
+                if inner_id == b"dmlh" and inner_size >= 4 and inner_offset + 4 <= len(hdrl):
+                    extended = struct.unpack_from("<I", hdrl, inner_offset)[0]
+    if extended:
+        frames = extended
+    if not (frames and width and height):
+        return None
+    return {"format": "avi", "width": width, "height": height, "frames": frames,
+            "estimated": extended is None and file_size > riff_size + 8}
+
+
+def _video_header(path: str) -> dict:
+    header = _avi_header(path) if path.lower().endswith(".avi") else None
+    estimated = header is None or header.pop("estimated")
+    if header is None and shutil.which("ffprobe"):
+        info = _ffprobe(path)
+        stream = _first_stream(info, "video")
+        frames = int(stream.get("nb_frames") or 0)
+        if not frames:
+            num, _, den = (stream.get("avg_frame_rate") or "0/1").partition("/")
+            fps = float(num) / float(den or 1) if float(den or 1) else 0.0
+            frames = int(_duration(stream, info) * fps)
+        header = {"format": info.get("format", {}).get("format_name"),
+                  "width": int(stream.get("width") or 0), "height": int(stream.get("height") or 0),
+                  "frames": frames}
+    if header is None:
+        # Container metadata through OpenCV; no frames are decoded
+        try:
+            import cv2
+        except ImportError as exc:
+            raise MissingDependencyError("ffprobe or OpenCV is required to read video headers") from exc
+        cap = cv2.VideoCapture(path)
+        try:
+            if not cap.isOpened():
+                raise IOError("Unable to open video.")
+            header = {"format": os.path.splitext(path)[1].lstrip(".").lower(),
+                      "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                      "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                      "frames": int(cap.get(cv2.CAP_PROP_FRAME_COUNT))}
+        finally:
+            cap.release()
+    header["carrier_bits"] = max(0, header["frames"]) * header["width"] * header["height"] * 3
+    header["estimated"] = estimated
+    return header
+
+
+def count_words(path: str, chunk_size: int = TEXT_CHUNK_SIZE) -> int:
+    """Count whitespace-separated words, reading the file in chunks"""
+    words = 0
+    in_word = False
+    with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+        for chunk in iter(partial(f.read, chunk_size), ""):
+            words += len(chunk.split())
+            # A word split across the chunk boundary was counted twice
+            if in_word and not chunk[0].isspace():
+                words -= 1
+            in_word = not chunk[-1].isspace()
+    return words
+
+
+def analyze_carrier(path: str, carrier: Optional[str] = None, rsa_key_bits: int = DEFAULT_KEY_SIZE) -> dict:
+    """
+    Capacity of one cover file, from its headers only
+
+    Args:
+        path: Cover file
+        carrier: image, audio, video or text (default: from the extension)
+        rsa_key_bits: RSA key size assumed for the RSA column
+
+    Returns:
+        Header facts plus a "capacity" list with one entry per bit depth
+        (text: per mode), each giving payload_bytes and the largest AES
+        and RSA message in bytes
+    """
+    carrier = carrier or carrier_for_path(path)
+    if carrier is None:
+        raise ValueError(f"Cannot tell the carrier type of {os.path.basename(path)}; pass a carrier")
+
+    if carrier == "text":
+        words = count_words(path)
+        capacity = [_capacity_entry(words - 1, rsa_key_bits, mode="legacy", bits_per_word=BITS_PER_CHAR)]
+        for bits in SUPPORTED_SYMBOL_BITS:
+            symbols = words * DEFAULT_SYMBOLS_PER_WORD
+            capacity.append(_capacity_entry((symbols - 1) * bits // 8 - BINARY_HEADER_BYTES, rsa_key_bits,
+                                            mode="binary", bits_per_symbol=bits,
+                                            bits_per_word=bits * DEFAULT_SYMBOLS_PER_WORD))
+        return {"carrier": carrier, "words": words, "estimated": False, "capacity": capacity}
+
+    if carrier == "image":
+        header = _image_header(path)
+        payload = lambda bits: min(bits // 8, IMAGE_DECODE_MAX_CHARS) - IMAGE_DELIMITER_CHARS
+    elif carrier == "audio":
+        header = _audio_header(path)
+        payload = lambda bits: bits // 8 - AUDIO_DELIMITER_CHARS
+    elif carrier == "video":
+        header = _video_header(path)
+        payload = lambda bits: bits // 8 - VIDEO_HEADER_BYTES
+    else:
+        raise ValueError(f"Unsupported carrier: {carrier}")
+
+    header["capacity"] = [_capacity_entry(payload(header["carrier_bits"] * depth), rsa_key_bits, lsb_bits=depth)
+                          for depth in LSB_DEPTHS]
+    return {"carrier": carrier, **header}
+
+
+def iter_carrier_files(paths: Iterable[str], carrier: Optional[str] = None,
+                       extensions_by_carrier: dict = CARRIER_EXTENSIONS) -> Iterator[str]:
+    """Yield named files as-is and, from directories, files with a carrier extension"""
+    for path in paths:
+        if os.path.isdir(path):
+            for rel_path in iter_tree_files(path):
+                full = os.path.join(path, rel_path)
+                found = carrier_for_path(full, extensions_by_carrier)
+                if found and (carrier is None or found == carrier):
+                    yield full
+        else:
+            yield path
+
+
+def scan_capacity(paths: Iterable[str], carrier: Optional[str] = None, workers: int = DEFAULT_WORKERS,
+                  rsa_key_bits: int = DEFAULT_KEY_SIZE,
+                  progress: Optional[Callable[[dict], None]] = None) -> dict:
+    """
+    Analyze files and directory trees of covers concurrently
+
+    Directories are walked for files with a known carrier extension
+    (of the given carrier only, if one is passed); files named directly
+    are always analyzed. Each result is reported through progress.
+
+    Returns:
+        Summary with file and error counts
+    """
+    summary = {"files": 0, "errors": 0}
+
+    def on_result(path, future):
+        try:
+            record = {"type": "carrier", "path": path, **future.result()}
+            summary["files"] += 1
+        except Exception as e:
+            summary["errors"] += 1
+            record = {"type": "error", "path": path, "message": str(e)}
+        if progress:
+            progress(record)
+
+    _run_pool(iter_carrier_files(paths, carrier), partial(analyze_carrier, carrier=carrier, rsa_key_bits=rsa_key_bits),
+              on_result, workers)
+    return summary
@@ -10,6 +10,7 @@ if BACKEND_DIR not in sys.path:
     sys.path.insert(0, BACKEND_DIR)
 
 from validation.inputs import non_empty_string
+from cryptography.key_cache import derive_key, PBKDF2_ITERATIONS, AES_KEY_LENGTH
 
 # Store keys in user's home directory for better security
 KEY_DIR = Path.home() / ".stegocrypt_keys"
@@ -18,11 +19,17 @@ KEY_DIR.mkdir(exist_ok=True)
 AES_KEY_FILE = KEY_DIR / "aes_key.bin"
 AES_SALT_FILE = KEY_DIR / "aes_salt.bin"
 
-def get_key_from_password(password):
-    """Derive AES key from password using PBKDF2"""
-    salt = get_random_bytes(16)
-    key = PBKDF2(password.encode(), salt, dkLen=16, count=100000)
-    return key, salt
+def get_key_from_password(password, salt=None):
+    """
+    Derive AES key from password using PBKDF2.
+    A fresh random salt is used unless one is supplied; keys for a fixed
+    salt are served from the in-process derived key cache.
+    """
+    if salt is None:
+        salt = get_random_bytes(16)
+        key = PBKDF2(password.encode(), salt, dkLen=AES_KEY_LENGTH, count=PBKDF2_ITERATIONS)
+        return key, salt
+    return derive_key(password, salt), salt
 
 def save_aes_key(key, salt):
     """Save AES key and salt to files"""
@@ -0,0 +1,98 @@
+"""
+In-process cache of PBKDF2-derived AES keys.
+
+Deriving a key costs 100,000 PBKDF2 iterations, which dominates batch jobs
+that decode many payloads sharing one password and salt. Entries are indexed
+by an HMAC of the password under a per-process random key, so the password
+itself is never held by the cache. The derived keys are ordinary bytes, as
+PBKDF2 returns them and AES takes them: eviction only drops the cache's
+reference, it does not scrub the key from memory.
+"""
+
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from Crypto.Protocol.KDF import PBKDF2
+
+PBKDF2_ITERATIONS = 100000
+AES_KEY_LENGTH = 16
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_TTL_SECONDS = 300
+
+
+class DerivedKeyCache:
+    """Bounded LRU cache of derived keys with a time-to-live"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._index_key = os.urandom(32)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _index(self, password: str, salt: bytes, dk_len: int, count: int):
+        tag = hmac.new(self._index_key, password.encode(), hashlib.sha256).digest()
+        return tag, bytes(salt), dk_len, count
+
+    def derive(self, password: str, salt: bytes, dk_len: int = AES_KEY_LENGTH,
+               count: int = PBKDF2_ITERATIONS) -> bytes:
+        """Return the PBKDF2 key for (password, salt), deriving it on a miss"""
+        index = self._index(password, salt, dk_len, count)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(index)
+            if entry is not None:
+                expires_at, key = entry
+                if expires_at > now:
+                    self._entries.move_to_end(index)
+                    self.hits += 1
+                    return key
+                del self._entries[index]
+            self.misses += 1
+
+        # Derive outside the lock so concurrent misses on other keys don't serialize
+        derived = PBKDF2(password.encode(), salt, dkLen=dk_len, count=count)
+
+        if self.max_entries > 0:
+            with self._lock:
+                self._entries[index] = (now + self.ttl_seconds, derived)
+                self._entries.move_to_end(index)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return derived
+
+    def clear(self):
+        """Drop every cached key"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_default_cache = DerivedKeyCache()
+
+
+def get_key_cache() -> DerivedKeyCache:
+    """Return the process-wide derived key cache"""
+    return _default_cache
+
+
+def derive_key(password: str, salt: bytes) -> bytes:
+    """Derive an AES key from a password and a fixed salt through the shared cache"""
+    return _default_cache.derive(password, salt)
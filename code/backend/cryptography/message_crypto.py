@@ -0,0 +1,103 @@
+"""
+Message encryption for StegoCrypt Suite
+
+AES (password-based, salted PBKDF2 key) and RSA (hybrid OAEP payload)
+encryption of text messages to base64, shared by the CLI, the batch
+runner and the asyncio facade.
+"""
+
+import base64
+import os
+import sys
+from typing import Optional
+
+# Ensure Backend is on sys.path for local script execution
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from cryptography.aes_crypto import encrypt_aes, decrypt_aes, get_key_from_password
+from cryptography.rsa_crypto import encrypt_rsa_payload, decrypt_rsa_payload, load_keys
+from utilities.timing import phase, record_size
+from validation.inputs import non_empty_string
+
+
+def encrypt_message(message: str, method: str, password: Optional[str] = None,
+                    salt: Optional[bytes] = None) -> str:
+    """
+    Encrypt message using specified method.
+    For AES, passing a fixed salt lets repeated calls reuse the cached derived key.
+    """
+    try:
+        non_empty_string(message, "message")
+        non_empty_string(method, "method")
+
+        record_size("payload_bytes", len(message.encode('utf-8')))
+        if method.upper() == "AES":
+            if not password:
+                raise ValueError("Password is required for AES encryption")
+            with phase("kdf"):
+                key, salt = get_key_from_password(password, salt)
+            with phase("encrypt"):
+                encrypted_data = encrypt_aes(key, message)
+            payload = salt + encrypted_data
+            # return encrypted_data
+            return base64.b64encode(payload).decode('utf-8')
+
+        elif method.upper() == "RSA":
+            with phase("load_keys"):
+                _, public_key = load_keys()
+            with phase("encrypt"):
+                encrypted_data = encrypt_rsa_payload(public_key, message)
+            return base64.b64encode(encrypted_data).decode('utf-8')
+
+        else:
+            raise ValueError(f"Unsupported encryption method: {method}")
+
+    except Exception as e:
+        raise Exception(f"Encryption failed: {str(e)}")
+
+
+def decrypt_message(ciphertext: str, method: str, password: Optional[str] = None) -> str:
+    """Decrypt message using specified method"""
+    try:
+        non_empty_string(ciphertext, "ciphertext")
+        non_empty_string(method, "method")
+        
+        encrypted_data = base64.b64decode(ciphertext)
+
+        if method.upper() == "AES":
+            if not password:
+                raise ValueError("Password is required for AES decryption")
+            try:
+                if len(encrypted_data) >= 48:
+                    salt = encrypted_data[:16]
+                    body = encrypted_data[16:]
+                    with phase("kdf"):
+                        key, _ = get_key_from_password(password, salt)
+                    with phase("decrypt"):
+                        return decrypt_aes(key, body)
+                else:
+                    with phase("kdf"):
+                        key, _ = get_key_from_password(password)
+                    with phase("decrypt"):
+                        return decrypt_aes(key, encrypted_data)
+            except Exception:
+                with phase("kdf"):
+                    key, _ = get_key_from_password(password)
+                with phase("decrypt"):
+                    return decrypt_aes(key, encrypted_data)
+
+        elif method.upper() == "RSA":
+            with phase("load_keys"):
+                private_key, _ = load_keys()
+            if not private_key:
+                raise ValueError("RSA private key not found. Cannot decrypt.")
+            with phase("decrypt"):
+                return decrypt_rsa_payload(private_key, encrypted_data)
+
+        else:
+            raise ValueError(f"Unsupported decryption method: {method}")
+
+    except Exception as e:
+        raise Exception(f"Decryption failed: {str(e)}")
@@ -1,10 +1,14 @@
 import os
 import sys
 import shutil
+import struct
+import threading
 from pathlib import Path
 from typing import Optional
 from Crypto.PublicKey import RSA
-from Crypto.Cipher import PKCS1_OAEP
+from Crypto.Cipher import AES, PKCS1_OAEP
+from Crypto.Hash import SHA1
+from Crypto.Random import get_random_bytes
 
 # Ensure Backend is on sys.path for local script execution
 BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -12,6 +16,12 @@ if BACKEND_DIR not in sys.path:
     sys.path.insert(0, BACKEND_DIR)
 
 from validation.inputs import non_empty_string
+from cryptography.rsa_pool import (
+    DEFAULT_KEY_SIZE,
+    validate_key_size,
+    take_key,
+    start_background_fill,
+)
 
 # Store keys in user's home directory for better security
 KEY_DIR = Path.home() / ".stegocrypt_keys"
@@ -20,13 +30,81 @@ KEY_DIR.mkdir(exist_ok=True)
 PRIVATE_KEY_FILE = KEY_DIR / "private_rsa.pem"
 PUBLIC_KEY_FILE = KEY_DIR / "public_rsa.pem"
 
-def generate_rsa_keys(output_dir: Optional[str] = None):
+# Hybrid envelope: MAGIC | wrapped key length (>H) | RSA-OAEP(data key) | GCM nonce | GCM tag | ciphertext
+HYBRID_MAGIC = b"SCH1"
+HYBRID_DATA_KEY_SIZE = 32
+HYBRID_NONCE_SIZE = 12
+HYBRID_TAG_SIZE = 16
+
+
+class RSAKeyStore:
+    """
+    Process-wide cache of parsed RSA keys.
+    Importing a PEM also precomputes the CRT parameters (p, q, dP, dQ, qInv),
+    so keeping the RsaKey object avoids paying for both on every call. An
+    entry is reloaded when the file's mtime or size changes.
+    """
+
+    def __init__(self):
+        self._keys = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path) -> RSA.RsaKey:
+        """Return the parsed key stored at path, importing it only if the file changed"""
+        path = str(path)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._keys.get(path)
+            if entry is not None and entry[0] == stamp:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        with open(path, 'rb') as f:
+            key = RSA.import_key(f.read())
+
+        with self._lock:
+            self._keys[path] = (stamp, key)
+        return key
+
+    def invalidate(self, path=None):
+        """Drop one cached key, or all of them when path is None"""
+        with self._lock:
+            if path is None:
+                self._keys.clear()
+            else:
+                self._keys.pop(str(path), None)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the number of cached keys"""
+        with self._lock:
+            return {"entries": len(self._keys), "hits": self.hits, "misses": self.misses}
+
+
+_key_store = RSAKeyStore()
+
+def get_key_store() -> RSAKeyStore:
+    """Return the process-wide RSA key store"""
+    return _key_store
+
+def generate_rsa_keys(output_dir: Optional[str] = None, bits: int = DEFAULT_KEY_SIZE):
     """
     Generates a new RSA key pair.
     If output_dir is provided, saves keys to that directory.
     Otherwise, saves to the default location.
+    A pre-generated key is taken from the key pool when one is available,
+    and the pool is then topped up in the background.
     """
-    key = RSA.generate(2048)
+    validate_key_size(bits)
+    key = take_key(bits)
+    if key is not None:
+        start_background_fill(bits)
+    else:
+        key = RSA.generate(bits)
     private_key_pem = key.export_key()
     public_key_pem = key.publickey().export_key()
 
@@ -50,22 +128,22 @@ def generate_rsa_keys(output_dir: Optional[str] = None):
             f.write(private_key_pem)
         with open(PUBLIC_KEY_FILE, 'wb') as f:
             f.write(public_key_pem)
-            
+
+    # Rewrites within the same mtime tick would otherwise go unnoticed
+    _key_store.invalidate()
     return private_key_path, public_key_path
 
 def load_keys():
-    """Loads RSA keys from the default location, generating them if they don't exist."""
-    try:
-        if not PRIVATE_KEY_FILE.exists() or not PUBLIC_KEY_FILE.exists():
-            generate_rsa_keys()
-        
-        with open(PRIVATE_KEY_FILE, 'rb') as f:
-            private_key = RSA.import_key(f.read())
-        with open(PUBLIC_KEY_FILE, 'rb') as f:
-            public_key = RSA.import_key(f.read())
-        return private_key, public_key
-    except Exception as e:
-        raise e
+    """
+    Loads RSA keys from the default location, generating them if they don't exist.
+    Parsed keys are served from the process-wide key store.
+    """
+    if not PRIVATE_KEY_FILE.exists() or not PUBLIC_KEY_FILE.exists():
+        generate_rsa_keys()
+
+    private_key = _key_store.get(PRIVATE_KEY_FILE)
+    public_key = _key_store.get(PUBLIC_KEY_FILE)
+    return private_key, public_key
 
 def encrypt_with_rsa(public_key, message: str) -> bytes:
     """Encrypt plaintext string using the public key and return raw bytes."""
@@ -79,6 +157,62 @@ def decrypt_with_rsa(private_key, ciphertext: bytes) -> str:
     cipher = PKCS1_OAEP.new(private_key)
     return cipher.decrypt(ciphertext).decode('utf-8')
 
+def max_oaep_message_size(key) -> int:
+    """Largest plaintext (in bytes) a single PKCS1_OAEP block can hold for this key."""
+    return key.size_in_bytes() - 2 * SHA1.digest_size - 2
+
+def encrypt_hybrid(public_key, data: bytes) -> bytes:
+    """
+    Encrypt data of any length: a random AES-256-GCM data key encrypts the
+    payload and is itself wrapped once with RSA-OAEP.
+    """
+    data_key = get_random_bytes(HYBRID_DATA_KEY_SIZE)
+    wrapped_key = PKCS1_OAEP.new(public_key).encrypt(data_key)
+    header = HYBRID_MAGIC + struct.pack(">H", len(wrapped_key)) + wrapped_key
+
+    nonce = get_random_bytes(HYBRID_NONCE_SIZE)
+    cipher = AES.new(data_key, AES.MODE_GCM, nonce=nonce)
+    cipher.update(header)
+    ciphertext, tag = cipher.encrypt_and_digest(data)
+    return header + nonce + tag + ciphertext
+
+def decrypt_hybrid(private_key, envelope: bytes) -> bytes:
+    """Decrypt an envelope produced by encrypt_hybrid and return the raw payload."""
+    if envelope[:len(HYBRID_MAGIC)] != HYBRID_MAGIC:
+        raise ValueError("Not a hybrid RSA envelope")
+    offset = len(HYBRID_MAGIC)
+    (wrapped_len,) = struct.unpack(">H", envelope[offset:offset + 2])
+    offset += 2
+    header_end = offset + wrapped_len
+    if len(envelope) < header_end + HYBRID_NONCE_SIZE + HYBRID_TAG_SIZE:
+        raise ValueError("Truncated hybrid RSA envelope")
+
+    data_key = PKCS1_OAEP.new(private_key).decrypt(envelope[offset:header_end])
+    nonce = envelope[header_end:header_end + HYBRID_NONCE_SIZE]
+    tag = envelope[header_end + HYBRID_NONCE_SIZE:header_end + HYBRID_NONCE_SIZE + HYBRID_TAG_SIZE]
+    ciphertext = envelope[header_end + HYBRID_NONCE_SIZE + HYBRID_TAG_SIZE:]
+
+    cipher = AES.new(data_key, AES.MODE_GCM, nonce=nonce)
+    cipher.update(envelope[:header_end])
+    return cipher.decrypt_and_verify(ciphertext, tag)
+
+def encrypt_rsa_payload(public_key, message: str) -> bytes:
+    """
+    Encrypt a message with RSA, using a single OAEP block when it fits and
+    the hybrid RSA+AES envelope otherwise.
+    """
+    non_empty_string(message, "message")
+    data = message.encode('utf-8')
+    if len(data) <= max_oaep_message_size(public_key):
+        return PKCS1_OAEP.new(public_key).encrypt(data)
+    return encrypt_hybrid(public_key, data)
+
+def decrypt_rsa_payload(private_key, ciphertext: bytes) -> str:
+    """Decrypt output of encrypt_rsa_payload (plain OAEP block or hybrid envelope)."""
+    if len(ciphertext) == private_key.size_in_bytes():
+        return decrypt_with_rsa(private_key, ciphertext)
+    return decrypt_hybrid(private_key, ciphertext).decode('utf-8')
+
 def import_keys(pub_file: str, priv_file: str):
     """Imports RSA keys from the specified files."""
     pub_path = Path(pub_file).resolve()
@@ -94,6 +228,8 @@ def import_keys(pub_file: str, priv_file: str):
     if priv_path != PRIVATE_KEY_FILE.resolve():
         shutil.copyfile(priv_path, PRIVATE_KEY_FILE)
 
+    _key_store.invalidate()
+
 def export_keys(output_dir: str):
     """Exports the current RSA keys to the specified directory."""
     output_path = Path(output_dir)
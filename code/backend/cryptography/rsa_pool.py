@@ -0,0 +1,183 @@
+"""
+Pre-generated RSA key pool.
+
+RSA.generate has to search for large primes and can take seconds (much longer
+for 3072/4096-bit keys). The pool keeps a few key pairs ready on disk so that
+key generation and first-use paths can take one instantly. Pooled keys are
+stored as encrypted PKCS#8 under a random pool secret, and are refilled by a
+detached background process.
+
+The pool secret is kept outside the key directory (in STEGOCRYPT_SECRET_DIR,
+default ~/.config/stegocrypt), readable by the owner only, so a copy or
+backup of the key directory alone does not expose pooled keys. It is not a
+password: anyone who can read files as the same user can decrypt them.
+
+The pool is opt-in: it is only consulted once its directory exists, which
+`fill_pool` (the `rsa pool-fill` CLI command) creates.
+"""
+
+import argparse
+import os
+import secrets
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from Crypto.PublicKey import RSA
+
+KEY_DIR = Path.home() / ".stegocrypt_keys"
+KEY_DIR.mkdir(exist_ok=True)
+
+POOL_DIR = KEY_DIR / "pool"
+SECRET_DIR = Path(os.environ.get("STEGOCRYPT_SECRET_DIR") or Path.home() / ".config" / "stegocrypt")
+POOL_SECRET_FILE = SECRET_DIR / "pool_secret.bin"
+# Earlier releases kept the secret next to the keys it protects
+LEGACY_POOL_SECRET_FILE = KEY_DIR / "pool_secret.bin"
+
+SUPPORTED_KEY_SIZES = (2048, 3072, 4096)
+DEFAULT_KEY_SIZE = 2048
+DEFAULT_POOL_TARGET = 2
+FILL_LOCK_STALE_SECONDS = 3600
+KEY_PROTECTION = "PBKDF2WithHMAC-SHA1AndAES256-CBC"
+
+
+def validate_key_size(bits: int) -> int:
+    if bits not in SUPPORTED_KEY_SIZES:
+        raise ValueError(f"Unsupported RSA key size: {bits}. Choose one of {SUPPORTED_KEY_SIZES}")
+    return bits
+
+def is_pool_enabled() -> bool:
+    """The pool is used only after it has been set up with fill_pool."""
+    return POOL_DIR.is_dir()
+
+def _pool_subdir(bits: int) -> Path:
+    return POOL_DIR / str(validate_key_size(bits))
+
+def _pool_secret() -> str:
+    """Load (or create) the owner-only secret that pooled keys are encrypted under."""
+    if not POOL_SECRET_FILE.exists():
+        POOL_SECRET_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(POOL_SECRET_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(secrets.token_bytes(32))
+        # Keys pooled under the old secret are discarded by take_key
+        LEGACY_POOL_SECRET_FILE.unlink(missing_ok=True)
+    if os.name != "nt" and POOL_SECRET_FILE.stat().st_mode & 0o077:
+        os.chmod(POOL_SECRET_FILE, 0o600)
+    with open(POOL_SECRET_FILE, 'rb') as f:
+        return f.read().hex()
+
+def _ready_keys(bits: int) -> list:
+    subdir = _pool_subdir(bits)
+    if not subdir.is_dir():
+        return []
+    return sorted(subdir.glob("*.pem"))
+
+def pool_size(bits: int = DEFAULT_KEY_SIZE) -> int:
+    """Number of ready key pairs of the given size."""
+    return len(_ready_keys(bits))
+
+def pool_status() -> dict:
+    """Ready key counts per supported size."""
+    return {
+        "enabled": is_pool_enabled(),
+        "keys": {str(bits): pool_size(bits) for bits in SUPPORTED_KEY_SIZES},
+    }
+
+def _add_key(bits: int, secret: str):
+    """Generate one key pair and publish it atomically into the pool."""
+    subdir = _pool_subdir(bits)
+    subdir.mkdir(parents=True, exist_ok=True)
+    key = RSA.generate(bits)
+    pem = key.export_key(passphrase=secret, pkcs=8, protection=KEY_PROTECTION)
+
+    name = secrets.token_hex(8)
+    tmp_path = subdir / f"{name}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(pem)
+    os.replace(tmp_path, subdir / f"{name}.pem")
+
+def fill_pool(bits: int = DEFAULT_KEY_SIZE, target: int = DEFAULT_POOL_TARGET) -> int:
+    """
+    Generate key pairs until the pool holds `target` keys of the given size.
+    Returns the number of keys generated. Concurrent fills of the same size
+    are serialized with a lock file; a second filler returns immediately.
+    """
+    subdir = _pool_subdir(bits)
+    subdir.mkdir(parents=True, exist_ok=True)
+    lock_path = subdir / ".filling"
+
+    if lock_path.exists() and time.time() - lock_path.stat().st_mtime > FILL_LOCK_STALE_SECONDS:
+        lock_path.unlink(missing_ok=True)
+    try:
+        fd = os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+    except FileExistsError:
+        return 0
+    os.close(fd)
+
+    generated = 0
+    try:
+        secret = _pool_secret()
+        while pool_size(bits) < target:
+            _add_key(bits, secret)
+            generated += 1
+    finally:
+        lock_path.unlink(missing_ok=True)
+    return generated
+
+def start_background_fill(bits: int = DEFAULT_KEY_SIZE, target: int = DEFAULT_POOL_TARGET):
+    """Refill the pool in a detached process so the caller never waits on prime search."""
+    validate_key_size(bits)
+    cmd = [sys.executable, os.path.abspath(__file__), "--bits", str(bits), "--target", str(target)]
+    kwargs = {
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+    }
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    subprocess.Popen(cmd, **kwargs)
+
+def take_key(bits: int = DEFAULT_KEY_SIZE) -> Optional[RSA.RsaKey]:
+    """
+    Remove one key pair from the pool and return it, or None when the pool
+    is disabled or empty. Each key is claimed by an atomic rename, so two
+    processes never receive the same key.
+    """
+    if not is_pool_enabled():
+        return None
+
+    secret = None
+    for path in _ready_keys(bits):
+        claimed = path.with_suffix(f".claimed-{os.getpid()}")
+        try:
+            os.replace(path, claimed)
+        except FileNotFoundError:
+            continue
+        try:
+            if secret is None:
+                secret = _pool_secret()
+            with open(claimed, 'rb') as f:
+                return RSA.import_key(f.read(), passphrase=secret)
+        except (ValueError, IndexError, TypeError):
+            # Unreadable entry (e.g. pool secret was replaced); discard it
+            continue
+        finally:
+            claimed.unlink(missing_ok=True)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill the StegoCrypt RSA key pool")
+    parser.add_argument("--bits", type=int, default=DEFAULT_KEY_SIZE, choices=SUPPORTED_KEY_SIZES)
+    parser.add_argument("--target", type=int, default=DEFAULT_POOL_TARGET)
+    args = parser.parse_args()
+    fill_pool(args.bits, args.target)
+
+if __name__ == "__main__":
+    main()
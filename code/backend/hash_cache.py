@@ -0,0 +1,244 @@
+"""
+Persistent content hash cache for StegoCrypt Suite
+
+Maps (device, inode, size, mtime_ns, algorithm) to a digest in a SQLite
+database stored next to the logs directory, so unchanged files are not
+re-read. A row is keyed by (device, inode, algorithm) and is considered
+stale as soon as the file's size or mtime differs from what was recorded.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+
+from hashing import hash_file, normalize_algorithm
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "cache")
+CACHE_FILE = os.path.join(CACHE_DIR, "hash_cache.sqlite3")
+DEFAULT_MAX_ENTRIES = 100000
+# Pending changes written per transaction
+FLUSH_EVERY = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_digests (
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (device, inode, algorithm)
+);
+CREATE INDEX IF NOT EXISTS idx_file_digests_last_used ON file_digests (last_used);
+CREATE TABLE IF NOT EXISTS cache_counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_counters (name, value) VALUES ('hits', 0), ('misses', 0);
+"""
+
+
+def _file_identity(st: os.stat_result) -> tuple:
+    return st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns
+
+
+class HashCache:
+    """
+    SQLite-backed digest cache with LRU eviction and hit/miss counters
+
+    Lookups only read the database. New digests, last-use times and
+    counters are kept in memory and written in one transaction every
+    FLUSH_EVERY changes, on flush() and at exit, so a tree walk does not
+    pay for a commit per file.
+    """
+
+    def __init__(self, db_path: str = CACHE_FILE, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 flush_every: int = FLUSH_EVERY):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        # Running row count, so storing does not need COUNT(*)
+        (self._rows,) = self._conn.execute("SELECT COUNT(*) FROM file_digests").fetchone()
+        # (device, inode, algorithm) -> (size, mtime_ns, digest, last_used, is_new_row)
+        self._pending_rows = {}
+        # (device, inode, algorithm) -> last_used, for hits on stored rows
+        self._pending_used = {}
+        self._pending_hits = 0
+        self._pending_misses = 0
+
+    def _lookup(self, identity: tuple, algorithm: str):
+        """Return (digest or None, whether a row exists for the key)"""
+        device, inode, size, mtime_ns = identity
+        key = (device, inode, algorithm)
+        pending = self._pending_rows.get(key)
+        if pending is not None:
+            row = pending[:3]
+        else:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, digest FROM file_digests WHERE device = ? AND inode = ? AND algorithm = ?",
+                key,
+            ).fetchone()
+        if row is None or (row[0], row[1]) != (size, mtime_ns):
+            return None, row is not None
+        if pending is not None:
+            self._pending_rows[key] = (*pending[:3], time.time(), pending[4])
+        else:
+            self._pending_used[key] = time.time()
+        return row[2], True
+
+    def _pending_count(self) -> int:
+        return len(self._pending_rows) + len(self._pending_used) + self._pending_hits + self._pending_misses
+
+    def _flush_locked(self):
+        if not self._pending_count():
+            return
+        with self._conn:
+            if self._pending_rows:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO file_digests (device, inode, algorithm, size, mtime_ns, digest, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(*key, *value[:4]) for key, value in self._pending_rows.items()],
+                )
+                self._rows += sum(1 for value in self._pending_rows.values() if value[4])
+            if self._pending_used:
+                self._conn.executemany(
+                    "UPDATE file_digests SET last_used = ? WHERE device = ? AND inode = ? AND algorithm = ?",
+                    [(used, *key) for key, used in self._pending_used.items()],
+                )
+            self._conn.executemany(
+                "UPDATE cache_counters SET value = value + ? WHERE name = ?",
+                [(self._pending_hits, "hits"), (self._pending_misses, "misses")],
+            )
+            if self._rows > self.max_entries:
+                self._evict()
+        self._pending_rows.clear()
+        self._pending_used.clear()
+        self._pending_hits = self._pending_misses = 0
+
+    def _evict(self):
+        # Other processes may have added rows too; recount only when over the cap
+        (self._rows,) = self._conn.execute("SELECT COUNT(*) FROM file_digests").fetchone()
+        excess = self._rows - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM file_digests WHERE rowid IN "
+                "(SELECT rowid FROM file_digests ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            self._rows -= excess
+
+    def flush(self):
+        """Write pending digests, last-use times and counters in one transaction"""
+        with self._lock:
+            self._flush_locked()
+
+    def get_file_digests(self, path: str, algorithms=("sha256",)) -> dict:
+        """
+        Return digests for a file, hashing it (once, for all missing
+        algorithms) only when no fresh cache entry exists
+        """
+        if isinstance(algorithms, str):
+            algorithms = [algorithms]
+        names = list(dict.fromkeys(normalize_algorithm(a) for a in algorithms))
+        identity = _file_identity(os.stat(path))
+
+        with self._lock:
+            digests = {}
+            existing = set()
+            for name in names:
+                digest, exists = self._lookup(identity, name)
+                if exists:
+                    existing.add(name)
+                if digest is not None:
+                    digests[name] = digest
+            missing = [name for name in names if name not in digests]
+            hits = len(names) - len(missing)
+            self.hits += hits
+            self.misses += len(missing)
+            self._pending_hits += hits
+            self._pending_misses += len(missing)
+
+        if missing:
+            fresh = hash_file(path, missing)
+            # Only record the digests if the file did not change while it was read
+            if _file_identity(os.stat(path)) == identity:
+                device, inode, size, mtime_ns = identity
+                now = time.time()
+                with self._lock:
+                    for name, digest in fresh.items():
+                        self._pending_rows[(device, inode, name)] = (size, mtime_ns, digest, now,
+                                                                     name not in existing)
+            digests.update(fresh)
+
+        with self._lock:
+            if self._pending_count() >= self.flush_every:
+                self._flush_locked()
+
+        return {name: digests[name] for name in names}
+
+    def get_file_digest(self, path: str, algorithm: str = "sha256") -> str:
+        """Return a single digest for a file through the cache"""
+        return next(iter(self.get_file_digests(path, [algorithm]).values()))
+
+    def invalidate(self, path: str = None):
+        """Forget cached digests for one file, or for every file when path is None"""
+        with self._lock:
+            self._flush_locked()
+            if path is None:
+                self._conn.execute("DELETE FROM file_digests")
+                self._conn.execute("UPDATE cache_counters SET value = 0")
+            else:
+                st = os.stat(path)
+                self._conn.execute(
+                    "DELETE FROM file_digests WHERE device = ? AND inode = ?", (st.st_dev, st.st_ino)
+                )
+            self._conn.commit()
+            (self._rows,) = self._conn.execute("SELECT COUNT(*) FROM file_digests").fetchone()
+
+    def stats(self) -> dict:
+        """
+        Return the number of cached digests and hit/miss counters, both for
+        this process and accumulated across all processes using the cache
+        """
+        with self._lock:
+            self._flush_locked()
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM file_digests").fetchone()
+            totals = dict(self._conn.execute("SELECT name, value FROM cache_counters").fetchall())
+            return {
+                "entries": count,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "total_hits": totals.get("hits", 0),
+                "total_misses": totals.get("misses", 0),
+            }
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_hash_cache() -> HashCache:
+    """Return the process-wide hash cache, opening it on first use"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = HashCache()
+            atexit.register(_default_cache.flush)
+        return _default_cache
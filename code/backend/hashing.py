@@ -3,8 +3,10 @@ Hashing utilities for StegoCrypt Suite
 """
 
 import hashlib
+import hmac
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Ensure Backend is on sys.path for local script execution
 BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -13,32 +15,70 @@ if BACKEND_DIR not in sys.path:
 
 from validation.inputs import non_empty_string
 
+SUPPORTED_ALGORITHMS = ["md5", "sha1", "sha256", "sha512", "blake2b", "sha3_256", "sha3_512"]
+ALGORITHM_ALIASES = {"sha3": "sha3_256"}
+
+# Large reads keep the per-call overhead negligible next to the digest work
+FILE_READ_BUFFER_SIZE = 4 * 1024 * 1024
+
+def normalize_algorithm(algorithm: str) -> str:
+    """Return the canonical name of a supported algorithm, or raise ValueError"""
+    non_empty_string(algorithm, "algorithm")
+    algorithm = algorithm.strip().lower().replace("-", "_")
+    algorithm = ALGORITHM_ALIASES.get(algorithm, algorithm)
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    return algorithm
+
 def hash_message(message: str, algorithm: str = "sha256") -> str:
     """
     Hash a message using specified algorithm
     
     Args:
         message: The message to hash
-        algorithm: Hash algorithm (md5, sha1, sha256, sha512)
+        algorithm: Hash algorithm (see get_supported_algorithms)
     
     Returns:
         Hex digest of the hashed message
     """
     non_empty_string(message, "message")
-    non_empty_string(algorithm, "algorithm")
+    algorithm = normalize_algorithm(algorithm)
+    return hashlib.new(algorithm, message.encode()).hexdigest()
+
+def hash_file(path: str, algorithms=("sha256",)) -> dict:
+    """
+    Hash a file with one or more algorithms in a single pass
     
-    algorithm = algorithm.lower()
+    The file is read once into a reusable buffer and every chunk is fed to
+    all requested digests, so extra algorithms cost CPU but no extra I/O.
     
-    if algorithm == "md5":
-        return hashlib.md5(message.encode()).hexdigest()
-    elif algorithm == "sha1":
-        return hashlib.sha1(message.encode()).hexdigest()
-    elif algorithm == "sha256":
-        return hashlib.sha256(message.encode()).hexdigest()
-    elif algorithm == "sha512":
-        return hashlib.sha512(message.encode()).hexdigest()
-    else:
-        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    Args:
+        path: Path of the file to hash
+        algorithms: Iterable of algorithm names (a single name is also accepted)
+    
+    Returns:
+        Mapping of algorithm name to hex digest
+    """
+    non_empty_string(path, "path")
+    if isinstance(algorithms, str):
+        algorithms = [algorithms]
+    names = list(dict.fromkeys(normalize_algorithm(a) for a in algorithms))
+    if not names:
+        raise ValueError("At least one hash algorithm is required")
+
+    hashers = [hashlib.new(name) for name in names]
+    buffer = bytearray(FILE_READ_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            chunk = view[:n]
+            for h in hashers:
+                h.update(chunk)
+
+    return {name: h.hexdigest() for name, h in zip(names, hashers)}
 
 def verify_hash(message: str, hash_value: str, algorithm: str = "sha256") -> bool:
     """
@@ -55,9 +95,138 @@ def verify_hash(message: str, hash_value: str, algorithm: str = "sha256") -> boo
     computed_hash = hash_message(message, algorithm)
     return computed_hash == hash_value
 
+def verify_file_hash(path: str, hash_value: str, algorithm: str = "sha256") -> bool:
+    """
+    Verify a file against its hash
+    
+    Args:
+        path: Path of the file to verify
+        hash_value: The hex digest to verify against
+        algorithm: Hash algorithm used
+    
+    Returns:
+        True if hash matches, False otherwise
+    """
+    non_empty_string(hash_value, "hash_value")
+    computed_hash = hash_file(path, [algorithm])[normalize_algorithm(algorithm)]
+    return hmac.compare_digest(computed_hash, hash_value.strip().lower())
+
+# Merkle tree hashing. The leaf size is part of the digest: changing it
+# changes every root, so stored trees record the leaf size they used.
+# Leaves are H(0x00 || data) and interior nodes H(0x01 || left || right),
+# as in RFC 6962, so a leaf can never be confused with an interior node.
+# An odd node at the end of a level is promoted to the next level unchanged.
+MERKLE_LEAF_SIZE = 4 * 1024 * 1024
+MERKLE_LEAF_PREFIX = b"\x00"
+MERKLE_NODE_PREFIX = b"\x01"
+
+def _merkle_leaf_count(file_size: int, leaf_size: int) -> int:
+    # An empty file still has one (empty) leaf
+    return max(1, -(-file_size // leaf_size))
+
+def _hash_merkle_leaf(path: str, index: int, leaf_size: int, algorithm: str) -> bytes:
+    # Each call opens its own handle so leaves can be read from any thread;
+    # hashlib releases the GIL on large updates, so leaves hash in parallel.
+    h = hashlib.new(algorithm, MERKLE_LEAF_PREFIX)
+    with open(path, 'rb') as f:
+        f.seek(index * leaf_size)
+        h.update(f.read(leaf_size))
+    return h.digest()
+
+def merkle_root(leaf_digests: list, algorithm: str = "sha256") -> bytes:
+    """Combine leaf digests (raw bytes) into a Merkle root"""
+    algorithm = normalize_algorithm(algorithm)
+    level = list(leaf_digests)
+    if not level:
+        raise ValueError("At least one leaf digest is required")
+    while len(level) > 1:
+        parents = [
+            hashlib.new(algorithm, MERKLE_NODE_PREFIX + level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            parents.append(level[-1])
+        level = parents
+    return level[0]
+
+def _merkle_result(path: str, algorithm: str, leaf_size: int, leaves: list) -> dict:
+    return {
+        "algorithm": algorithm,
+        "leaf_size": leaf_size,
+        "file_size": os.path.getsize(path),
+        "root": merkle_root(leaves, algorithm).hex(),
+        "leaves": [leaf.hex() for leaf in leaves],
+    }
+
+def merkle_hash_file(path: str, algorithm: str = "sha256", leaf_size: int = MERKLE_LEAF_SIZE,
+                     workers: int = None) -> dict:
+    """
+    Hash a file as a Merkle tree of fixed-size leaves hashed in parallel
+    
+    Args:
+        path: Path of the file to hash
+        algorithm: Hash algorithm for leaves and interior nodes
+        leaf_size: Leaf size in bytes (default MERKLE_LEAF_SIZE)
+        workers: Number of hashing threads (default: CPU count)
+    
+    Returns:
+        Dict with algorithm, leaf_size, file_size, hex root and hex leaf digests
+    """
+    non_empty_string(path, "path")
+    algorithm = normalize_algorithm(algorithm)
+    if leaf_size <= 0:
+        raise ValueError("leaf_size must be positive")
+
+    count = _merkle_leaf_count(os.path.getsize(path), leaf_size)
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 4) as pool:
+        leaves = list(pool.map(lambda i: _hash_merkle_leaf(path, i, leaf_size, algorithm), range(count)))
+    return _merkle_result(path, algorithm, leaf_size, leaves)
+
+def merkle_leaves_for_range(offset: int, length: int, leaf_size: int = MERKLE_LEAF_SIZE) -> list:
+    """Indices of the leaves covering a byte range"""
+    if length <= 0:
+        return []
+    return list(range(offset // leaf_size, (offset + length - 1) // leaf_size + 1))
+
+def merkle_rehash_file(path: str, leaves: list, changed_leaves, algorithm: str = "sha256",
+                       leaf_size: int = MERKLE_LEAF_SIZE, workers: int = None) -> dict:
+    """
+    Update a stored Merkle tree after a partial rewrite, re-reading only changed leaves
+    
+    Args:
+        path: Path of the rewritten file
+        leaves: Hex leaf digests from a previous merkle_hash_file result
+        changed_leaves: Indices of leaves touched by the rewrite
+            (see merkle_leaves_for_range); leaves added or dropped by a
+            change in file size are handled automatically
+        algorithm: Hash algorithm used for the stored tree
+        leaf_size: Leaf size used for the stored tree
+        workers: Number of hashing threads (default: CPU count)
+    
+    Returns:
+        Same structure as merkle_hash_file
+    """
+    non_empty_string(path, "path")
+    algorithm = normalize_algorithm(algorithm)
+    count = _merkle_leaf_count(os.path.getsize(path), leaf_size)
+
+    digests = [bytes.fromhex(leaf) for leaf in leaves[:count]]
+    to_hash = {i for i in changed_leaves if 0 <= i < count}
+    to_hash.update(range(len(digests), count))
+    if count != len(leaves):
+        # The old and new final leaves may both be partial
+        to_hash.update(i for i in (len(leaves) - 1, count - 1) if 0 <= i < count)
+    digests.extend([b""] * (count - len(digests)))
+
+    indices = sorted(to_hash)
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 4) as pool:
+        for i, digest in zip(indices, pool.map(lambda i: _hash_merkle_leaf(path, i, leaf_size, algorithm), indices)):
+            digests[i] = digest
+    return _merkle_result(path, algorithm, leaf_size, digests)
+
 def get_supported_algorithms() -> list:
     """Get list of supported hash algorithms"""
-    return ["md5", "sha1", "sha256", "sha512"]
+    return list(SUPPORTED_ALGORITHMS)
 
 def main():
     """CLI interface for hashing"""
@@ -70,7 +239,7 @@ def main():
     
     if choice == '1':
         message = input("Enter message to hash: ").strip()
-        algorithm = input("Enter algorithm (md5/sha1/sha256/sha512): ").strip() or "sha256"
+        algorithm = input(f"Enter algorithm ({'/'.join(SUPPORTED_ALGORITHMS)}): ").strip() or "sha256"
         
         try:
             hash_result = hash_message(message, algorithm)
@@ -81,7 +250,7 @@ def main():
     elif choice == '2':
         message = input("Enter message: ").strip()
         hash_value = input("Enter hash to verify: ").strip()
-        algorithm = input("Enter algorithm (md5/sha1/sha256/sha512): ").strip() or "sha256"
+        algorithm = input(f"Enter algorithm ({'/'.join(SUPPORTED_ALGORITHMS)}): ").strip() or "sha256"
         
         try:
             is_valid = verify_hash(message, hash_value, algorithm)
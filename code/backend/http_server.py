@@ -0,0 +1,371 @@
+"""
+Local HTTP service for StegoCrypt Suite
+
+A standard-library HTTP/1.1 server, bound to the loopback interface only,
+that exposes the CLI operations without a process launch per request:
+
+    GET  /v1/health
+    POST /v1/commands/<command>[/<subcommand>]   JSON arguments -> JSON result
+    POST /v1/carriers/<carrier>/encode           carrier file -> stego file
+    POST /v1/carriers/<carrier>/decode           stego file -> JSON result
+
+Command arguments use the CLI option names ({"method": "AES", "message":
+"..."} for `encrypt`). Only the commands and options in ALLOWED_COMMANDS
+are served: nothing that reads or writes a server-side path chosen by the
+client. Carrier uploads may use chunked transfer encoding; they are
+streamed to a temporary file in fixed-size chunks and handed to the
+carrier engine by path, and the stego output is written back as raw bytes
+instead of base64 JSON. Text stego output is streamed from a temporary
+file rather than built in memory. Encode parameters travel in headers, with
+the message and password percent-encoded as UTF-8:
+
+    X-StegoCrypt-Algorithm: AES
+    X-StegoCrypt-Message: meet%20at%20noon
+    X-StegoCrypt-Password: ...
+
+Every request must carry `Authorization: Bearer <token>`, where the token
+is printed when the server starts, and a loopback Host header, so other
+local users and web pages cannot drive the service.
+"""
+
+import hmac
+import ipaddress
+import json
+import os
+import secrets
+import socket
+import tempfile
+from argparse import Namespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import unquote
+
+from batch_runner import CARRIERS, encode_carrier
+from logs import log_operation
+from cryptography.message_crypto import encrypt_message
+from steganography.text_stego import encode_text_file
+from stegocrypt_cli import build_parser, dispatch
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_UPLOAD_BYTES = 4 * 1024 * 1024 * 1024
+MAX_JSON_BYTES = 16 * 1024 * 1024
+# Command path -> options a client may pass. File paths on the server side
+# (--file, --input-file, --output-dir, ...), key import/export, cache and
+# log maintenance, NDJSON streaming commands and serve are CLI-only.
+ALLOWED_COMMANDS = {
+    ("encrypt",): {"message", "password", "method"},
+    ("decrypt",): {"ciphertext", "password", "method"},
+    ("hash",): {"message", "algorithm"},
+    ("verify-hash",): {"message", "hash-value", "algorithm"},
+    ("algorithms",): set(),
+    ("hash-cache",): set(),
+    ("bench",): {"engines", "repeat", "cached"},
+    ("get-logs",): {"count", "before"},
+    ("get-log-stats",): {"since", "until", "operation", "status", "filename"},
+    ("rsa", "generate-keys"): {"bits"},
+    ("rsa", "encrypt"): {"message"},
+    ("rsa", "decrypt"): {"ciphertext"},
+    ("rsa", "pool-fill"): {"bits", "count"},
+    ("rsa", "pool-status"): set(),
+    ("rsa", "key-stats"): set(),
+}
+CONTENT_TYPES = {
+    "image": "image/png",
+    "audio": "audio/wav",
+    "video": "video/x-msvideo",
+    "text": "text/plain; charset=utf-8",
+}
+DECODE_HANDLERS = {
+    "image": "decode-image",
+    "audio": "decode-audio",
+    "video": "decode-video",
+    "text": "decode-text",
+}
+
+
+class HTTPError(Exception):
+    """An error reported to the client with the given status code"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host.strip("[]")).is_loopback
+    except ValueError:
+        return False
+
+
+def host_name(host_header: str) -> str:
+    """Host of a Host header value without the port ("" if malformed)"""
+    if host_header.startswith("["):
+        # Bracketed IPv6 literal, optionally followed by :port
+        host, bracket, rest = host_header[1:].partition("]")
+        return host if bracket and (not rest or rest.startswith(":")) else ""
+    return host_header.rsplit(":", 1)[0]
+
+
+def command_argv(path_parts: list, arguments: dict) -> list:
+    """Turn a command path and JSON arguments into CLI argv"""
+    argv = list(path_parts)
+    for key, value in arguments.items():
+        option = "--" + key.replace("_", "-")
+        if value is True:
+            argv.append(option)
+        elif value is False or value is None:
+            continue
+        else:
+            # --option=value so values starting with '-' are not taken for options
+            argv.append(f"{option}={value}")
+    return argv
+
+
+class StegoCryptRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "StegoCrypt"
+    # Headers and body go out in separate writes; with Nagle's algorithm the
+    # body waits for the client's delayed ACK on every keep-alive request
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        # Requests are recorded through log_operation, not on stderr
+        pass
+
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_bytes(self, content_type: str, data: bytes):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        view = memoryview(data)
+        for start in range(0, len(view), UPLOAD_CHUNK_SIZE):
+            self.wfile.write(view[start:start + UPLOAD_CHUNK_SIZE])
+
+    def _send_file(self, content_type: str, path: str):
+        with open(path, "rb") as f:
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+            self.end_headers()
+            for chunk in iter(lambda: f.read(UPLOAD_CHUNK_SIZE), b""):
+                self.wfile.write(chunk)
+
+    def _check_access(self):
+        if not is_loopback(self.client_address[0]):
+            raise HTTPError(403, "Only loopback clients are accepted")
+        if not is_loopback(host_name(self.headers.get("Host") or "")):
+            raise HTTPError(403, "Host header must name the loopback interface")
+        expected = f"Bearer {self.server.token}"
+        if not hmac.compare_digest((self.headers.get("Authorization") or "").encode(), expected.encode()):
+            raise HTTPError(401, "Missing or invalid bearer token")
+
+    def _iter_body(self, limit: int):
+        """Yield the request body in chunks, for Content-Length and chunked uploads"""
+        received = 0
+        if "chunked" in (self.headers.get("Transfer-Encoding") or "").lower():
+            while True:
+                size_line = self.rfile.readline(1024)
+                try:
+                    size = int(size_line.split(b";", 1)[0].strip(), 16)
+                except ValueError:
+                    raise HTTPError(400, "Malformed chunked body")
+                if size == 0:
+                    # Skip trailers up to the blank line ending the body
+                    while self.rfile.readline(1024) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return
+                received += size
+                if received > limit:
+                    raise HTTPError(413, "Request body too large")
+                while size:
+                    chunk = self.rfile.read(min(size, UPLOAD_CHUNK_SIZE))
+                    if not chunk:
+                        raise HTTPError(400, "Truncated chunked body")
+                    size -= len(chunk)
+                    yield chunk
+                self.rfile.readline(1024)
+        else:
+            try:
+                remaining = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                raise HTTPError(400, "Invalid Content-Length")
+            if remaining > limit:
+                raise HTTPError(413, "Request body too large")
+            while remaining:
+                chunk = self.rfile.read(min(remaining, UPLOAD_CHUNK_SIZE))
+                if not chunk:
+                    raise HTTPError(400, "Truncated request body")
+                remaining -= len(chunk)
+                yield chunk
+
+    def _read_json(self) -> dict:
+        body = b"".join(self._iter_body(MAX_JSON_BYTES))
+        if not body:
+            return {}
+        try:
+            arguments = json.loads(body)
+        except ValueError:
+            raise HTTPError(400, "Request body is not valid JSON")
+        if not isinstance(arguments, dict):
+            raise HTTPError(400, "Request body must be a JSON object")
+        return arguments
+
+    def _upload_to_temp(self, carrier: str) -> str:
+        suffix = {"image": ".png", "audio": ".wav", "video": ".avi", "text": ".txt"}[carrier]
+        fd, path = tempfile.mkstemp(prefix="stegocrypt-upload-", suffix=suffix)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in self._iter_body(MAX_UPLOAD_BYTES):
+                    f.write(chunk)
+        except BaseException:
+            os.remove(path)
+            raise
+        return path
+
+    def _header_text(self, name: str) -> Optional[str]:
+        value = self.headers.get(name)
+        return unquote(value, encoding="utf-8") if value is not None else None
+
+    def do_GET(self):
+        try:
+            self._check_access()
+            if self.path.rstrip("/") != "/v1/health":
+                raise HTTPError(404, f"Unknown path: {self.path}")
+            self._send_json(200, {"status": "success"})
+        except HTTPError as e:
+            self._send_json(e.status, {"status": "error", "message": str(e)})
+
+    def do_POST(self):
+        try:
+            self._check_access()
+            parts = [part for part in self.path.split("?", 1)[0].split("/") if part]
+            if parts[:2] == ["v1", "commands"] and len(parts) > 2:
+                self._handle_command(parts[2:])
+            elif parts[:2] == ["v1", "carriers"] and len(parts) == 4 and parts[2] in CARRIERS:
+                if parts[3] == "encode":
+                    self._handle_encode(parts[2])
+                elif parts[3] == "decode":
+                    self._handle_decode(parts[2])
+                else:
+                    raise HTTPError(404, f"Unknown carrier operation: {parts[3]}")
+            else:
+                raise HTTPError(404, f"Unknown path: {self.path}")
+        except HTTPError as e:
+            # The unread part of a rejected body would be parsed as the next request
+            self.close_connection = True
+            self._send_json(e.status, {"status": "error", "message": str(e)})
+
+    def _handle_command(self, command: list):
+        allowed = ALLOWED_COMMANDS.get(tuple(command))
+        if allowed is None:
+            raise HTTPError(403, f"{' '.join(command)} is only available from the command line")
+        arguments = self._read_json()
+        refused = sorted(key for key in arguments if key.replace("_", "-") not in allowed)
+        if refused:
+            raise HTTPError(403, f"Options not accepted over HTTP: {', '.join(refused)}")
+        argv = command_argv(command, arguments)
+        try:
+            args = self.server.parser.parse_args(argv)
+        except SystemExit:
+            # argparse has already described the problem on stderr
+            raise HTTPError(400, f"Invalid arguments for {' '.join(command)}")
+        result = dispatch(args)
+        self._send_json(200 if result.get("status") == "success" else 422, result)
+
+    def _handle_encode(self, carrier: str):
+        algorithm = self.headers.get("X-StegoCrypt-Algorithm")
+        message = self._header_text("X-StegoCrypt-Message")
+        if not algorithm or not message:
+            raise HTTPError(400, "X-StegoCrypt-Algorithm and X-StegoCrypt-Message headers are required")
+        password = self._header_text("X-StegoCrypt-Password")
+        operation = f"ENCODE_{carrier.upper()}"
+        path = self._upload_to_temp(carrier)
+        output_path = path + ".stego"
+        try:
+            log_operation(operation, "STARTED", {"filename": "upload", "http": True})
+            if carrier == "text":
+                # Streamed cover to stego file, sent back from disk
+                encode_text_file(encrypt_message(message, algorithm, password), path, output_path)
+                data = None
+            else:
+                # The image, audio and video engines return the stego file's bytes
+                data = encode_carrier(carrier, path, message, algorithm, password)
+        except Exception as e:
+            log_operation(operation, "FAILED", {"filename": "upload", "http": True, "error": str(e)})
+            self._send_json(422, {"status": "error", "success": False, "message": str(e)})
+            return
+        finally:
+            os.remove(path)
+        log_operation(operation, "SUCCESS", {"filename": "upload", "http": True})
+        if data is not None:
+            self._send_bytes(CONTENT_TYPES[carrier], data)
+            return
+        try:
+            self._send_file(CONTENT_TYPES[carrier], output_path)
+        finally:
+            os.remove(output_path)
+
+    def _handle_decode(self, carrier: str):
+        algorithm = self.headers.get("X-StegoCrypt-Algorithm")
+        if not algorithm:
+            raise HTTPError(400, "X-StegoCrypt-Algorithm header is required")
+        path = self._upload_to_temp(carrier)
+        try:
+            args = Namespace(command=DECODE_HANDLERS[carrier], input_file=path, algorithm=algorithm,
+                             password=self._header_text("X-StegoCrypt-Password"))
+            result = dispatch(args)
+        finally:
+            os.remove(path)
+        self._send_json(200 if result.get("status") == "success" else 422, result)
+
+
+class StegoCryptHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, token: str):
+        super().__init__(address, StegoCryptRequestHandler)
+        self.token = token
+        self.parser = build_parser()
+
+
+class StegoCryptHTTPServerV6(StegoCryptHTTPServer):
+    address_family = socket.AF_INET6
+
+
+def create_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                  token: Optional[str] = None) -> StegoCryptHTTPServer:
+    """
+    Create (but do not start) the local HTTP server
+
+    Args:
+        host: Loopback address to bind; other addresses are refused
+        port: TCP port (0 picks a free one)
+        token: Bearer token clients must send (default: a random one)
+    """
+    if not is_loopback(host):
+        raise ValueError(f"Refusing to listen on non-loopback address: {host}")
+    host = host.strip("[]")
+    server_class = StegoCryptHTTPServerV6 if ":" in host else StegoCryptHTTPServer
+    return server_class((host, port), token or secrets.token_urlsafe(32))
+
+
+def server_url(server: StegoCryptHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    if ":" in host:
+        host = f"[{host}]"
+    return f"http://{host}:{port}"
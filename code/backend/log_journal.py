@@ -0,0 +1,156 @@
+"""
+SQLite operation journal for StegoCrypt Suite
+
+An optional log backend that keeps one row per log_operation entry, with
+indexes on timestamp, operation, status and filename so time-range and
+per-file queries do not scan the whole history. Entries arrive in batches
+from the queued log writer and are inserted in a single transaction.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterable, Optional
+
+from utilities.timing import add_latency
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS operations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    status TEXT NOT NULL,
+    filename TEXT,
+    details TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_operations_timestamp ON operations (timestamp);
+CREATE INDEX IF NOT EXISTS idx_operations_operation ON operations (operation, status, timestamp);
+CREATE INDEX IF NOT EXISTS idx_operations_status ON operations (status, timestamp);
+CREATE INDEX IF NOT EXISTS idx_operations_filename ON operations (filename, timestamp);
+"""
+
+
+def _row_values(entry: dict) -> tuple:
+    details = entry.get("details") or {}
+    filename = details.get("filename") if isinstance(details, dict) else None
+    return (
+        str(entry.get("timestamp") or ""),
+        str(entry.get("operation")),
+        str(entry.get("status")),
+        str(filename) if filename else None,
+        json.dumps(details),
+    )
+
+
+def _where(since=None, until=None, operation=None, status=None, filename=None) -> tuple:
+    clauses, params = [], []
+    for clause, value in (
+        ("timestamp >= ?", since),
+        ("timestamp <= ?", until),
+        ("operation = ?", operation),
+        ("status = ?", status),
+        ("filename = ?", filename),
+    ):
+        if value is not None:
+            clauses.append(clause)
+            params.append(value)
+    return clauses, params
+
+
+class LogJournal:
+    """Indexed, append-only store of structured log entries"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def insert_many(self, entries: Iterable[dict]) -> int:
+        """Insert entries in one transaction; returns the number inserted"""
+        rows = [_row_values(entry) for entry in entries]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO operations (timestamp, operation, status, filename, details) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def get_page(self, count: int = 20, before: Optional[int] = None, since: Optional[str] = None,
+                 until: Optional[str] = None, operation: Optional[str] = None, status: Optional[str] = None,
+                 filename: Optional[str] = None) -> dict:
+        """
+        Get up to `count` matching entries with an id below `before`, oldest
+        first. `next_before` is the cursor for the following (older) page.
+        """
+        clauses, params = _where(since, until, operation, status, filename)
+        if before is not None:
+            clauses.append("id < ?")
+            params.append(before)
+        sql = "SELECT id, timestamp, operation, status, details FROM operations"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id DESC LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(sql, params + [count + 1]).fetchall()
+
+        more = len(rows) > count
+        rows = rows[:count]
+        entries = [
+            {"timestamp": ts, "operation": op, "status": st, "details": json.loads(details)}
+            for _, ts, op, st, details in reversed(rows)
+        ]
+        return {"logs": entries, "next_before": rows[-1][0] if more else None}
+
+    def stats(self, since: Optional[str] = None, until: Optional[str] = None, operation: Optional[str] = None,
+              status: Optional[str] = None, filename: Optional[str] = None) -> dict:
+        """
+        Count matching entries, overall and per operation and status, and
+        build per-operation latency histograms from the recorded timings
+        """
+        clauses, params = _where(since, until, operation, status, filename)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        duration = "json_extract(details, '$.timing.duration_ms')"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT operation, status, COUNT(*), COUNT(filename) FROM operations"
+                + where + " GROUP BY operation, status",
+                params,
+            ).fetchall()
+            durations = self._conn.execute(
+                f"SELECT operation, {duration} FROM operations"
+                + (where + " AND " if where else " WHERE ") + f"{duration} IS NOT NULL",
+                params,
+            ).fetchall()
+
+        by_operation = {}
+        total = files = 0
+        for operation_name, status_name, count, with_file in rows:
+            by_operation.setdefault(operation_name, {})[status_name] = count
+            total += count
+            files += with_file
+        latency = {}
+        for operation_name, duration_ms in durations:
+            add_latency(latency.setdefault(operation_name, {}), duration_ms)
+        return {"total_operations": total, "files_processed": files, "by_operation": by_operation,
+                "latency": latency}
+
+    def latest_timestamp(self) -> Optional[str]:
+        with self._lock:
+            (latest,) = self._conn.execute("SELECT MAX(timestamp) FROM operations").fetchone()
+        return latest
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM operations")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
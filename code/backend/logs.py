@@ -2,10 +2,21 @@
 Logging utilities for StegoCrypt Suite
 """
 
+import atexit
+import gzip
+import io
 import logging
 import os
 import json
-from datetime import datetime
+import queue
+import shutil
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+from log_journal import LogJournal
+from utilities.timing import begin_operation, end_operation, add_latency, summarize_latency
+from datetime import datetime, timedelta, timezone
 
 # Configure logging
 LOG_DIR = os.path.join(os.path.dirname(__file__), "logs")
@@ -13,86 +24,763 @@ os.makedirs(LOG_DIR, exist_ok=True)
 
 LOG_FILE = os.path.join(LOG_DIR, "stegocrypt.log")
 
-# Basic file handler for raw logs
-handler = logging.FileHandler(LOG_FILE)
-handler.setFormatter(logging.Formatter('%(message)s'))
+# Rotation: the live log is gzipped into an archive segment once it passes
+# LOG_MAX_BYTES or when the first entry of a new (UTC) day is written.
+# SEGMENT_INDEX_FILE records each segment's time range and its position in
+# the overall log, so reads can span segments and skip irrelevant ones.
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_ROTATE_DAILY = True
+LOG_ARCHIVE_RETENTION = 30
+LOG_RETENTION_DAYS = 90
+SEGMENT_INDEX_FILE = os.path.join(LOG_DIR, "segments.json")
+ROTATION_LOCK_FILE = os.path.join(LOG_DIR, ".rotate.lock")
+ROTATION_LOCK_STALE_SECONDS = 60
+# How long a stats update waits for a rotation in progress to finish
+ROTATION_LOCK_WAIT_SECONDS = 5
+
+# Storage backend for log_operation: "jsonl" (rotated JSON-lines files) or
+# "sqlite" (indexed operation journal, see log_journal.py)
+LOG_BACKEND = os.environ.get("STEGOCRYPT_LOG_BACKEND", "jsonl").lower()
+JOURNAL_FILE = os.path.join(LOG_DIR, "journal.sqlite3")
+
+
+class SegmentedLogHandler(logging.FileHandler):
+    """
+    File handler that rotates the live log by size and by day.
+    Rotation may be done by any process writing the log; a handler whose
+    file was rotated away by another process reopens the live path.
+    """
+
+    def __init__(self, filename: str, max_bytes: int = LOG_MAX_BYTES, daily: bool = LOG_ROTATE_DAILY):
+        super().__init__(filename, mode='a', encoding='utf-8', delay=True)
+        self.max_bytes = max_bytes
+        self.daily = daily
+
+    def _rotation_due(self, pending: int) -> bool:
+        try:
+            st = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            return False
+        if st.st_size == 0:
+            return False
+        if self.max_bytes and st.st_size + pending > self.max_bytes:
+            return True
+        if self.daily:
+            last_write = datetime.fromtimestamp(st.st_mtime, timezone.utc).date()
+            return last_write != datetime.now(timezone.utc).date()
+        return False
+
+    def _reopen_if_moved(self):
+        if self.stream is None:
+            return
+        try:
+            moved = os.stat(self.baseFilename).st_ino != os.fstat(self.stream.fileno()).st_ino
+        except FileNotFoundError:
+            moved = True
+        if moved:
+            self.stream.close()
+            self.stream = None
+
+    def _prepare_stream(self, pending: int):
+        if self._rotation_due(pending):
+            # Release our handle first: open files cannot be renamed on Windows
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+            rotate_log()
+        self._reopen_if_moved()
+
+    def emit(self, record):
+        self.emit_batch([record])
+
+    def emit_batch(self, records: list):
+        """Write several records with a single write and flush."""
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+        if not lines:
+            return
+        data = "".join(lines)
+        with self.lock:
+            try:
+                self._prepare_stream(len(data.encode('utf-8')))
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(data)
+                self.flush()
+            except Exception:
+                self.handleError(records[0])
+
+
+class JsonEntryFormatter(logging.Formatter):
+    """Serialise structured entries; runs on the writer thread, not the caller's."""
+
+    def format(self, record):
+        if isinstance(record.msg, dict):
+            return json.dumps(record.msg)
+        return record.getMessage()
+
+
+_journal = None
+_journal_lock = threading.Lock()
+
+def get_journal() -> LogJournal:
+    """Return the SQLite operation journal, opening it on first use"""
+    global _journal
+    with _journal_lock:
+        if _journal is None or _journal.db_path != JOURNAL_FILE:
+            _journal = LogJournal(JOURNAL_FILE)
+        return _journal
+
+
+class JournalHandler(logging.Handler):
+    """Handler that inserts each batch of entries into the operation journal."""
+
+    def emit(self, record):
+        self.emit_batch([record])
+
+    def emit_batch(self, records: list):
+        entries = []
+        for record in records:
+            try:
+                entries.append(record.msg if isinstance(record.msg, dict) else json.loads(record.getMessage()))
+            except Exception:
+                self.handleError(record)
+        try:
+            if entries:
+                get_journal().insert_many(entries)
+        except Exception:
+            self.handleError(records[0])
+
+
+# Queued writing: log_operation only enqueues the entry. A listener thread
+# drains the queue in batches, serialises the entries and writes each batch
+# with one flush. When the queue is full, entries are dropped and counted
+# rather than blocking the caller.
+LOG_QUEUE_SIZE = 10000
+LOG_BATCH_SIZE = 256
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks: records that do not fit are dropped and counted."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record):
+        # Formatting is left to the writer thread
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+class BatchingQueueListener(QueueListener):
+    """QueueListener that hands everything already queued to its handlers as one batch."""
+
+    def enqueue_sentinel(self):
+        # Must not be dropped, so wait for room
+        self.queue.put(self._sentinel)
+
+    def handle_batch(self, records: list):
+        for target in self.handlers:
+            if hasattr(target, "emit_batch"):
+                target.emit_batch([r for r in records if r.levelno >= target.level])
+            else:
+                for record in records:
+                    self.handle(record)
+
+    def _monitor(self):
+        while True:
+            batch = [self.dequeue(True)]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+            records = [r for r in batch if r is not self._sentinel]
+            try:
+                if records:
+                    self.handle_batch(records)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            if len(records) < len(batch):
+                return
+
+
+# Basic file handler for raw logs, or the journal when configured
+if LOG_BACKEND == "sqlite":
+    handler = JournalHandler()
+else:
+    handler = SegmentedLogHandler(LOG_FILE)
+    handler.setFormatter(JsonEntryFormatter())
+
+_log_queue = queue.Queue(LOG_QUEUE_SIZE)
+queue_handler = DroppingQueueHandler(_log_queue)
+_listener = BatchingQueueListener(_log_queue, handler, respect_handler_level=True)
+_listener.start()
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
-logger.addHandler(handler)
+logger.propagate = False
+logger.addHandler(queue_handler)
+
+def flush_logs():
+    """Block until every entry queued so far has been written."""
+    _log_queue.join()
+
+def _stop_listener():
+    # Writes out whatever is still queued when the process exits
+    if _listener._thread is not None:
+        _listener.stop()
+        handler.close()
+
+atexit.register(_stop_listener)
+
+def get_log_queue_stats() -> dict:
+    """Queue depth, capacity and the number of entries dropped because it was full."""
+    return {
+        "queued": _log_queue.qsize(),
+        "capacity": LOG_QUEUE_SIZE,
+        "dropped": queue_handler.dropped,
+    }
 
 def log_operation(operation: str, status: str, details: dict = None):
-    """Log an operation in a structured JSON format."""
+    """
+    Queue an operation entry; it is serialised and written in the background.
+    STARTED begins timing the operation in the current context, and the
+    entry that ends it carries the duration, phase spans and byte counts
+    under details["timing"].
+    """
+    details = dict(details or {})
+    if status == "STARTED":
+        begin_operation()
+    else:
+        timing = end_operation()
+        if timing is not None:
+            details["timing"] = timing
     log_entry = {
         "timestamp": datetime.utcnow().isoformat(),
         "operation": operation,
         "status": status,
-        "details": details or {}
+        "details": details
     }
-    logger.info(json.dumps(log_entry))
+    logger.info(log_entry)
 
-def get_logs(count: int = 20) -> list:
-    """Get recent logs in a structured format."""
+def _load_segment_index() -> dict:
+    try:
+        with open(SEGMENT_INDEX_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"live_start": 0, "segments": []}
+
+def _save_segment_index(index: dict):
+    tmp_path = SEGMENT_INDEX_FILE + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    os.replace(tmp_path, SEGMENT_INDEX_FILE)
+
+def _acquire_rotation_lock(wait: float = 0) -> bool:
+    deadline = time.monotonic() + wait
+    while True:
+        try:
+            if time.time() - os.stat(ROTATION_LOCK_FILE).st_mtime > ROTATION_LOCK_STALE_SECONDS:
+                os.remove(ROTATION_LOCK_FILE)
+        except FileNotFoundError:
+            pass
+        try:
+            os.close(os.open(ROTATION_LOCK_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+            return True
+        except FileExistsError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+
+def _release_rotation_lock():
     try:
-        with open(LOG_FILE, 'r') as f:
-            lines = f.readlines()
-        
-        # Parse each line as JSON and return the last `count` entries
-        log_entries = []
-        for line in lines:
+        os.remove(ROTATION_LOCK_FILE)
+    except FileNotFoundError:
+        pass
+
+def _entry_timestamp(line: bytes):
+    try:
+        return json.loads(line).get("timestamp")
+    except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+        return None
+
+def _segment_bounds(f, size: int) -> tuple:
+    """First and last entry timestamps of a log file."""
+    f.seek(0)
+    first = next((ts for ts in map(_entry_timestamp, f) if ts), None)
+    last = None
+    for _, line in _iter_lines_reverse(f, size):
+        last = _entry_timestamp(line)
+        if last:
+            break
+    return first, last
+
+def _apply_retention(index: dict):
+    cutoff = (datetime.utcnow() - timedelta(days=LOG_RETENTION_DAYS)).isoformat() if LOG_RETENTION_DAYS else None
+    kept = []
+    segments = index["segments"]
+    for position, segment in enumerate(segments):
+        too_many = LOG_ARCHIVE_RETENTION and position < len(segments) - LOG_ARCHIVE_RETENTION
+        last = segment.get("last_timestamp")
+        too_old = cutoff is not None and last and last < cutoff
+        if too_many or too_old:
             try:
-                log_entries.append(json.loads(line.strip()))
-            except json.JSONDecodeError:
-                # Ignore malformed lines
-                continue
-        
-        return log_entries[-count:]
+                os.remove(os.path.join(LOG_DIR, segment["file"]))
+            except FileNotFoundError:
+                pass
+        else:
+            kept.append(segment)
+    index["segments"] = kept
+
+def rotate_log() -> bool:
+    """
+    Archive the live log as a gzip segment and start a new one.
+    Returns False if there was nothing to rotate or another process is
+    already rotating or updating the stats checkpoint.
+    """
+    if not _acquire_rotation_lock():
+        return False
+    try:
+        claimed = f"{LOG_FILE}.rotating-{os.getpid()}"
+        try:
+            if os.path.getsize(LOG_FILE) == 0:
+                return False
+            os.replace(LOG_FILE, claimed)
+        except (FileNotFoundError, PermissionError):
+            return False
+
+        size = os.path.getsize(claimed)
+        index = _load_segment_index()
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        name = f"stegocrypt-{stamp}.log.gz"
+        with open(claimed, 'rb') as src:
+            _fold_rotated_log(src, size, index["live_start"] + size)
+            first, last = _segment_bounds(src, size)
+            src.seek(0)
+            with gzip.open(os.path.join(LOG_DIR, name), 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+
+        index["segments"].append({
+            "file": name,
+            "start": index["live_start"],
+            "bytes": size,
+            "first_timestamp": first,
+            "last_timestamp": last,
+        })
+        index["live_start"] += size
+        _apply_retention(index)
+        _save_segment_index(index)
+        os.remove(claimed)
+        return True
+    finally:
+        _release_rotation_lock()
+
+# Block size for reading the log backwards from the end
+TAIL_BLOCK_SIZE = 64 * 1024
+
+def _iter_lines_reverse(f, end: int):
+    """
+    Yield (offset, line) pairs from a binary file, newest first, reading
+    fixed-size blocks backwards from `end`.
+    """
+    pos = end
+    partial = b""
+    while pos > 0:
+        size = min(TAIL_BLOCK_SIZE, pos)
+        pos -= size
+        f.seek(pos)
+        block = f.read(size) + partial
+        lines = block.split(b"\n")
+        # The first piece may continue in the previous block
+        partial = lines[0]
+        line_end = pos + len(block)
+        for line in reversed(lines[1:]):
+            start = line_end - len(line)
+            yield start, line
+            line_end = start - 1
+    yield 0, partial
+
+def _iter_segments_reverse(before: int, since: str = None, until: str = None):
+    """
+    Yield (start, file object, readable size) for each log segment, newest
+    first, that holds data before the global offset `before` and may
+    overlap the [since, until] time range. Offsets are global: an archive
+    keeps the position its bytes had while they were the live log, so
+    cursors stay valid across rotations.
+    """
+    index = _load_segment_index()
+    try:
+        with open(LOG_FILE, 'rb') as f:
+            start = index["live_start"]
+            size = os.fstat(f.fileno()).st_size
+            if before is None or before > start:
+                yield start, f, size if before is None else min(size, before - start)
     except FileNotFoundError:
-        return []
-    except Exception:
-        return []
+        pass
 
-def get_log_stats() -> dict:
-    """Get statistics from all logs."""
-    if not os.path.exists(LOG_FILE):
-        return {
-            "total_operations": 0,
-            "files_processed": 0,
-            "recent_logs": [],
-        }
-    
-    log_entries = []
+    for segment in reversed(index["segments"]):
+        start = segment["start"]
+        if before is not None and before <= start:
+            continue
+        if since and segment.get("last_timestamp") and segment["last_timestamp"] < since:
+            # Segments are chronological, so every older one is out of range too
+            break
+        if until and segment.get("first_timestamp") and segment["first_timestamp"] > until:
+            continue
+        try:
+            with gzip.open(os.path.join(LOG_DIR, segment["file"]), 'rb') as gz:
+                data = gz.read()
+        except FileNotFoundError:
+            continue
+        size = len(data) if before is None else min(len(data), before - start)
+        yield start, io.BytesIO(data), size
+
+def _matches(entry: dict, operation: str = None, status: str = None, filename: str = None) -> bool:
+    if operation is not None and entry.get("operation") != operation:
+        return False
+    if status is not None and entry.get("status") != status:
+        return False
+    if filename is not None:
+        details = entry.get("details")
+        return isinstance(details, dict) and details.get("filename") == filename
+    return True
+
+def get_logs_page(count: int = 20, before: int = None, since: str = None, until: str = None,
+                  operation: str = None, status: str = None, filename: str = None) -> dict:
+    """
+    Get up to `count` log entries that start before offset `before`
+    (default: end of the log), oldest first, reading backwards across the
+    live log and archived segments. `since`/`until` restrict entries to an
+    ISO timestamp range, and segments outside it are not read at all;
+    `operation`, `status` and `filename` filter on those fields.
+    `next_before` is the cursor for the following (older) page, or None
+    once the start of the log is reached. With the SQLite backend the
+    filters are answered from the journal's indexes and the cursor is a
+    row id.
+    """
+    flush_logs()
+    if LOG_BACKEND == "sqlite":
+        return get_journal().get_page(count, before, since, until, operation, status, filename)
+
+    entries = []
+    next_before = None
+    done = False
     try:
-        with open(LOG_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
+        for start, f, end in _iter_segments_reverse(before, since, until):
+            for offset, line in _iter_lines_reverse(f, end):
+                if len(entries) >= count:
+                    done = True
+                    break
+                if not line.strip():
+                    continue
                 try:
-                    if line.strip():
-                        log_entries.append(json.loads(line.strip()))
-                except json.JSONDecodeError:
-                    # Optionally log this error to a separate file for debugging
+                    entry = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    # Ignore malformed lines
+                    continue
+                timestamp = entry.get("timestamp") or ""
+                if since and timestamp < since:
+                    # Everything older is outside the range as well
+                    next_before = None
+                    done = True
+                    break
+                next_before = start + offset
+                if until and timestamp > until:
+                    continue
+                if not _matches(entry, operation, status, filename):
                     continue
+                entries.append(entry)
+            if done:
+                break
     except Exception:
-        # Handle file reading errors
+        entries = []
+
+    if next_before == 0:
+        next_before = None
+    entries.reverse()
+    return {"logs": entries, "next_before": next_before}
+
+def get_logs(count: int = 20, before: int = None, since: str = None, until: str = None,
+             operation: str = None, status: str = None, filename: str = None) -> list:
+    """Get recent logs in a structured format."""
+    return get_logs_page(count, before, since, until, operation, status, filename)["logs"]
+
+def _iter_entries_forward(since: str = None, until: str = None):
+    """Yield every parsed log entry, oldest first, skipping segments outside [since, until]."""
+    index = _load_segment_index()
+    sources = []
+    for segment in index["segments"]:
+        if since and segment.get("last_timestamp") and segment["last_timestamp"] < since:
+            continue
+        if until and segment.get("first_timestamp") and segment["first_timestamp"] > until:
+            continue
+        sources.append((gzip.open, os.path.join(LOG_DIR, segment["file"])))
+    sources.append((open, LOG_FILE))
+
+    for opener, path in sources:
+        try:
+            with opener(path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+                    if isinstance(entry, dict):
+                        yield entry
+        except FileNotFoundError:
+            continue
+
+# Running counters for get_log_stats, persisted with the byte offset up to
+# which the log has been folded in, so each call only parses new lines
+STATS_CHECKPOINT_FILE = os.path.join(LOG_DIR, "stats_checkpoint.json")
+STATS_CHECKPOINT_VERSION = 2
+# Bytes at the start of the log used to recognise a truncated or replaced file
+STATS_SIGNATURE_BYTES = 256
+# The checkpoint is loaded, updated and saved both by get_log_stats and by
+# rotation (on the log writer thread). Threads serialize on this lock and
+# processes on the rotation lock file, taken first, so that one cannot save
+# a stale offset over the other's.
+_stats_lock = threading.Lock()
+
+def _empty_stats() -> dict:
+    return {
+        "version": STATS_CHECKPOINT_VERSION,
+        "offset": 0,
+        "signature": "",
+        "live_start": 0,
+        "total_operations": 0,
+        "files_processed": 0,
+        "by_operation": {},
+        "latency": {},
+    }
+
+def _load_stats_checkpoint() -> dict:
+    try:
+        with open(STATS_CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("version") == 1:
+            # Version 1 had no latency histograms; keep its counters
+            checkpoint.update(version=STATS_CHECKPOINT_VERSION, latency={})
+        if checkpoint.get("version") == STATS_CHECKPOINT_VERSION:
+            return checkpoint
+    except (OSError, ValueError):
+        pass
+    return _empty_stats()
+
+def _save_stats_checkpoint(checkpoint: dict):
+    tmp_path = STATS_CHECKPOINT_FILE + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, STATS_CHECKPOINT_FILE)
+
+def _log_signature(f) -> str:
+    f.seek(0)
+    return f.read(STATS_SIGNATURE_BYTES).hex()
+
+def _fold_entry(stats: dict, entry: dict):
+    """Add one parsed log entry to the running counters."""
+    stats["total_operations"] += 1
+    details = entry.get("details") or {}
+    if isinstance(details, dict) and details.get("filename"):
+        stats["files_processed"] += 1
+    by_status = stats["by_operation"].setdefault(str(entry.get("operation")), {})
+    status = str(entry.get("status"))
+    by_status[status] = by_status.get(status, 0) + 1
+    timing = details.get("timing") if isinstance(details, dict) else None
+    if isinstance(timing, dict) and isinstance(timing.get("duration_ms"), (int, float)):
+        add_latency(stats["latency"].setdefault(str(entry.get("operation")), {}), timing["duration_ms"])
+
+def _latency_summary(histograms: dict) -> dict:
+    return {operation: summarize_latency(histogram) for operation, histogram in histograms.items()}
+
+def _fold_lines(stats: dict, data: bytes):
+    for line in data.split(b"\n"):
+        if not line.strip():
+            continue
+        try:
+            _fold_entry(stats, json.loads(line))
+        except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+            # Ignore malformed lines
+            continue
+
+def _update_stats_checkpoint() -> dict:
+    """Fold lines appended since the last checkpoint into the persisted counters."""
+    if not _acquire_rotation_lock(ROTATION_LOCK_WAIT_SECONDS):
+        # A rotation is taking long; report the counters as last saved
+        return _load_stats_checkpoint()
+    try:
+        with _stats_lock:
+            return _fold_live_log()
+    finally:
+        _release_rotation_lock()
+
+def _fold_live_log() -> dict:
+    checkpoint = _load_stats_checkpoint()
+    live_start = _load_segment_index()["live_start"]
+    if checkpoint.get("live_start", live_start) != live_start:
+        # Rotated since this checkpoint was saved (e.g. a crash between the
+        # fold and the index update): the offset belongs to the archived
+        # log, the counters are still good
+        checkpoint.update(offset=0, signature="")
+    checkpoint["live_start"] = live_start
+    with open(LOG_FILE, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        signature = _log_signature(f)
+        known = checkpoint["signature"]
+        if size < checkpoint["offset"] or signature[:len(known)] != known:
+            # The log was cleared or replaced: start counting again
+            checkpoint = dict(_empty_stats(), live_start=live_start)
+
+        f.seek(checkpoint["offset"])
+        data = f.read(size - checkpoint["offset"])
+
+    # Only fold complete lines; a trailing partial line is picked up next time
+    complete = data.rfind(b"\n") + 1
+    if complete:
+        _fold_lines(checkpoint, data[:complete])
+        checkpoint["offset"] += complete
+        if len(checkpoint["signature"]) < STATS_SIGNATURE_BYTES * 2:
+            checkpoint["signature"] = signature[:checkpoint["offset"] * 2]
+        _save_stats_checkpoint(checkpoint)
+    return checkpoint
+
+def _fold_rotated_log(f, size: int, live_start: int):
+    """
+    Fold the unread tail of a log being rotated and point the checkpoint at
+    the new live log, which starts at live_start. The caller holds the
+    rotation lock file.
+    """
+    with _stats_lock:
+        checkpoint = _load_stats_checkpoint()
+        known = checkpoint["signature"]
+        if size < checkpoint["offset"] or _log_signature(f)[:len(known)] != known:
+            checkpoint = _empty_stats()
+        f.seek(checkpoint["offset"])
+        _fold_lines(checkpoint, f.read())
+        checkpoint.update(offset=0, signature="", live_start=live_start)
+        _save_stats_checkpoint(checkpoint)
+
+def _filtered_stats(since: str = None, until: str = None, operation: str = None,
+                    status: str = None, filename: str = None) -> dict:
+    """Scan the JSON-lines logs for statistics over a filtered subset of entries."""
+    stats = _empty_stats()
+    for entry in _iter_entries_forward(since, until):
+        timestamp = entry.get("timestamp") or ""
+        if (since and timestamp < since) or (until and timestamp > until):
+            continue
+        if _matches(entry, operation, status, filename):
+            _fold_entry(stats, entry)
+    return stats
+
+def _empty_log_stats() -> dict:
+    return {
+        "total_operations": 0,
+        "files_processed": 0,
+        "by_operation": {},
+        "latency": {},
+        "recent_logs": [],
+        "dropped_entries": queue_handler.dropped,
+    }
+
+def get_log_stats(since: str = None, until: str = None, operation: str = None,
+                  status: str = None, filename: str = None) -> dict:
+    """
+    Get statistics from all logs (live and archived), parsing only lines
+    added since the last call. Filtered statistics are computed from the
+    journal with the SQLite backend, or by scanning the logs otherwise.
+    """
+    flush_logs()
+    filters = (since, until, operation, status, filename)
+    if LOG_BACKEND == "sqlite" or any(f is not None for f in filters):
+        if LOG_BACKEND == "sqlite":
+            stats = get_journal().stats(*filters)
+        else:
+            stats = _filtered_stats(*filters)
         return {
-            "total_operations": 0,
-            "files_processed": 0,
-            "recent_logs": [],
+            "total_operations": stats["total_operations"],
+            "files_processed": stats["files_processed"],
+            "by_operation": stats["by_operation"],
+            "latency": _latency_summary(stats["latency"]),
+            "recent_logs": get_logs(20, None, *filters),
+            "dropped_entries": queue_handler.dropped,
         }
 
-    total_operations = len(log_entries)
-    files_processed = sum(1 for log in log_entries if log.get("details", {}).get("filename"))
-    
+    if not os.path.exists(LOG_FILE) and not os.path.exists(STATS_CHECKPOINT_FILE):
+        return _empty_log_stats()
+
+    try:
+        if os.path.exists(LOG_FILE):
+            checkpoint = _update_stats_checkpoint()
+        else:
+            checkpoint = _load_stats_checkpoint()
+    except Exception:
+        # Handle file reading errors
+        return _empty_log_stats()
+
     return {
-        "total_operations": total_operations,
-        "files_processed": files_processed,
-        "recent_logs": log_entries[-20:],
+        "total_operations": checkpoint["total_operations"],
+        "files_processed": checkpoint["files_processed"],
+        "by_operation": checkpoint["by_operation"],
+        "latency": _latency_summary(checkpoint["latency"]),
+        "recent_logs": get_logs(20),
+        "dropped_entries": queue_handler.dropped,
     }
 
 def clear_logs():
-    """Clear all logs"""
+    """Clear all logs, including archived segments"""
+    flush_logs()
     try:
         with open(LOG_FILE, 'w') as f:
             f.write("")
+        for segment in _load_segment_index()["segments"]:
+            try:
+                os.remove(os.path.join(LOG_DIR, segment["file"]))
+            except FileNotFoundError:
+                pass
+        for path in (SEGMENT_INDEX_FILE, STATS_CHECKPOINT_FILE):
+            if os.path.exists(path):
+                os.remove(path)
+        if LOG_BACKEND == "sqlite" or os.path.exists(JOURNAL_FILE):
+            get_journal().clear()
         return True
     except Exception:
         return False
+
+def migrate_logs_to_journal(batch_size: int = 1000) -> dict:
+    """
+    Import the JSON-lines logs (archived and live) into the SQLite journal.
+    Entries no newer than the journal's latest one are skipped, so the
+    migration can be re-run to catch up without duplicating rows.
+    """
+    flush_logs()
+    journal = get_journal()
+    latest = journal.latest_timestamp()
+    imported = skipped = 0
+    batch = []
+    for entry in _iter_entries_forward(since=latest):
+        if latest is not None and (entry.get("timestamp") or "") <= latest:
+            skipped += 1
+            continue
+        batch.append(entry)
+        if len(batch) >= batch_size:
+            imported += journal.insert_many(batch)
+            batch = []
+    if batch:
+        imported += journal.insert_many(batch)
+    return {"imported": imported, "skipped": skipped, "journal": JOURNAL_FILE}
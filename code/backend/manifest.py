@@ -0,0 +1,224 @@
+"""
+Directory tree hashing and checksum manifests for StegoCrypt Suite
+
+Manifests use the sha256sum/md5sum text format ("<digest>  <path>"), so
+they can also be checked with the coreutils tools. Files are hashed on a
+thread pool (hashlib releases the GIL while digesting) and results are
+reported through a callback as soon as each file completes.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from typing import Callable, Iterator, Optional
+
+from hashing import hash_file, normalize_algorithm
+from hash_cache import get_hash_cache
+
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
+
+_UNESCAPES = {"n": "\n", "r": "\r"}
+
+
+def _escape_path(path: str) -> tuple:
+    # Same escaping rules as coreutils: names containing a backslash,
+    # newline or carriage return are escaped and the line is prefixed
+    # with a backslash
+    if "\\" in path or "\n" in path or "\r" in path:
+        return "\\", path.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "\\r")
+    return "", path
+
+
+def _unescape_path(path: str) -> str:
+    out = []
+    i = 0
+    while i < len(path):
+        if path[i] == "\\" and i + 1 < len(path):
+            out.append(_UNESCAPES.get(path[i + 1], path[i + 1]))
+            i += 2
+        else:
+            out.append(path[i])
+            i += 1
+    return "".join(out)
+
+
+def format_manifest_line(digest: str, path: str) -> str:
+    prefix, escaped = _escape_path(path)
+    return f"{prefix}{digest}  {escaped}\n"
+
+
+def parse_manifest(manifest_path: str) -> Iterator[tuple]:
+    """Yield (digest, relative path) pairs from a sha256sum-style manifest"""
+    with open(manifest_path, "r", encoding="utf-8", newline="\n") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.rstrip("\n").rstrip("\r")
+            if not line.strip() or line.startswith("#"):
+                continue
+            escaped = line.startswith("\\")
+            if escaped:
+                line = line[1:]
+            digest, sep, path = line.partition(" ")
+            if not sep or not path:
+                raise ValueError(f"Malformed manifest line {line_no}")
+            # Second separator character is ' ' (text mode) or '*' (binary mode)
+            path = path[1:] if path[0] in " *" else path
+            yield digest.lower(), _unescape_path(path) if escaped else path
+
+
+def iter_tree_files(root: str, exclude: Optional[set] = None) -> Iterator[str]:
+    """Yield paths (relative to root, '/' separated) of every regular file under root"""
+    exclude = {os.path.abspath(p) for p in (exclude or ())}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            full = os.path.join(dirpath, name)
+            if os.path.abspath(full) in exclude or not os.path.isfile(full):
+                continue
+            yield os.path.relpath(full, root).replace(os.sep, "/")
+
+
+def _run_pool(items: Iterator, work: Callable, on_result: Callable, workers: int):
+    """Run work(item) on a thread pool with a bounded number of in-flight items"""
+    max_in_flight = workers * 4
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+        for item in items:
+            pending[pool.submit(work, item)] = item
+            if len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    on_result(pending.pop(future), future)
+        # Completion order, so one large file does not hold back the rest;
+        # callers sort when they write
+        for future in as_completed(list(pending)):
+            on_result(pending.pop(future), future)
+
+
+def _digest_function(algorithm: str, use_cache: bool) -> Callable:
+    if use_cache:
+        cache = get_hash_cache()
+        return lambda path: cache.get_file_digest(path, algorithm)
+    return lambda path: hash_file(path, [algorithm])[algorithm]
+
+
+def hash_tree(root: str, algorithm: str = "sha256", manifest_path: Optional[str] = None,
+              workers: int = DEFAULT_WORKERS, use_cache: bool = True,
+              progress: Optional[Callable[[dict], None]] = None) -> dict:
+    """
+    Hash every file under root concurrently
+
+    Args:
+        root: Directory to walk
+        algorithm: Hash algorithm
+        manifest_path: If given, write a sorted sha256sum-compatible manifest here
+        workers: Number of hashing threads
+        use_cache: Serve unchanged files from the persistent hash cache
+        progress: Called with one record per file as it completes
+
+    Returns:
+        Summary with file, byte and error counts
+    """
+    if not os.path.isdir(root):
+        raise ValueError(f"Not a directory: {root}")
+    algorithm = normalize_algorithm(algorithm)
+    digest_of = _digest_function(algorithm, use_cache)
+    exclude = {manifest_path} if manifest_path else None
+
+    entries = []
+    summary = {"files": 0, "bytes": 0, "errors": 0}
+
+    def work(rel_path):
+        full = os.path.join(root, rel_path)
+        return digest_of(full), os.path.getsize(full)
+
+    def on_result(rel_path, future):
+        try:
+            digest, size = future.result()
+        except Exception as e:
+            summary["errors"] += 1
+            record = {"type": "error", "path": rel_path, "message": str(e)}
+        else:
+            entries.append((rel_path, digest))
+            summary["files"] += 1
+            summary["bytes"] += size
+            record = {"type": "file", "path": rel_path, "hash": digest, "bytes": size}
+        if progress:
+            progress(record)
+
+    try:
+        _run_pool(iter_tree_files(root, exclude), work, on_result, workers)
+    finally:
+        if use_cache:
+            get_hash_cache().flush()
+
+    if manifest_path:
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            for rel_path, digest in sorted(entries):
+                f.write(format_manifest_line(digest, rel_path))
+        os.replace(tmp_path, manifest_path)
+
+    summary["algorithm"] = algorithm
+    summary["manifest"] = manifest_path
+    return summary
+
+
+def verify_manifest(manifest_path: str, root: Optional[str] = None, algorithm: str = "sha256",
+                    workers: int = DEFAULT_WORKERS, use_cache: bool = True,
+                    progress: Optional[Callable[[dict], None]] = None) -> dict:
+    """
+    Check every entry of a manifest concurrently
+
+    Args:
+        manifest_path: sha256sum-style manifest
+        root: Directory the manifest paths are relative to (default: the manifest's directory)
+        algorithm: Hash algorithm the manifest was written with
+        workers: Number of hashing threads
+        use_cache: Serve unchanged files from the persistent hash cache
+        progress: Called with one record per entry as it completes
+
+    Returns:
+        Summary with ok/failed/missing counts and overall validity
+    """
+    algorithm = normalize_algorithm(algorithm)
+    root = root or os.path.dirname(os.path.abspath(manifest_path))
+    digest_of = _digest_function(algorithm, use_cache)
+    summary = {"ok": 0, "failed": 0, "missing": 0}
+
+    def work(entry):
+        _, rel_path = entry
+        full = os.path.join(root, rel_path)
+        if not os.path.isfile(full):
+            return None
+        return digest_of(full)
+
+    def on_result(entry, future):
+        expected, rel_path = entry
+        try:
+            actual = future.result()
+        except Exception as e:
+            summary["failed"] += 1
+            record = {"type": "file", "path": rel_path, "status": "FAILED", "message": str(e)}
+        else:
+            if actual is None:
+                status = "MISSING"
+                summary["missing"] += 1
+            elif actual == expected:
+                status = "OK"
+                summary["ok"] += 1
+            else:
+                status = "FAILED"
+                summary["failed"] += 1
+            record = {"type": "file", "path": rel_path, "status": status}
+        if progress:
+            progress(record)
+
+    try:
+        _run_pool(parse_manifest(manifest_path), work, on_result, workers)
+    finally:
+        if use_cache:
+            get_hash_cache().flush()
+
+    summary["algorithm"] = algorithm
+    summary["valid"] = summary["failed"] == 0 and summary["missing"] == 0
+    return summary
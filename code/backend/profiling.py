@@ -0,0 +1,149 @@
+"""
+CPU and memory profiling hooks for the StegoCrypt Suite CLI
+
+Wraps a single command in cProfile or tracemalloc and writes the report
+under the logs directory, so a slow or memory-hungry run reported from
+the field can be examined afterwards (e.g. with `python -m pstats` or
+snakeviz for .prof files).
+"""
+
+import cProfile
+import os
+import pstats
+import threading
+import tracemalloc
+from datetime import datetime
+from typing import Callable
+
+from logs import LOG_DIR
+
+PROFILE_DIR = os.path.join(LOG_DIR, "profiles")
+PROFILE_MODES = ("cpu", "mem")
+# Number of reports kept; older ones are deleted when a new one is written
+PROFILE_RETENTION = 50
+TRACEMALLOC_FRAMES = 25
+TOP_ALLOCATIONS = 30
+# Traced memory is sampled at this interval while a command runs, and a new
+# snapshot is taken whenever it has grown by PEAK_SNAPSHOT_GROWTH since the
+# last one, so the report shows what was held near the peak and not only
+# what survived to exit
+PEAK_SAMPLE_SECONDS = 0.01
+PEAK_SNAPSHOT_GROWTH = 1.1
+
+
+def _report_path(label: str, extension: str) -> str:
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+    safe_label = "".join(c if c.isalnum() or c in "-_" else "_" for c in label) or "command"
+    return os.path.join(PROFILE_DIR, f"{safe_label}-{stamp}-{os.getpid()}{extension}")
+
+
+def _prune_reports():
+    reports = sorted(
+        (entry for entry in os.scandir(PROFILE_DIR) if entry.is_file()),
+        key=lambda entry: entry.stat().st_mtime,
+    )
+    for entry in reports[:-PROFILE_RETENTION] if PROFILE_RETENTION else []:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _profile_cpu(label: str, func: Callable, *args) -> tuple:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = func(*args)
+    finally:
+        profiler.disable()
+        path = _report_path(label, ".prof")
+        profiler.dump_stats(path)
+
+    stats = pstats.Stats(path)
+    summary = {
+        "total_seconds": round(stats.total_tt, 6),
+        "function_calls": stats.total_calls,
+    }
+    return result, path, summary
+
+
+def _sample_peak(stop: threading.Event, state: dict):
+    while not stop.wait(PEAK_SAMPLE_SECONDS):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > state["bytes"] * PEAK_SNAPSHOT_GROWTH:
+            state["snapshot"] = tracemalloc.take_snapshot()
+            state["bytes"] = current
+
+
+def _top_allocations(snapshot) -> list:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    return snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+
+
+def _write_allocations(f, title: str, top: list):
+    f.write(f"Top {len(top)} allocation sites {title} (by size):\n")
+    for stat in top:
+        f.write(f"{stat}\n")
+    if top:
+        f.write(f"\nTraceback of the largest allocation site {title}:\n")
+        f.write("\n".join(top[0].traceback.format()) + "\n")
+
+
+def _profile_memory(label: str, func: Callable, *args) -> tuple:
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    tracemalloc.reset_peak()
+    peak_state = {"bytes": tracemalloc.get_traced_memory()[0], "snapshot": None}
+    stop = threading.Event()
+    sampler = threading.Thread(target=_sample_peak, args=(stop, peak_state), daemon=True)
+    sampler.start()
+    try:
+        result = func(*args)
+    finally:
+        stop.set()
+        sampler.join()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if not already_tracing:
+            tracemalloc.stop()
+
+    # Memory still growing at exit is its own peak snapshot
+    if peak_state["snapshot"] is None or current >= peak_state["bytes"]:
+        peak_state.update(bytes=current, snapshot=snapshot)
+    path = _report_path(label, ".txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"command: {label}\n")
+        f.write(f"peak_bytes: {peak}\n")
+        f.write(f"peak_snapshot_bytes: {peak_state['bytes']}\n")
+        f.write(f"retained_bytes: {current}\n\n")
+        _write_allocations(f, "near the peak", _top_allocations(peak_state["snapshot"]))
+        f.write("\n")
+        _write_allocations(f, "still held at exit", _top_allocations(snapshot))
+
+    summary = {"peak_bytes": peak, "peak_snapshot_bytes": peak_state["bytes"], "retained_bytes": current}
+    return result, path, summary
+
+
+def run_profiled(mode: str, label: str, func: Callable, *args) -> tuple:
+    """
+    Call func(*args) under the given profiler
+
+    Args:
+        mode: "cpu" (cProfile, .prof report) or "mem" (tracemalloc, text report)
+        label: Name used in the report file name, usually the command
+        func: Function to profile
+
+    Returns:
+        (func's result, profile info dict with mode, report path and summary)
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unsupported profile mode: {mode}. Supported: {', '.join(PROFILE_MODES)}")
+    runner = _profile_cpu if mode == "cpu" else _profile_memory
+    result, path, summary = runner(label, func, *args)
+    _prune_reports()
+    return result, {"mode": mode, "report": path, **summary}
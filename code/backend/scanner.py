@@ -0,0 +1,221 @@
+"""
+Stego presence scanner for StegoCrypt Suite
+
+Finds covers that already carry a payload by probing only the start of
+the hidden bit stream, instead of running the decoders to completion:
+
+    image  LSBs of the first pixels (PNG scanlines are inflated only as
+           far as needed), checked for text ending in the "*^*^*" delimiter
+    audio  LSBs of the first WAV frames, checked for text ending in "###"
+    video  LSBs of the first frame: the 32-bit length header followed by
+           a printable payload
+    text   the first zero-width runs: a binary header or legacy codes
+
+A payload is reported when the probed characters are printable ASCII up
+to the delimiter, or for the whole probe when the payload is longer.
+Base64 ciphertext always is; random LSBs pass with probability ~0.37**n.
+"""
+
+import os
+import struct
+import wave
+import zlib
+from functools import partial
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+
+from capacity import CARRIER_EXTENSIONS, carrier_for_path, iter_carrier_files
+from manifest import DEFAULT_WORKERS, _run_pool
+from steganography.text_stego import detect_text_payload
+from utilities.text_utils import add_delimiter
+
+# Characters of hidden text examined per carrier (8 LSBs each)
+PROBE_CHARS = 48
+IMAGE_DELIMITER = add_delimiter("")
+AUDIO_DELIMITER = "###"
+VIDEO_HEADER_BYTES = 4
+TEXT_PROBE_CHARS = 64 * 1024
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Color type -> bytes per pixel, for 8-bit RGB and RGBA
+PNG_BYTES_PER_PIXEL = {2: 3, 6: 4}
+# encode_image writes PNG and encode_audio WAV; lossy formats cannot hold LSBs
+SCAN_EXTENSIONS = {**CARRIER_EXTENSIONS, "image": {".png", ".bmp", ".tif", ".tiff"}, "audio": {".wav"}}
+
+
+def _lsb_bytes(values: np.ndarray) -> bytes:
+    return np.packbits(np.bitwise_and(values, 1)).tobytes()
+
+
+def _classify_delimited(hidden: bytes, delimiter: str) -> dict:
+    """Result for a probe of delimiter-terminated hidden text"""
+    chars = hidden.decode("latin-1")
+    end = chars.find(delimiter)
+    body = chars if end < 0 else chars[:end]
+    if body and body.isascii() and body.isprintable() and (end > 0 or len(body) >= PROBE_CHARS):
+        return {"detected": True, "signature": "delimiter" if end > 0 else "printable_prefix",
+                "payload_bytes": end if end > 0 else None}
+    return {"detected": False}
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _png_channel_prefix(path: str, count: int) -> Optional[np.ndarray]:
+    """
+    First count R, G, B values of an 8-bit non-interlaced RGB/RGBA PNG,
+    inflating only the scanlines that hold them; None for other PNGs.
+    """
+    with open(path, "rb") as f:
+        if f.read(8) != PNG_SIGNATURE:
+            return None
+        length, chunk_type = struct.unpack(">I4s", f.read(8))
+        if chunk_type != b"IHDR":
+            return None
+        width, height, depth, color, _, _, interlace = struct.unpack(">IIBBBBB", f.read(13))
+        f.read(4)
+        if depth != 8 or interlace or color not in PNG_BYTES_PER_PIXEL:
+            return None
+
+        bpp = PNG_BYTES_PER_PIXEL[color]
+        stride = width * bpp
+        pixels = -(-count // 3)
+        rows = min(height, -(-pixels // width))
+        # Each row is needed only as far as the last pixel probed in any row
+        prefix = min(stride, pixels * bpp)
+        needed = (rows - 1) * (stride + 1) + 1 + prefix
+
+        inflate = zlib.decompressobj()
+        raw = b""
+        while len(raw) < needed:
+            header = f.read(8)
+            if len(header) < 8:
+                break
+            length, chunk_type = struct.unpack(">I4s", header)
+            if chunk_type == b"IEND":
+                break
+            if chunk_type != b"IDAT":
+                f.seek(length + 4, os.SEEK_CUR)
+                continue
+            raw += inflate.decompress(f.read(length), needed - len(raw))
+            f.read(4)
+
+    previous = bytearray(prefix)
+    values = []
+    for row in range(rows):
+        start = row * (stride + 1)
+        filter_type, line = raw[start], bytearray(raw[start + 1:start + 1 + prefix])
+        if len(line) < prefix:
+            break
+        for i in range(prefix):
+            left = line[i - bpp] if i >= bpp else 0
+            if filter_type == 1:
+                line[i] = (line[i] + left) & 0xFF
+            elif filter_type == 2:
+                line[i] = (line[i] + previous[i]) & 0xFF
+            elif filter_type == 3:
+                line[i] = (line[i] + ((left + previous[i]) >> 1)) & 0xFF
+            elif filter_type == 4:
+                up_left = previous[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + _paeth(left, previous[i], up_left)) & 0xFF
+        values.append(np.frombuffer(bytes(line), dtype=np.uint8).reshape(-1, bpp)[:width, :3].ravel())
+        previous = line
+    return np.concatenate(values)[:count] if values else np.empty(0, dtype=np.uint8)
+
+
+def probe_image(path: str) -> dict:
+    count = PROBE_CHARS * 8
+    values = _png_channel_prefix(path, count)
+    if values is None:
+        from PIL import Image
+
+        with Image.open(path) as img:
+            values = np.asarray(img.convert("RGB")).reshape(-1)[:count]
+    return _classify_delimited(_lsb_bytes(values), IMAGE_DELIMITER)
+
+
+def probe_audio(path: str) -> dict:
+    with wave.open(path, "rb") as song:
+        frame_size = song.getsampwidth() * song.getnchannels()
+        frames = song.readframes(-(-PROBE_CHARS * 8 // frame_size))
+    return _classify_delimited(_lsb_bytes(np.frombuffer(frames, dtype=np.uint8)), AUDIO_DELIMITER)
+
+
+def probe_video(path: str) -> dict:
+    import cv2
+
+    cap = cv2.VideoCapture(path)
+    try:
+        if not cap.isOpened():
+            raise IOError("Unable to open video.")
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        ret, frame = cap.read()
+    finally:
+        cap.release()
+    if not ret:
+        raise IOError("Unable to read the first video frame.")
+
+    flat = frame.reshape(-1)
+    hidden = _lsb_bytes(flat[:(VIDEO_HEADER_BYTES + PROBE_CHARS) * 8])
+    (length,) = struct.unpack(">I", hidden[:VIDEO_HEADER_BYTES])
+    capacity = max(frame_count, 1) * flat.size // 8 - VIDEO_HEADER_BYTES
+    body = hidden[VIDEO_HEADER_BYTES:VIDEO_HEADER_BYTES + min(length, PROBE_CHARS)]
+    if 0 < length <= capacity and body.isascii() and body.decode("ascii").isprintable():
+        return {"detected": True, "signature": "length_header", "payload_bytes": length}
+    return {"detected": False}
+
+
+def probe_text(path: str) -> dict:
+    with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+        found = detect_text_payload(f.read(TEXT_PROBE_CHARS))
+    if found is None:
+        return {"detected": False}
+    return {"detected": True, "signature": f"text_{found.pop('mode')}", **found}
+
+
+PROBES = {"image": probe_image, "audio": probe_audio, "video": probe_video, "text": probe_text}
+
+
+def probe_carrier(path: str, carrier: Optional[str] = None) -> dict:
+    """
+    Check whether one cover already carries a StegoCrypt payload
+
+    Returns:
+        carrier, detected and, for detected payloads, the signature that
+        matched and the payload length when it is known from the probe
+    """
+    carrier = carrier or carrier_for_path(path, SCAN_EXTENSIONS)
+    if carrier not in PROBES:
+        raise ValueError(f"Cannot tell the carrier type of {os.path.basename(path)}; pass a carrier")
+    return {"carrier": carrier, **PROBES[carrier](path)}
+
+
+def scan_carriers(paths: Iterable[str], carrier: Optional[str] = None, workers: int = DEFAULT_WORKERS,
+                  progress: Optional[Callable[[dict], None]] = None) -> dict:
+    """
+    Probe files and directory trees of covers concurrently
+
+    Returns:
+        Summary with file, detected and error counts
+    """
+    summary = {"files": 0, "detected": 0, "errors": 0}
+
+    def on_result(path, future):
+        try:
+            record = {"type": "carrier", "path": path, **future.result()}
+            summary["files"] += 1
+            summary["detected"] += record["detected"]
+        except Exception as e:
+            summary["errors"] += 1
+            record = {"type": "error", "path": path, "message": str(e)}
+        if progress:
+            progress(record)
+
+    _run_pool(iter_carrier_files(paths, carrier, SCAN_EXTENSIONS), partial(probe_carrier, carrier=carrier),
+              on_result, workers)
+    return summary
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Keep-alive load test for the StegoCrypt Suite local HTTP service.
+Reports requests per second and latency percentiles for small encrypt and
+hash calls, each client reusing one connection for all of its requests.
+
+Without --url an in-process server is started on a free loopback port.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import http.client
+from pathlib import Path
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+OPERATIONS = {
+    "encrypt": ("/v1/commands/encrypt", {"method": "AES", "message": "load test payload", "password": "load-test"}),
+    "hash": ("/v1/commands/hash", {"message": "load test payload", "algorithm": "sha256"}),
+}
+
+
+def percentile(sorted_values, quantile):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(quantile * len(sorted_values)))
+    return round(sorted_values[index] * 1000, 3)
+
+
+def client(host, port, token, path, body, deadline, results):
+    """Send requests over one keep-alive connection until the deadline."""
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    payload = json.dumps(body)
+    latencies, errors, connects = [], 0, 1
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            connection.request("POST", path, payload, headers)
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                errors += 1
+            if response.will_close:
+                connection.close()
+                connects += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            connects += 1
+            continue
+        latencies.append(time.perf_counter() - start)
+    connection.close()
+    results.append((latencies, errors, connects))
+
+
+def run_load(host, port, token, operation, connections, duration):
+    """Run one operation from several clients at once and summarize it."""
+    path, body = OPERATIONS[operation]
+    results = []
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=client, args=(host, port, token, path, body, deadline, results))
+        for _ in range(connections)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(value for result in results for value in result[0])
+    return {
+        "operation": operation,
+        "connections": connections,
+        "requests": len(latencies),
+        "errors": sum(result[1] for result in results),
+        "connects": sum(result[2] for result in results),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+    }
+
+
+def main():
+    """Main load test function."""
+    parser = argparse.ArgumentParser(description="StegoCrypt Suite HTTP keep-alive load test")
+    parser.add_argument("--url", help="Running server (default: start one in-process)")
+    parser.add_argument("--token", default=os.environ.get("STEGOCRYPT_HTTP_TOKEN"),
+                        help="Bearer token of the running server (default: $STEGOCRYPT_HTTP_TOKEN)")
+    parser.add_argument("--operation", choices=["all", *OPERATIONS], default="all")
+    parser.add_argument("--connections", type=int, default=4, help="Concurrent keep-alive clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per operation")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        if not args.token:
+            parser.error("--token (or STEGOCRYPT_HTTP_TOKEN) is required with --url")
+        parts = urlsplit(args.url)
+        host, port, token = parts.hostname, parts.port or 80, args.token
+    else:
+        from http_server import create_server
+        server = create_server(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        (host, port), token = server.server_address[:2], server.token
+
+    operations = list(OPERATIONS) if args.operation == "all" else [args.operation]
+    try:
+        for operation in operations:
+            print(json.dumps(run_load(host, port, token, operation, args.connections, args.duration)), flush=True)
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
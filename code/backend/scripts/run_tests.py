@@ -9,6 +9,9 @@ import subprocess
 import argparse
 from pathlib import Path
 
+# Saved benchmark runs (JSON), compared against on each benchmark run
+BENCHMARK_STORAGE = Path(__file__).parent.parent / "tests" / "benchmarks" / "baselines"
+
 
 def run_command(cmd, description):
     """Run a command and handle errors."""
@@ -33,12 +36,14 @@ def run_command(cmd, description):
 def main():
     """Main test runner function."""
     parser = argparse.ArgumentParser(description="StegoCrypt Suite Test Runner")
-    parser.add_argument("--type", choices=["all", "crypto", "stego", "unit", "integration"], 
+    parser.add_argument("--type", choices=["all", "crypto", "stego", "unit", "integration", "benchmark"], 
                        default="all", help="Type of tests to run")
     parser.add_argument("--coverage", action="store_true", help="Generate coverage report")
     parser.add_argument("--html", action="store_true", help="Generate HTML coverage report")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--fast", action="store_true", help="Skip slow tests")
+    parser.add_argument("--regression-threshold", type=float, default=15.0,
+                       help="Benchmarks: fail if a median time regresses by more than this percentage")
     
     args = parser.parse_args()
     
@@ -74,6 +79,19 @@ def main():
         cmd.extend(["-m", "unit"])
     elif args.type == "integration":
         cmd.extend(["-m", "integration"])
+    elif args.type == "benchmark":
+        # Save this run as a new baseline and fail on regressions against the last one
+        cmd.extend([
+            str(BENCHMARK_STORAGE.parent),
+            "--benchmark-only",
+            f"--benchmark-storage=file://{BENCHMARK_STORAGE}",
+            "--benchmark-autosave",
+        ])
+        if BENCHMARK_STORAGE.exists() and any(BENCHMARK_STORAGE.rglob("*.json")):
+            cmd.extend([
+                "--benchmark-compare",
+                f"--benchmark-compare-fail=median:{args.regression_threshold}%",
+            ])
     
     # Run tests
     success = run_command(cmd, "Running tests")
@@ -3,6 +3,7 @@ import wave
 import os
 from pydub import AudioSegment
 from pydub.utils import which
+from utilities.timing import phase, record_size
 
 AudioSegment.converter = which("ffmpeg")
 AudioSegment.ffprobe = which("ffprobe")
@@ -17,23 +18,27 @@ def convert_to_wav(input_file):
     return input_file
 
 def encode_audio(input_file, message):
-    wav_file = convert_to_wav(input_file)
+    with phase("load_carrier"):
+        record_size("carrier_bytes", os.path.getsize(input_file))
+        wav_file = convert_to_wav(input_file)
     
     try:
         with wave.open(wav_file, mode='rb') as song:
-            frame_bytes = bytearray(list(song.readframes(song.getnframes())))
+            with phase("load_carrier"):
+                frame_bytes = bytearray(list(song.readframes(song.getnframes())))
             message += '###'
             bits = ''.join([format(ord(i), '08b') for i in message])
 
             if len(bits) > len(frame_bytes):
                 raise ValueError("Message too long to encode in this audio.")
 
-            for i, bit in enumerate(bits):
-                frame_bytes[i] = (frame_bytes[i] & 254) | int(bit)
+            with phase("embed"):
+                for i, bit in enumerate(bits):
+                    frame_bytes[i] = (frame_bytes[i] & 254) | int(bit)
 
-            modified_frames = bytes(frame_bytes)
+                modified_frames = bytes(frame_bytes)
 
-            with BytesIO() as buffer:
+            with phase("serialize"), BytesIO() as buffer:
                 with wave.open(buffer, 'wb') as fd:
                     fd.setparams(song.getparams())
                     fd.writeframes(modified_frames)
@@ -1,15 +1,19 @@
+import os
 from io import BytesIO
 from PIL import Image
 from utilities.text_utils import text_to_bin, add_delimiter
+from utilities.timing import phase, record_size
 from validation.inputs import non_empty_string
 from validation.media import ensure_image_capacity
 
 def encode_image(image_path, secret_message):
-    img = Image.open(image_path)
+    with phase("load_carrier"):
+        record_size("carrier_bytes", os.path.getsize(image_path))
+        img = Image.open(image_path)
 
-    if img.mode != 'RGB':
-        img = img.convert('RGB')
-    pixels = img.load()
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        pixels = img.load()
     width, height = img.size
 
     non_empty_string(secret_message, "secret message")
@@ -18,24 +22,26 @@ def encode_image(image_path, secret_message):
     data_len = len(binary_data)
     ensure_image_capacity(data_len, width, height)
 
-    data_index = 0
-    for y in range(height):
-        for x in range(width):
+    with phase("embed"):
+        data_index = 0
+        for y in range(height):
+            for x in range(width):
+                if data_index >= data_len:
+                    break
+                r, g, b = pixels[x, y]
+                if data_index < data_len:
+                    r = (r & ~1) | int(binary_data[data_index]); data_index += 1
+                if data_index < data_len:
+                    g = (g & ~1) | int(binary_data[data_index]); data_index += 1
+                if data_index < data_len:
+                    b = (b & ~1) | int(binary_data[data_index]); data_index += 1
+                pixels[x, y] = (r, g, b)
             if data_index >= data_len:
                 break
-            r, g, b = pixels[x, y]
-            if data_index < data_len:
-                r = (r & ~1) | int(binary_data[data_index]); data_index += 1
-            if data_index < data_len:
-                g = (g & ~1) | int(binary_data[data_index]); data_index += 1
-            if data_index < data_len:
-                b = (b & ~1) | int(binary_data[data_index]); data_index += 1
-            pixels[x, y] = (r, g, b)
-        if data_index >= data_len:
-            break
-
-    buffer = BytesIO()
-    img.save(buffer, format="PNG")
+
+    with phase("serialize"):
+        buffer = BytesIO()
+        img.save(buffer, format="PNG")
     return buffer.getvalue()  # return PNG bytes
 
 
@@ -1,5 +1,8 @@
 import os
+import re
 import sys
+from functools import partial
+from typing import Iterable, Iterator, Optional, Tuple
 
 # Ensure Backend is on sys.path for local script execution
 BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -8,108 +11,385 @@ if BACKEND_DIR not in sys.path:
 
 from validation.inputs import non_empty_string
 from validation.media import ensure_text_capacity
+from validation.errors import CapacityError, ValidationError
 
-def encode_text_data(secret_message: str, cover_text: str) -> str:
+# Each bit pair is hidden as one zero-width character
+ZWC = {"00": "\u200C", "01": "\u202C", "11": "\u202D", "10": "\u200E"}
+ZWC_reverse = {zwc: bits for bits, zwc in ZWC.items()}
+# Each message character is 12 bits (a 4-bit type tag and a shifted 8-bit
+# code), i.e. six zero-width characters appended to one cover word
+BITS_PER_CHAR = 12
+ZWC_PER_CHAR = BITS_PER_CHAR // 2
+TERMINATOR_BITS = "1" * BITS_PER_CHAR
+
+
+def _to_zwc(bits: str) -> str:
+    return "".join(ZWC[bits[i:i + 2]] for i in range(0, len(bits), 2))
+
+
+def _build_tables():
+    encode = {}
+    decode = {}
+    for data in range(256):
+        # Type 0110: code - 48 (characters outside 32..64)
+        decode[_to_zwc("0110" + format(data, "08b"))] = chr(data + 48)
+        # Type 0011: code + 48 (characters 32..64)
+        if data >= 48:
+            decode[_to_zwc("0011" + format(data, "08b"))] = chr(data - 48)
+    for code in range(32, 304):
+        tagged = "0011" + format(code + 48, "08b") if code <= 64 else "0110" + format(code - 48, "08b")
+        encode[code] = _to_zwc(tagged)
+    return encode, decode
+
+
+# ord(char) -> six-ZWC sequence, for str.translate; and the reverse
+_ENCODE_TABLE, _DECODE_TABLE = _build_tables()
+TERMINATOR = _to_zwc(TERMINATOR_BITS)
+_ZWC_RUN = re.compile("[" + "".join(ZWC_reverse) + "]+")
+_ZWC_GROUP = re.compile(".{%d}" % ZWC_PER_CHAR, re.DOTALL)
+
+# Binary payload mode: a magic byte, the payload length (4 bytes, big
+# endian) and the payload bytes, written 2 or 3 bits per zero-width symbol
+# and spread over a configurable number of symbols per word. The stream
+# starts with one symbol naming the bits per symbol. The alphabet shares
+# no characters with the legacy one, so decode_text_data tells them apart,
+# and leaves out ZWSP, ZWJ and WJ, which occur in emoji sequences and in
+# Indic, Thai and Khmer text.
+TEXT_MODES = ("legacy", "binary")
+BINARY_ALPHABET = "\u2061\u2062\u2063\u2064\u206A\u206B\u206C\u206D"
+BINARY_MAGIC = b"\xb7"
+BINARY_HEADER_BYTES = len(BINARY_MAGIC) + 4
+SUPPORTED_SYMBOL_BITS = (2, 3)
+DEFAULT_SYMBOL_BITS = 3
+DEFAULT_SYMBOLS_PER_WORD = 12
+
+# Hex digit -> two 2-bit symbols; octal digit -> one 3-bit symbol
+_HEX_TO_SYMBOLS = str.maketrans({format(v, "x"): BINARY_ALPHABET[v >> 2] + BINARY_ALPHABET[v & 3] for v in range(16)})
+_OCTAL_TO_SYMBOLS = str.maketrans({str(v): BINARY_ALPHABET[v] for v in range(8)})
+_SYMBOLS_TO_DIGITS = str.maketrans({symbol: str(v) for v, symbol in enumerate(BINARY_ALPHABET)})
+_BINARY_RUN = re.compile("[" + BINARY_ALPHABET + "]+")
+
+# Streaming: cover files are read in chunks; hidden characters of either
+# mode are collected run by run while decoding
+TEXT_CHUNK_SIZE = 1024 * 1024
+_WORD = re.compile(r"\S+")
+_HIDDEN_RUN = re.compile("[" + "".join(ZWC_reverse) + BINARY_ALPHABET + "]+")
+# A binary header is 1 mode symbol and at most 20 header symbols
+_BINARY_HEAD_SYMBOLS = 1 + BINARY_HEADER_BYTES * 4
+
+
+def _bytes_to_symbols(data: bytes, bits: int) -> str:
+    if bits == 2:
+        return data.hex().translate(_HEX_TO_SYMBOLS)
+    count = -(-len(data) * 8 // bits)
+    value = int.from_bytes(data, "big") << (count * bits - len(data) * 8)
+    return format(value, "o").zfill(count).translate(_OCTAL_TO_SYMBOLS)
+
+
+def _symbols_to_bytes(symbols: str, bits: int, length: int) -> bytes:
+    # Raises ValueError if a symbol is outside the 2**bits alphabet
+    value = int(symbols.translate(_SYMBOLS_TO_DIGITS), 1 << bits)
+    return (value >> (len(symbols) * bits - length * 8)).to_bytes(length, "big")
+
+
+def _binary_groups(payload: bytes, bits_per_symbol: int, symbols_per_word: int) -> Tuple[list, int, int]:
+    if bits_per_symbol not in SUPPORTED_SYMBOL_BITS:
+        raise ValueError(f"bits_per_symbol must be one of {SUPPORTED_SYMBOL_BITS}")
+    if symbols_per_word < 1:
+        raise ValueError("symbols_per_word must be at least 1")
+    if len(payload) >= 1 << 32:
+        raise ValueError("Payload too large for text steganography")
+
+    framed = BINARY_MAGIC + len(payload).to_bytes(4, "big") + payload
+    symbols = BINARY_ALPHABET[bits_per_symbol] + _bytes_to_symbols(framed, bits_per_symbol)
+    groups = re.findall(".{1,%d}" % symbols_per_word, symbols, re.DOTALL)
+    return groups, len(symbols) * bits_per_symbol, bits_per_symbol * symbols_per_word
+
+
+def _legacy_groups(secret_message: str) -> Tuple[list, int, int]:
+    # Map every character to its six zero-width characters in one pass;
+    # characters without a mapping are left as-is, which shows up as a
+    # length mismatch
+    encoded = secret_message.translate(_ENCODE_TABLE)
+    if len(encoded) != len(secret_message) * ZWC_PER_CHAR:
+        unsupported = next(c for c in secret_message if ord(c) not in _ENCODE_TABLE)
+        raise ValueError(f"Character {unsupported!r} cannot be hidden in text (supported: U+0020 to U+012F)")
+    encoded += TERMINATOR
+    return _ZWC_GROUP.findall(encoded), len(encoded) * 2, BITS_PER_CHAR
+
+
+def _hidden_groups(secret_message: str, mode: str, bits_per_symbol: int, symbols_per_word: int) -> Tuple[list, int, int]:
+    """Return the zero-width group for each cover word, the bits needed and the bits per word"""
+    non_empty_string(secret_message, "secret_message")
+    if mode == "binary":
+        return _binary_groups(secret_message.encode("utf-8"), bits_per_symbol, symbols_per_word)
+    if mode != "legacy":
+        raise ValueError(f"Unsupported text mode: {mode}. Supported: {', '.join(TEXT_MODES)}")
+    return _legacy_groups(secret_message)
+
+
+def _append_to_words(words: list, groups: list) -> str:
+    # One group per word, then the rest of the cover
+    return " ".join([*map(str.__add__, words, groups), *words[len(groups):]])
+
+
+def _binary_header(symbols: str) -> Optional[Tuple[int, int]]:
+    """Return (bits per symbol, framed byte length) if symbols start a binary payload"""
+    bits = BINARY_ALPHABET.find(symbols[:1])
+    if bits not in SUPPORTED_SYMBOL_BITS:
+        return None
+    header_symbols = -(-BINARY_HEADER_BYTES * 8 // bits)
+    if len(symbols) < 1 + header_symbols:
+        return None
+    try:
+        header = _symbols_to_bytes(symbols[1:1 + header_symbols], bits, BINARY_HEADER_BYTES)
+    except ValueError:
+        return None
+    if not header.startswith(BINARY_MAGIC):
+        return None
+    return bits, BINARY_HEADER_BYTES + int.from_bytes(header[len(BINARY_MAGIC):], "big")
+
+
+def _ensure_clean_cover(cover_text: str):
+    # Hidden characters already in the cover would be read back as payload
+    match = _HIDDEN_RUN.search(cover_text)
+    if match:
+        raise ValidationError(f"Cover text already contains hidden character U+{ord(match.group()[0]):04X}; "
+                              "remove it before encoding")
+
+
+def _binary_symbol_count(bits: int, length: int) -> int:
+    # Mode symbol plus the framed bytes
+    return 1 + -(-length * 8 // bits)
+
+
+def encode_text_bytes(payload: bytes, cover_text: str, bits_per_symbol: int = DEFAULT_SYMBOL_BITS,
+                      symbols_per_word: int = DEFAULT_SYMBOLS_PER_WORD) -> str:
     """
-    Encodes a secret message into a cover text using Zero-Width Characters.
+    Hides arbitrary bytes in a cover text (binary payload mode).
     """
-    non_empty_string(secret_message, "secret_message")
     non_empty_string(cover_text, "cover_text")
+    _ensure_clean_cover(cover_text)
+    groups, required_bits, bits_per_word = _binary_groups(payload, bits_per_symbol, symbols_per_word)
+    words = cover_text.split()
+    ensure_text_capacity(required_bits, len(words), bits_per_word)
+    return _append_to_words(words, groups)
 
-    # 1. Convert secret message to binary representation
-    add = ''
-    for char in secret_message:
-        t = ord(char)
-        if 32 <= t <= 64:
-            t1 = t + 48
-            res = bin(t1)[2:].zfill(8)
-            add += "0011" + res
-        else:
-            t1 = t - 48
-            res = bin(t1)[2:].zfill(8)
-            add += "0110" + res
-    
-    binary_string = add + "111111111111"  # Add terminator
-    binary_len = len(binary_string)
-
-    # 2. Prepare cover text and check capacity
+
+def decode_text_bytes(stego_text: str) -> Optional[bytes]:
+    """
+    Extracts a binary-mode payload, or returns None if the text has none.
+    """
+    symbols = "".join(_BINARY_RUN.findall(stego_text))
+    header = _binary_header(symbols)
+    if header is None:
+        return None
+    bits, length = header
+    needed = _binary_symbol_count(bits, length)
+    if len(symbols) < needed:
+        return None
+    try:
+        return _symbols_to_bytes(symbols[1:needed], bits, length)[BINARY_HEADER_BYTES:]
+    except ValueError:
+        return None
+
+
+def encode_text_data(secret_message: str, cover_text: str, mode: str = "legacy",
+                     bits_per_symbol: int = DEFAULT_SYMBOL_BITS,
+                     symbols_per_word: int = DEFAULT_SYMBOLS_PER_WORD) -> str:
+    """
+    Encodes a secret message into a cover text using Zero-Width Characters.
+
+    mode "legacy" hides one character (U+0020 to U+012F) per word; mode
+    "binary" hides the message's UTF-8 bytes with bits_per_symbol bits per
+    zero-width character and symbols_per_word characters per word.
+    """
+    non_empty_string(cover_text, "cover_text")
+    _ensure_clean_cover(cover_text)
+    groups, required_bits, bits_per_word = _hidden_groups(secret_message, mode, bits_per_symbol, symbols_per_word)
     words = cover_text.split()
-    ensure_text_capacity(binary_len, len(words))
-
-    # 3. Embed binary data into words using Zero-Width Characters
-    ZWC = {"00": u'\u200C', "01": u'\u202C', "11": u'\u202D', "10": u'\u200E'}
-    
-    encoded_words = []
-    i = 0
-    word_index = 0
-
-    while i < binary_len:
-        if word_index >= len(words):
-            # This case should be prevented by ensure_text_capacity, but as a safeguard:
-            raise ValueError("Not enough words in cover text for the message size.")
-
-        s = words[word_index]
-        hm_sk = ""
-        j = 0
-        while j < 12 and (i + j + 1) < binary_len:
-            x = binary_string[i+j] + binary_string[i+j+1]
-            hm_sk += ZWC[x]
-            j += 2
-        
-        encoded_words.append(s + hm_sk)
-        i += 12
-        word_index += 1
-
-    # 4. Append remaining words and join to form the final stego text
-    if word_index < len(words):
-        encoded_words.extend(words[word_index:])
-        
-    return " ".join(encoded_words)
+    ensure_text_capacity(required_bits, len(words), bits_per_word)
+    return _append_to_words(words, groups)
 
 
 def decode_text_data(stego_text: str) -> str:
     """
-    Decodes a secret message from a steganographic text.
+    Decodes a secret message (either mode) from a steganographic text.
     """
     non_empty_string(stego_text, "stego_text")
-    
-    ZWC_reverse = {u'\u200C': "00", u'\u202C': "01", u'\u202D': "11", u'\u200E': "10"}
-    
-    temp = ''
-    words = stego_text.split()
-
-    for word in words:
-        binary_extract = ""
-        for letter in word:
-            if letter in ZWC_reverse:
-                binary_extract += ZWC_reverse[letter]
-        
-        if binary_extract == "111111111111":
-            break
+
+    payload = decode_text_bytes(stego_text)
+    if payload is not None:
+        try:
+            return payload.decode("utf-8")
+        except UnicodeDecodeError:
+            raise ValueError("Hidden payload is binary data, not text; use decode_text_bytes")
+
+    # The encoder appends one run of zero-width characters to each word,
+    # holding one message character; the terminator run ends the message
+    runs = _ZWC_RUN.findall(stego_text)
+    try:
+        runs = runs[:runs.index(TERMINATOR)]
+    except ValueError:
+        pass
+    if set(map(len, runs)) - {ZWC_PER_CHAR}:
+        # Runs were split or merged (e.g. by editing); regroup the bits
+        runs = _ZWC_GROUP.findall("".join(runs))
+
+    # Groups that are not a valid character code are skipped
+    return "".join(filter(None, map(_DECODE_TABLE.get, runs)))
+
+
+def detect_text_payload(text_prefix: str) -> Optional[dict]:
+    """
+    Identifies a hidden payload from the start of a stego text without
+    decoding it; returns None if the text does not start like one.
+    """
+    header = _binary_header("".join(_BINARY_RUN.findall(text_prefix)))
+    if header is not None:
+        bits, length = header
+        return {"mode": "binary", "bits_per_symbol": bits, "payload_bytes": length - BINARY_HEADER_BYTES}
+    # Legacy: the first words carry six-character runs that are valid
+    # character codes (or the terminator); stray single characters such as
+    # ZWNJ in Persian text do not
+    runs = _ZWC_RUN.findall(text_prefix)[:8]
+    if runs and runs[0] in _DECODE_TABLE and all(run in _DECODE_TABLE or run == TERMINATOR for run in runs):
+        if TERMINATOR in runs:
+            return {"mode": "legacy", "payload_bytes": runs.index(TERMINATOR)}
+        if len(runs) == 8:
+            return {"mode": "legacy", "payload_bytes": None}
+    return None
+
+
+def _word_boundary(text: str) -> int:
+    """Index just past the last whitespace, so a chunk never ends mid-word"""
+    if not text or text[-1].isspace():
+        return len(text)
+    # rsplit scans from the end, so this costs the length of the last word
+    return len(text) - len(text.rsplit(None, 1)[-1])
+
+
+def encode_text_stream(secret_message: str, chunks: Iterable[str], mode: str = "legacy",
+                       bits_per_symbol: int = DEFAULT_SYMBOL_BITS,
+                       symbols_per_word: int = DEFAULT_SYMBOLS_PER_WORD) -> Iterator[str]:
+    """
+    Streaming variant of encode_text_data over an iterable of cover chunks.
+
+    Yields the stego text chunk by chunk. The cover's whitespace is kept
+    as-is and, once the payload is embedded, the remaining chunks are
+    passed through untouched. Raises CapacityError at the end of the cover
+    if it has too few words, and ValidationError if the cover already
+    contains hidden characters before that point.
+    """
+    groups, required_bits, bits_per_word = _hidden_groups(secret_message, mode, bits_per_symbol, symbols_per_word)
+    pending = iter(groups)
+    remaining = len(groups)
+    # A word cut by a chunk boundary is passed on at once and its group is
+    # appended where the word ends, so nothing is buffered across chunks
+    in_word = False
+
+    def append_group(match):
+        return match.group() + next(pending)
+
+    for chunk in chunks:
+        if not remaining:
+            yield chunk
+            continue
+        if not chunk:
+            continue
+        _ensure_clean_cover(chunk)
+        head, start = "", 0
+        if in_word:
+            word_end = _WORD.match(chunk)
+            start = word_end.end() if word_end else 0
+            if start == len(chunk):
+                yield chunk
+                continue
+            head = chunk[:start] + next(pending)
+            remaining -= 1
+        cut = max(start, _word_boundary(chunk))
+        body, tail = chunk[start:cut], chunk[cut:]
+        if remaining:
+            body, embedded = _WORD.subn(append_group, body, count=remaining)
+            remaining -= embedded
+        in_word = bool(tail)
+        yield head + body + tail
+
+    # The cover may end in the middle of a word
+    if remaining and in_word:
+        yield next(pending)
+        remaining -= 1
+    if remaining:
+        raise CapacityError(f"Message too large for cover text: needs {required_bits} bits, "
+                            f"capacity {(len(groups) - remaining) * bits_per_word} bits")
+
+
+def decode_text_stream(chunks: Iterable[str]) -> str:
+    """
+    Streaming variant of decode_text_data over an iterable of stego chunks.
+
+    Only the zero-width runs are kept, and reading stops as soon as the
+    hidden message is complete.
+    """
+    hidden = []
+    binary_head = ""
+    binary_symbols = 0
+    # Whether the last chunk ended inside a run, which the next one continues
+    open_run = False
+    for chunk in chunks:
+        runs = _HIDDEN_RUN.findall(chunk)
+        if not runs:
+            open_run = False
+            continue
+        symbols = "".join(_BINARY_RUN.findall("".join(runs)))
+        if open_run and _HIDDEN_RUN.match(chunk):
+            hidden[-1] += runs[0]
+            runs[0] = hidden[-1]
+            hidden.extend(runs[1:])
         else:
-            temp += binary_extract
-
-    # Convert binary string back to the original message
-    final_message = ''
-    i = 0
-    while i < len(temp):
-        # Each character was encoded in 12 bits (4 for type, 8 for data)
-        if i + 12 > len(temp):
-            break # Avoid processing incomplete chunks
-
-        type_bits = temp[i : i+4]
-        data_bits = temp[i+4 : i+12]
-        
-        if len(data_bits) < 8:
-            break # Ensure we have a full byte to process
-
-        decimal_data = int(data_bits, 2)
-
-        if type_bits == '0110':
-            final_message += chr(decimal_data + 48)
-        elif type_bits == '0011':
-            final_message += chr(decimal_data - 48)
-            
-        i += 12
-        
-    return final_message
+            hidden.extend(runs)
+        open_run = _HIDDEN_RUN.match(chunk, len(chunk) - 1) is not None
+        if TERMINATOR in runs:
+            break
+        binary_symbols += len(symbols)
+        if len(binary_head) < _BINARY_HEAD_SYMBOLS:
+            binary_head += symbols[:_BINARY_HEAD_SYMBOLS - len(binary_head)]
+        header = _binary_header(binary_head)
+        if header is not None and binary_symbols >= _binary_symbol_count(*header):
+            break
+
+    # Space-separated runs decode exactly like the full stego text
+    return decode_text_data(" ".join(hidden)) if hidden else ""
+
+
+def encode_text_file(secret_message: str, input_path: str, output_path: str, mode: str = "legacy",
+                     bits_per_symbol: int = DEFAULT_SYMBOL_BITS,
+                     symbols_per_word: int = DEFAULT_SYMBOLS_PER_WORD,
+                     chunk_size: int = TEXT_CHUNK_SIZE):
+    """
+    Encodes a message from one text file into another without loading the cover.
+
+    The output is written to a temporary file and moved into place, so a
+    failed encode leaves no partial file behind.
+    """
+    tmp_path = output_path + ".tmp"
+    try:
+        # newline="" keeps \r\n line endings byte for byte
+        with open(input_path, "r", encoding="utf-8", newline="") as src, \
+                open(tmp_path, "w", encoding="utf-8", newline="", buffering=chunk_size) as dst:
+            chunks = iter(partial(src.read, chunk_size), "")
+            for piece in encode_text_stream(secret_message, chunks, mode, bits_per_symbol, symbols_per_word):
+                dst.write(piece)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def decode_text_file(input_path: str, chunk_size: int = TEXT_CHUNK_SIZE) -> str:
+    """
+    Decodes a message from a text file, reading only as far as the payload.
+    """
+    with open(input_path, "r", encoding="utf-8", newline="") as f:
+        return decode_text_stream(iter(partial(f.read, chunk_size), ""))
@@ -4,6 +4,7 @@ import numpy as np
 import struct
 import tempfile
 from io import BytesIO
+from utilities.timing import phase, record_size
 
 def _bytes_to_bits(data: bytes):
     arr = np.frombuffer(data, dtype=np.uint8)
@@ -45,6 +46,7 @@ def _choose_writer(width: int, height: int, fps: float, out_path: str):
     return writer, base + ".mp4", "mp4v"
 
 def encode_video(video_path: str, message: str):
+    record_size("carrier_bytes", os.path.getsize(video_path))
     cap = cv2.VideoCapture(video_path)
     if not cap.isOpened():
         raise IOError("Unable to open video.")
@@ -73,22 +75,24 @@ def encode_video(video_path: str, message: str):
         os.remove(temp_video_path)
         raise IOError("Failed to open video writer.")
 
-    bit_index = 0
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
+    # Frames are decoded, embedded and re-encoded in one pass
+    with phase("embed"):
+        bit_index = 0
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
 
-        if bit_index < total_bits:
-            flat = frame.reshape(-1)
-            remaining = total_bits - bit_index
-            count = min(flat.size, remaining)
-            np.bitwise_and(flat[:count], 0xFE, out=flat[:count])
-            np.bitwise_or(flat[:count], bits[bit_index:bit_index + count], out=flat[:count])
-            bit_index += count
-            frame = flat.reshape((height, width, 3))
+            if bit_index < total_bits:
+                flat = frame.reshape(-1)
+                remaining = total_bits - bit_index
+                count = min(flat.size, remaining)
+                np.bitwise_and(flat[:count], 0xFE, out=flat[:count])
+                np.bitwise_or(flat[:count], bits[bit_index:bit_index + count], out=flat[:count])
+                bit_index += count
+                frame = flat.reshape((height, width, 3))
 
-        out.write(frame)
+            out.write(frame)
 
     cap.release()
     out.release()
@@ -97,7 +101,7 @@ def encode_video(video_path: str, message: str):
         os.remove(final_out_path)
         raise ValueError(f"Video ended before message was fully encoded. Missing bits: {total_bits - bit_index}")
 
-    with open(final_out_path, "rb") as f:
+    with phase("serialize"), open(final_out_path, "rb") as f:
         video_bytes = f.read()
     
     os.remove(final_out_path)
@@ -0,0 +1 @@
+"""StegoCrypt Suite Python API (stegocrypt.aio for asyncio services)."""
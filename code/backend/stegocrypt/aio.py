@@ -0,0 +1,215 @@
+"""
+Asyncio facade for the StegoCrypt Suite engines
+
+CPU-bound work (steganography, encryption) runs on a shared process pool
+and I/O-bound work (file hashing, X25519 file encryption) on a shared
+thread pool, so callers never block the event loop. Every call first
+takes a slot from a per-loop limiter; cancelling a call that is waiting
+for a slot or still queued in a pool removes it, while a call that has
+already started finishes in its worker and its result is discarded.
+Hashing of small inputs runs inline, as a pool round trip would cost
+more than the digest.
+
+    from stegocrypt import aio
+
+    aio.configure(processes=4, max_in_flight=16)
+    image_bytes = await aio.encode_image("cover.png", ciphertext)
+    ...
+    await aio.shutdown()
+"""
+
+import asyncio
+import contextlib
+import functools
+import io
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+import hashing
+from steganography import image_stego, audio_stego, video_stego, text_stego
+from cryptography.message_crypto import encrypt_message as _encrypt_message, decrypt_message as _decrypt_message
+
+# Inputs up to this size are hashed on the event loop thread
+INLINE_HASH_BYTES = 64 * 1024
+
+_limits = {
+    "processes": os.cpu_count() or 1,
+    "threads": min(32, (os.cpu_count() or 1) + 4),
+    "max_in_flight": 2 * (os.cpu_count() or 1),
+}
+_lock = threading.Lock()
+_process_pool = None
+_thread_pool = None
+# asyncio semaphores belong to one event loop, so keep one per loop
+_limiters = weakref.WeakKeyDictionary()
+
+
+def configure(processes: Optional[int] = None, threads: Optional[int] = None,
+              max_in_flight: Optional[int] = None):
+    """
+    Set pool sizes and the number of calls running or queued at once
+
+    Changing a pool size shuts down the existing pool once its current work
+    is done; the new size applies from the next call.
+    """
+    global _process_pool, _thread_pool
+    for name, value in (("processes", processes), ("threads", threads), ("max_in_flight", max_in_flight)):
+        if value is not None and value < 1:
+            raise ValueError(f"{name} must be at least 1")
+    with _lock:
+        if processes is not None and processes != _limits["processes"]:
+            _limits["processes"] = processes
+            if _process_pool is not None:
+                _process_pool.shutdown(wait=False)
+                _process_pool = None
+        if threads is not None and threads != _limits["threads"]:
+            _limits["threads"] = threads
+            if _thread_pool is not None:
+                _thread_pool.shutdown(wait=False)
+                _thread_pool = None
+        if max_in_flight is not None and max_in_flight != _limits["max_in_flight"]:
+            _limits["max_in_flight"] = max_in_flight
+            _limiters.clear()
+
+
+def get_limits() -> dict:
+    """Current pool sizes and in-flight limit"""
+    return dict(_limits)
+
+
+async def shutdown(wait: bool = True):
+    """Shut down the shared pools; they are recreated on the next call"""
+    global _process_pool, _thread_pool
+    with _lock:
+        pools = [pool for pool in (_process_pool, _thread_pool) if pool is not None]
+        _process_pool = _thread_pool = None
+    for pool in pools:
+        await asyncio.get_running_loop().run_in_executor(None, functools.partial(pool.shutdown, wait=wait))
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    with _lock:
+        if _process_pool is None:
+            # Spawned rather than forked workers: the log writer thread and
+            # SQLite connections of this process must not be copied into them
+            _process_pool = ProcessPoolExecutor(max_workers=_limits["processes"],
+                                                mp_context=multiprocessing.get_context("spawn"))
+        return _process_pool
+
+
+def _get_thread_pool() -> ThreadPoolExecutor:
+    global _thread_pool
+    with _lock:
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(max_workers=_limits["threads"], thread_name_prefix="stegocrypt-aio")
+        return _thread_pool
+
+
+def _get_limiter() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = asyncio.Semaphore(_limits["max_in_flight"])
+    return limiter
+
+
+async def _run(get_pool, func, *args):
+    async with _get_limiter():
+        loop = asyncio.get_running_loop()
+        # Cancelling the awaiting task cancels the pool future too, which
+        # drops the call if no worker has picked it up yet
+        return await loop.run_in_executor(get_pool(), functools.partial(func, *args))
+
+
+async def run_cpu(func, *args):
+    """Run a picklable, module-level function on the shared process pool"""
+    return await _run(_get_process_pool, func, *args)
+
+
+async def run_io(func, *args):
+    """Run a function on the shared thread pool"""
+    return await _run(_get_thread_pool, func, *args)
+
+
+async def encrypt_message(message: str, method: str, password: Optional[str] = None,
+                          salt: Optional[bytes] = None) -> str:
+    return await run_cpu(_encrypt_message, message, method, password, salt)
+
+
+async def decrypt_message(ciphertext: str, method: str, password: Optional[str] = None) -> str:
+    return await run_cpu(_decrypt_message, ciphertext, method, password)
+
+
+async def encode_image(image_path: str, secret_message: str) -> bytes:
+    return await run_cpu(image_stego.encode_image, image_path, secret_message)
+
+
+async def decode_image(image_path: str):
+    return await run_cpu(image_stego.decode_image, image_path)
+
+
+async def encode_audio(input_file: str, message: str) -> bytes:
+    return await run_cpu(audio_stego.encode_audio, input_file, message)
+
+
+async def decode_audio(encoded_file: str):
+    return await run_cpu(audio_stego.decode_audio, encoded_file)
+
+
+async def encode_video(video_path: str, message: str) -> bytes:
+    return await run_cpu(video_stego.encode_video, video_path, message)
+
+
+async def decode_video(video_bytes: bytes):
+    return await run_cpu(video_stego.decode_video, video_bytes)
+
+
+async def encode_text(secret_message: str, cover_text: str) -> str:
+    return await run_cpu(text_stego.encode_text_data, secret_message, cover_text)
+
+
+async def decode_text(stego_text: str) -> str:
+    return await run_cpu(text_stego.decode_text_data, stego_text)
+
+
+async def hash_message(message: str, algorithm: str = "sha256") -> str:
+    # hashlib releases the GIL for large inputs, so the thread pool suffices
+    if len(message) <= INLINE_HASH_BYTES:
+        return hashing.hash_message(message, algorithm)
+    return await run_io(hashing.hash_message, message, algorithm)
+
+
+async def hash_file(path: str, algorithms=("sha256",)) -> dict:
+    try:
+        small = os.path.getsize(path) <= INLINE_HASH_BYTES
+    except OSError:
+        small = False
+    if small:
+        return hashing.hash_file(path, algorithms)
+    return await run_io(hashing.hash_file, path, algorithms)
+
+
+def _x25519_engine():
+    try:
+        # The module prints to stdout and exits when pyca/cryptography
+        # cannot be imported
+        with contextlib.redirect_stdout(io.StringIO()):
+            from filesecuritywithx25519 import X25519FileEncryption
+    except SystemExit:
+        raise ImportError("X25519 file encryption requires the pyca/cryptography package")
+    return X25519FileEncryption()
+
+
+async def x25519_encrypt_file(input_path: str, output_path: str, public_key: bytes) -> str:
+    # Keys are SecureBuffers that cannot be pickled, and the AEAD work
+    # releases the GIL, so this runs on the thread pool
+    return await run_io(lambda: _x25519_engine().encrypt_file(input_path, output_path, public_key))
+
+
+async def x25519_decrypt_file(input_path: str, output_path: str, private_key) -> bool:
+    return await run_io(lambda: _x25519_engine().decrypt_file(input_path, output_path, private_key))
@@ -7,6 +7,7 @@ Direct process communication interface for Flutter frontend
 import os
 import sys
 import json
+import hmac
 
 # Set stdout and stderr to utf-8
 if sys.stdout.encoding != 'utf-8':
@@ -17,7 +18,6 @@ import argparse
 import tempfile
 import base64
 from pathlib import Path
-from typing import Optional
 
 # Add backend directory to path for imports
 BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -33,90 +33,50 @@ from steganography.video_stego import (
 )
 from steganography.text_stego import (
     encode_text_data,
-    decode_text_data,
+    encode_text_file,
+    decode_text_file,
+    TEXT_MODES,
+    SUPPORTED_SYMBOL_BITS,
+    DEFAULT_SYMBOL_BITS,
+    DEFAULT_SYMBOLS_PER_WORD,
 )
-from hashing import hash_message, verify_hash, get_supported_algorithms
-from logs import log_operation, get_logs, get_log_stats
-from cryptography.aes_crypto import encrypt_aes, decrypt_aes, get_key_from_password
-from Crypto.Protocol.KDF import PBKDF2
+from hashing import (
+    hash_message,
+    hash_file,
+    merkle_hash_file,
+    verify_hash,
+    verify_file_hash,
+    get_supported_algorithms,
+)
+from hash_cache import get_hash_cache
+from manifest import hash_tree, verify_manifest, DEFAULT_WORKERS
+from profiling import PROFILE_MODES, run_profiled
+from batch_runner import DEFAULT_BATCH_WORKERS, run_batch
+from capacity import CARRIER_EXTENSIONS, scan_capacity
+from scanner import scan_carriers
+from benchmark import ENGINES, DEFAULT_REPEAT, run_benchmarks, load_cached_results
+from logs import log_operation, get_logs_page, get_log_stats, rotate_log, migrate_logs_to_journal
+from cryptography.message_crypto import encrypt_message, decrypt_message
 from cryptography.rsa_crypto import (
     generate_rsa_keys,
-    encrypt_with_rsa,
-    decrypt_with_rsa,
+    encrypt_rsa_payload,
+    decrypt_rsa_payload,
     import_keys,
     export_keys,
     load_keys,
+    get_key_store,
+)
+from cryptography.rsa_pool import (
+    SUPPORTED_KEY_SIZES,
+    DEFAULT_KEY_SIZE,
+    DEFAULT_POOL_TARGET,
+    fill_pool,
+    start_background_fill,
+    pool_status,
 )
-from validation.inputs import non_empty_string
+from utilities.timing import phase, record_size
 from validation.errors import ValidationError
 
-def encrypt_message(message: str, method: str, password: Optional[str] = None) -> str:
-    """Encrypt message using specified method"""
-    try:
-        non_empty_string(message, "message")
-        non_empty_string(method, "method")
-
-        if method.upper() == "AES":
-            if not password:
-                raise ValueError("Password is required for AES encryption")
-            key, salt = get_key_from_password(password)
-            encrypted_data = encrypt_aes(key, message)
-            payload = salt + encrypted_data
-            # return encrypted_data
-            return base64.b64encode(payload).decode('utf-8')
-
-        elif method.upper() == "RSA":
-            _, public_key = load_keys()
-            if not public_key:
-                generate_rsa_keys()
-                _, public_key = load_keys()
-            
-            encrypted_data = encrypt_with_rsa(public_key, message)
-            return base64.b64encode(encrypted_data).decode('utf-8')
-
-        else:
-            raise ValueError(f"Unsupported encryption method: {method}")
-
-    except Exception as e:
-        raise Exception(f"Encryption failed: {str(e)}")
-
-
-def decrypt_message(ciphertext: str, method: str, password: Optional[str] = None) -> str:
-    """Decrypt message using specified method"""
-    try:
-        non_empty_string(ciphertext, "ciphertext")
-        non_empty_string(method, "method")
-        
-        encrypted_data = base64.b64decode(ciphertext)
-
-        if method.upper() == "AES":
-            if not password:
-                raise ValueError("Password is required for AES decryption")
-            try:
-                if len(encrypted_data) >= 48:
-                    salt = encrypted_data[:16]
-                    body = encrypted_data[16:]
-                    key = PBKDF2(password.encode(), salt, dkLen=16, count=100000)
-                    return decrypt_aes(key, body)
-                else:
-                    key, _ = get_key_from_password(password)
-                    return decrypt_aes(key, encrypted_data)
-            except Exception:
-                key, _ = get_key_from_password(password)
-                return decrypt_aes(key, encrypted_data)
-
-        elif method.upper() == "RSA":
-            private_key, _ = load_keys()
-            if not private_key:
-                raise ValueError("RSA private key not found. Cannot decrypt.")
-            return decrypt_with_rsa(private_key, encrypted_data)
-
-        else:
-            raise ValueError(f"Unsupported decryption method: {method}")
-
-    except Exception as e:
-        raise Exception(f"Decryption failed: {str(e)}")
-
 def process_image_encode(args):
     """Process image encoding request"""
     try:
@@ -130,7 +90,8 @@ def process_image_encode(args):
         encoded_image_bytes = encode_image(args.input_file, encrypted_message)
         
         # Base64 encode the bytes to send as a string in JSON
-        encoded_image_base64 = base64.b64encode(encoded_image_bytes).decode('utf-8')
+        with phase("base64"):
+            encoded_image_base64 = base64.b64encode(encoded_image_bytes).decode('utf-8')
         
         output_filename = args.output_file
         if not output_filename.lower().endswith('.png'):
@@ -158,7 +119,9 @@ def process_image_decode(args):
         log_operation("DECODE_IMAGE", "STARTED", {"filename": os.path.basename(args.input_file)})
         
         # Decode the message from the image
-        decoded_text = decode_image(args.input_file)
+        record_size("carrier_bytes", os.path.getsize(args.input_file))
+        with phase("extract"):
+            decoded_text = decode_image(args.input_file)
         
         if decoded_text is None:
             log_operation(
@@ -200,7 +163,8 @@ def process_audio_encode(args):
         
         encoded_audio_bytes = encode_audio(args.input_file, encrypted_message)
         
-        encoded_audio_base64 = base64.b64encode(encoded_audio_bytes).decode('utf-8')
+        with phase("base64"):
+            encoded_audio_base64 = base64.b64encode(encoded_audio_bytes).decode('utf-8')
         
         log_operation("ENCODE_AUDIO", "SUCCESS", {"filename": os.path.basename(args.output_file)})
         return {
@@ -223,7 +187,9 @@ def process_audio_decode(args):
     try:
         log_operation("DECODE_AUDIO", "STARTED", {"filename": os.path.basename(args.input_file)})
         
-        decoded_text = decode_audio(args.input_file)
+        record_size("carrier_bytes", os.path.getsize(args.input_file))
+        with phase("extract"):
+            decoded_text = decode_audio(args.input_file)
         
         if decoded_text is None:
             log_operation(
@@ -267,7 +233,8 @@ def process_video_encode(args):
         encoded_video_bytes = encode_video(args.input_file, encrypted_message)
         
         # Base64 encode the bytes to send as a string in JSON
-        encoded_video_base64 = base64.b64encode(encoded_video_bytes).decode('utf-8')
+        with phase("base64"):
+            encoded_video_base64 = base64.b64encode(encoded_video_bytes).decode('utf-8')
         
         log_operation("ENCODE_VIDEO", "SUCCESS", {"filename": os.path.basename(args.output_file)})
         return {
@@ -291,10 +258,12 @@ def process_video_decode(args):
         log_operation("DECODE_VIDEO", "STARTED", {"filename": os.path.basename(args.input_file)})
         
         # Decode the message from the video
-        with open(args.input_file, "rb") as f:
+        with phase("load_carrier"), open(args.input_file, "rb") as f:
             video_bytes = f.read()
+        record_size("carrier_bytes", len(video_bytes))
 
-        decoded_text = decode_video(video_bytes)
+        with phase("extract"):
+            decoded_text = decode_video(video_bytes)
         
         if decoded_text is None:
             log_operation(
@@ -334,12 +303,33 @@ def process_text_encode(args):
         password = args.password if hasattr(args, 'password') else None
         encrypted_message = encrypt_message(args.message, args.algorithm, password)
 
-        with open(args.input_file, 'r', encoding='utf-8') as f:
+        text_mode = getattr(args, 'text_mode', 'legacy')
+        zwc_bits = getattr(args, 'zwc_bits', DEFAULT_SYMBOL_BITS)
+        zwc_per_word = getattr(args, 'zwc_per_word', DEFAULT_SYMBOLS_PER_WORD)
+        record_size("carrier_bytes", os.path.getsize(args.input_file))
+
+        if getattr(args, 'stream', False):
+            # Cover streamed straight to --output-file; whitespace is preserved
+            with phase("embed"):
+                encode_text_file(encrypted_message, args.input_file, args.output_file,
+                                 text_mode, zwc_bits, zwc_per_word)
+            log_operation("ENCODE_TEXT", "SUCCESS", {"filename": os.path.basename(args.output_file)})
+            return {
+                "status": "success",
+                "success": True,
+                "message": "Message successfully encoded into text",
+                "output_file": args.output_file,
+                "filename": os.path.basename(args.output_file),
+            }
+
+        with phase("load_carrier"), open(args.input_file, 'r', encoding='utf-8') as f:
             cover_text = f.read()
 
-        encoded_text = encode_text_data(encrypted_message, cover_text)
-        
-        encoded_text_base64 = base64.b64encode(encoded_text.encode('utf-8')).decode('utf-8')
+        with phase("embed"):
+            encoded_text = encode_text_data(encrypted_message, cover_text, text_mode, zwc_bits, zwc_per_word)
+
+        with phase("base64"):
+            encoded_text_base64 = base64.b64encode(encoded_text.encode('utf-8')).decode('utf-8')
 
         log_operation("ENCODE_TEXT", "SUCCESS", {"filename": os.path.basename(args.output_file)})
         return {
@@ -362,10 +352,11 @@ def process_text_decode(args):
     try:
         log_operation("DECODE_TEXT", "STARTED", {"filename": os.path.basename(args.input_file)})
 
-        with open(args.input_file, 'r', encoding='utf-8') as f:
-            stego_text = f.read()
+        record_size("carrier_bytes", os.path.getsize(args.input_file))
 
-        decoded_text = decode_text_data(stego_text)
+        # Streams the file and stops reading once the payload is complete
+        with phase("extract"):
+            decoded_text = decode_text_file(args.input_file)
         if not decoded_text:
             log_operation(
                 "DECODE_TEXT",
@@ -421,7 +412,30 @@ def process_decrypt(args):
 
 def process_hash(args):
     """Process hashing request"""
+    if args.tree and not args.file:
+        return {"status": "error", "message": "--tree requires --file"}
     try:
+        if args.file:
+            algorithms = [a for a in args.algorithm.split(',') if a.strip()]
+            details = {"algorithm": args.algorithm, "filename": os.path.basename(args.file)}
+            log_operation("HASH", "STARTED", details)
+            if args.tree:
+                if len(algorithms) != 1:
+                    raise ValueError("--tree takes a single --algorithm")
+                tree = merkle_hash_file(args.file, algorithms[0])
+                log_operation("HASH", "SUCCESS", details)
+                return {"status": "success", "hash": tree["root"], "algorithm": tree["algorithm"], "tree": tree}
+            if args.no_cache:
+                hashes = hash_file(args.file, algorithms)
+            else:
+                hashes = get_hash_cache().get_file_digests(args.file, algorithms)
+            log_operation("HASH", "SUCCESS", details)
+            return {
+                "status": "success",
+                "hash": next(iter(hashes.values())),
+                "algorithm": args.algorithm,
+                "hashes": hashes,
+            }
         log_operation("HASH", "STARTED", {"algorithm": args.algorithm})
         hash_value = hash_message(args.message, args.algorithm)
         log_operation("HASH", "SUCCESS", {"algorithm": args.algorithm})
@@ -433,14 +447,121 @@ def process_hash(args):
 def process_verify_hash(args):
     """Process hash verification request"""
     try:
-        log_operation("VERIFY_HASH", "STARTED", {"algorithm": args.algorithm})
-        is_valid = verify_hash(args.message, args.hash_value, args.algorithm)
-        log_operation("VERIFY_HASH", "SUCCESS" if is_valid else "FAILED", {"algorithm": args.algorithm})
+        details = {"algorithm": args.algorithm}
+        if args.file:
+            details["filename"] = os.path.basename(args.file)
+        log_operation("VERIFY_HASH", "STARTED", details)
+        if args.file and args.no_cache:
+            is_valid = verify_file_hash(args.file, args.hash_value, args.algorithm)
+        elif args.file:
+            digest = get_hash_cache().get_file_digest(args.file, args.algorithm)
+            is_valid = hmac.compare_digest(digest, args.hash_value.strip().lower())
+        else:
+            is_valid = verify_hash(args.message, args.hash_value, args.algorithm)
+        log_operation("VERIFY_HASH", "SUCCESS" if is_valid else "FAILED", details)
         return {"status": "success", "valid": is_valid, "algorithm": args.algorithm}
     except Exception as e:
         log_operation("VERIFY_HASH", "FAILED", {"error": str(e)})
         return {"status": "error", "message": str(e)}
 
+def emit_record(record: dict):
+    """Write one NDJSON progress record to stdout immediately"""
+    print(json.dumps(record), flush=True)
+
+def process_hash_tree(args):
+    """Hash a directory tree, streaming one NDJSON record per file"""
+    try:
+        log_operation("HASH_TREE", "STARTED", {"algorithm": args.algorithm})
+        summary = hash_tree(
+            args.root,
+            args.algorithm,
+            manifest_path=args.manifest,
+            workers=args.workers,
+            use_cache=not args.no_cache,
+            progress=emit_record,
+        )
+        log_operation("HASH_TREE", "SUCCESS", {"algorithm": args.algorithm, "files": summary["files"]})
+        return {"type": "summary", "status": "success", **summary}
+    except Exception as e:
+        log_operation("HASH_TREE", "FAILED", {"error": str(e)})
+        return {"type": "summary", "status": "error", "message": str(e)}
+
+def process_verify_manifest(args):
+    """Verify a checksum manifest, streaming one NDJSON record per entry"""
+    try:
+        details = {"algorithm": args.algorithm, "filename": os.path.basename(args.manifest)}
+        log_operation("VERIFY_MANIFEST", "STARTED", details)
+        summary = verify_manifest(
+            args.manifest,
+            root=args.root,
+            algorithm=args.algorithm,
+            workers=args.workers,
+            use_cache=not args.no_cache,
+            progress=emit_record,
+        )
+        log_operation("VERIFY_MANIFEST", "SUCCESS" if summary["valid"] else "FAILED", details)
+        return {"type": "summary", "status": "success", **summary}
+    except Exception as e:
+        log_operation("VERIFY_MANIFEST", "FAILED", {"error": str(e)})
+        return {"type": "summary", "status": "error", "message": str(e)}
+
+def process_batch(args):
+    """Run a manifest of encode jobs, streaming one NDJSON record per job"""
+    try:
+        details = {"filename": os.path.basename(args.manifest), "workers": args.workers}
+        log_operation("BATCH", "STARTED", details)
+        summary = run_batch(
+            args.manifest,
+            workers=args.workers,
+            journal_path=args.journal,
+            resume=not args.no_resume,
+            progress=emit_record,
+        )
+        log_operation("BATCH", "SUCCESS" if not summary["failed"] else "FAILED",
+                      {**details, "succeeded": summary["succeeded"], "failed": summary["failed"]})
+        return {"type": "summary", "status": "success", **summary}
+    except Exception as e:
+        log_operation("BATCH", "FAILED", {"error": str(e)})
+        return {"type": "summary", "status": "error", "message": str(e)}
+
+def process_capacity(args):
+    """Report cover capacities from file headers, streaming one NDJSON record per file"""
+    try:
+        log_operation("CAPACITY", "STARTED", {"inputs": len(args.input)})
+        summary = scan_capacity(
+            args.input,
+            carrier=args.carrier,
+            workers=args.workers,
+            rsa_key_bits=args.rsa_key_bits,
+            progress=emit_record,
+        )
+        log_operation("CAPACITY", "SUCCESS", summary)
+        return {"type": "summary", "status": "success", **summary}
+    except Exception as e:
+        log_operation("CAPACITY", "FAILED", {"error": str(e)})
+        return {"type": "summary", "status": "error", "message": str(e)}
+
+def process_scan(args):
+    """Probe covers for an existing payload, streaming one NDJSON record per file"""
+    try:
+        log_operation("SCAN", "STARTED", {"inputs": len(args.input)})
+        summary = scan_carriers(args.input, carrier=args.carrier, workers=args.workers, progress=emit_record)
+        log_operation("SCAN", "SUCCESS", summary)
+        return {"type": "summary", "status": "success", **summary}
+    except Exception as e:
+        log_operation("SCAN", "FAILED", {"error": str(e)})
+        return {"type": "summary", "status": "error", "message": str(e)}
+
+def process_hash_cache(args):
+    """Report or clear the persistent file hash cache"""
+    try:
+        cache = get_hash_cache()
+        if args.clear:
+            cache.invalidate()
+        return {"status": "success", "stats": cache.stats()}
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
 def process_algorithms(args):
     """Get supported algorithms"""
     return {
@@ -449,28 +570,78 @@ def process_algorithms(args):
         "hashing": get_supported_algorithms()
     }
 
+def process_bench(args):
+    """Time each engine on generated data, or return the cached results"""
+    try:
+        if args.cached:
+            cached = load_cached_results()
+            if cached is None:
+                return {"status": "error", "message": "No cached benchmark results; run bench first"}
+            return {"status": "success", "cached": True, **cached}
+        engines = args.engines.split(",") if args.engines else None
+        report = run_benchmarks(engines, args.repeat)
+        return {"status": "success", "cached": False, **report}
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
 def process_get_logs(args):
     """Process get logs request"""
     try:
-        logs = get_logs()
-        return {"status": "success", "logs": logs}
+        page = get_logs_page(args.count, args.before, args.since, args.until,
+                             args.operation, args.log_status, args.filename)
+        return {"status": "success", "logs": page["logs"], "next_before": page["next_before"]}
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+def process_rotate_logs(args):
+    """Archive the live log into a compressed segment"""
+    try:
+        rotated = rotate_log()
+        return {"status": "success", "rotated": rotated}
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+def process_migrate_logs(args):
+    """Import the JSON-lines logs into the SQLite operation journal"""
+    try:
+        result = migrate_logs_to_journal()
+        return {"status": "success", **result}
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
 def process_get_log_stats(args):
     """Process get log stats request"""
     try:
-        stats = get_log_stats()
+        stats = get_log_stats(args.since, args.until, args.operation, args.log_status, args.filename)
         return {"status": "success", "stats": stats}
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
+def process_serve(args):
+    """Run the local HTTP service until interrupted"""
+    # Imported here: http_server imports this module for the handlers
+    from http_server import create_server, server_url
+    try:
+        server = create_server(args.host, args.port, os.environ.get("STEGOCRYPT_HTTP_TOKEN"))
+    except Exception as e:
+        return {"type": "summary", "status": "error", "message": str(e)}
+    log_operation("SERVE", "STARTED", {"url": server_url(server)})
+    emit_record({"type": "listening", "url": server_url(server), "token": server.token})
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    log_operation("SERVE", "SUCCESS", {"url": server_url(server)})
+    return {"type": "summary", "status": "success", "message": "Server stopped"}
+
 def process_rsa_command(args):
     """Process RSA-related commands"""
     try:
         if args.rsa_command == "generate-keys":
             output_dir = args.output_dir if hasattr(args, 'output_dir') else None
-            private_key_path, public_key_path = generate_rsa_keys(output_dir)
+            private_key_path, public_key_path = generate_rsa_keys(output_dir, args.bits)
             return {
                 "status": "success",
                 "message": f"RSA keys generated and saved to {private_key_path.parent}",
@@ -486,19 +657,88 @@ def process_rsa_command(args):
             }
         elif args.rsa_command == "encrypt":
             _, public_key = load_keys()
-            encrypted = encrypt_with_rsa(public_key, args.message)
+            encrypted = encrypt_rsa_payload(public_key, args.message)
             return {"status": "success", "ciphertext": base64.b64encode(encrypted).decode('utf-8')}
         elif args.rsa_command == "decrypt":
             private_key, _ = load_keys()
-            decrypted = decrypt_with_rsa(private_key, base64.b64decode(args.ciphertext))
+            decrypted = decrypt_rsa_payload(private_key, base64.b64decode(args.ciphertext))
             return {"status": "success", "message": decrypted}
+        elif args.rsa_command == "pool-fill":
+            if args.background:
+                start_background_fill(args.bits, args.count)
+                return {"status": "success", "message": f"Filling RSA key pool ({args.bits}-bit) in the background"}
+            generated = fill_pool(args.bits, args.count)
+            return {"status": "success", "generated": generated, "pool": pool_status()}
+        elif args.rsa_command == "pool-status":
+            return {"status": "success", "pool": pool_status()}
+        elif args.rsa_command == "key-stats":
+            return {"status": "success", "stats": get_key_store().stats()}
         else:
             return {"status": "error", "message": f"Unknown RSA command: {args.rsa_command}"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
-def main():
+def dispatch(args):
+    """Route parsed arguments to the matching process_* handler"""
+    if args.command == 'encode-image':
+        return process_image_encode(args)
+    elif args.command == 'decode-image':
+        return process_image_decode(args)
+    elif args.command == 'encode-audio':
+        return process_audio_encode(args)
+    elif args.command == 'decode-audio':
+        return process_audio_decode(args)
+    elif args.command == 'encode-video':
+        return process_video_encode(args)
+    elif args.command == 'decode-video':
+        return process_video_decode(args)
+    elif args.command == 'encode-text':
+        return process_text_encode(args)
+    elif args.command == 'decode-text':
+        return process_text_decode(args)
+    elif args.command == 'encrypt':
+        return process_encrypt(args)
+    elif args.command == 'decrypt':
+        return process_decrypt(args)
+    elif args.command == 'hash':
+        return process_hash(args)
+    elif args.command == 'verify-hash':
+        return process_verify_hash(args)
+    elif args.command == 'hash-tree':
+        return process_hash_tree(args)
+    elif args.command == 'verify-manifest':
+        return process_verify_manifest(args)
+    elif args.command == 'batch':
+        return process_batch(args)
+    elif args.command == 'capacity':
+        return process_capacity(args)
+    elif args.command == 'scan':
+        return process_scan(args)
+    elif args.command == 'hash-cache':
+        return process_hash_cache(args)
+    elif args.command == 'algorithms':
+        return process_algorithms(args)
+    elif args.command == 'bench':
+        return process_bench(args)
+    elif args.command == 'get-logs':
+        return process_get_logs(args)
+    elif args.command == 'get-log-stats':
+        return process_get_log_stats(args)
+    elif args.command == 'rotate-logs':
+        return process_rotate_logs(args)
+    elif args.command == 'migrate-logs':
+        return process_migrate_logs(args)
+    elif args.command == 'serve':
+        return process_serve(args)
+    elif args.command == 'rsa':
+        return process_rsa_command(args)
+    return {"status": "error", "message": f"Unknown command: {args.command}"}
+
+def build_parser():
+    """Build the argument parser for every subcommand"""
     parser = argparse.ArgumentParser(description='StegoCrypt Suite CLI')
+    parser.add_argument('--profile', choices=PROFILE_MODES, required=False,
+                        help='Profile the command (cpu: cProfile .prof, mem: tracemalloc report) and return the report path')
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # Image steganography
@@ -547,12 +787,42 @@ def main():
     txt_encode_parser.add_argument('--algorithm', required=True)
     txt_encode_parser.add_argument('--input-file', required=True)
     txt_encode_parser.add_argument('--output-file', required=True)
+    txt_encode_parser.add_argument('--text-mode', choices=TEXT_MODES, default='legacy',
+                                   help='legacy: one character per word; binary: UTF-8 bytes, denser')
+    txt_encode_parser.add_argument('--zwc-bits', type=int, choices=SUPPORTED_SYMBOL_BITS, default=DEFAULT_SYMBOL_BITS,
+                                   help='Bits per zero-width character in binary mode')
+    txt_encode_parser.add_argument('--zwc-per-word', type=int, default=DEFAULT_SYMBOLS_PER_WORD,
+                                   help='Zero-width characters appended to each word in binary mode')
+    txt_encode_parser.add_argument('--stream', action='store_true',
+                                   help='Stream the cover to --output-file (keeps whitespace) instead of returning text_data')
     
     txt_decode_parser = subparsers.add_parser('decode-text')
     txt_decode_parser.add_argument('--password', required=False)
     txt_decode_parser.add_argument('--algorithm', required=True)
     txt_decode_parser.add_argument('--input-file', required=True)
     
+    # Batch steganography
+    batch_parser = subparsers.add_parser('batch', help='Run a JSON/CSV manifest of encode jobs on a process pool')
+    batch_parser.add_argument('--manifest', required=True, help='Jobs with carrier, input, output, message, algorithm (and optional password, id)')
+    batch_parser.add_argument('--workers', type=int, default=DEFAULT_BATCH_WORKERS)
+    batch_parser.add_argument('--journal', required=False, help='Completed-job journal (default: <manifest>.journal)')
+    batch_parser.add_argument('--no-resume', action='store_true', help='Run every job again instead of skipping journaled ones')
+
+    # Capacity analysis
+    capacity_parser = subparsers.add_parser('capacity', help='Report how large a message each cover holds, from headers only (NDJSON)')
+    capacity_parser.add_argument('--input', nargs='+', required=True, help='Cover files and/or directories to scan')
+    capacity_parser.add_argument('--carrier', choices=list(CARRIER_EXTENSIONS), required=False,
+                                 help='Carrier type (default: from the file extension)')
+    capacity_parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    capacity_parser.add_argument('--rsa-key-bits', type=int, choices=SUPPORTED_KEY_SIZES, default=DEFAULT_KEY_SIZE)
+
+    # Payload presence scan
+    scan_parser = subparsers.add_parser('scan', help='Find covers that already carry a payload by probing their first LSBs (NDJSON)')
+    scan_parser.add_argument('--input', nargs='+', required=True, help='Cover files and/or directories to scan')
+    scan_parser.add_argument('--carrier', choices=list(CARRIER_EXTENSIONS), required=False,
+                             help='Carrier type (default: from the file extension)')
+    scan_parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    
     # Encryption/Decryption
     encrypt_parser = subparsers.add_parser('encrypt')
     encrypt_parser.add_argument('--message', required=True)
@@ -566,20 +836,65 @@ def main():
     
     # Hashing
     hash_parser = subparsers.add_parser('hash')
-    hash_parser.add_argument('--message', required=True)
+    hash_source = hash_parser.add_mutually_exclusive_group(required=True)
+    hash_source.add_argument('--message')
+    hash_source.add_argument('--file', help='Hash a file (streamed); --algorithm may list several, comma-separated')
     hash_parser.add_argument('--algorithm', default='sha256')
+    hash_parser.add_argument('--tree', action='store_true', help='With --file and one --algorithm: parallel Merkle tree hash (root and per-leaf digests)')
+    hash_parser.add_argument('--no-cache', action='store_true', help='With --file: always re-read the file instead of using the hash cache')
     
     verify_hash_parser = subparsers.add_parser('verify-hash')
-    verify_hash_parser.add_argument('--message', required=True)
+    verify_source = verify_hash_parser.add_mutually_exclusive_group(required=True)
+    verify_source.add_argument('--message')
+    verify_source.add_argument('--file', help='Verify the hash of a file')
     verify_hash_parser.add_argument('--hash-value', required=True)
     verify_hash_parser.add_argument('--algorithm', default='sha256')
+    verify_hash_parser.add_argument('--no-cache', action='store_true', help='With --file: always re-read the file instead of using the hash cache')
+
+    hash_tree_parser = subparsers.add_parser('hash-tree', help='Hash every file under a directory (NDJSON progress)')
+    hash_tree_parser.add_argument('--root', required=True, help='Directory to hash')
+    hash_tree_parser.add_argument('--manifest', required=False, help='Write a sha256sum-compatible manifest to this path')
+    hash_tree_parser.add_argument('--algorithm', default='sha256')
+    hash_tree_parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    hash_tree_parser.add_argument('--no-cache', action='store_true', help='Always re-read files instead of using the hash cache')
+
+    verify_manifest_parser = subparsers.add_parser('verify-manifest', help='Check files against a checksum manifest (NDJSON progress)')
+    verify_manifest_parser.add_argument('--manifest', required=True, help='Manifest to verify')
+    verify_manifest_parser.add_argument('--root', required=False, help="Base directory for manifest paths (default: the manifest's directory)")
+    verify_manifest_parser.add_argument('--algorithm', default='sha256')
+    verify_manifest_parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    verify_manifest_parser.add_argument('--no-cache', action='store_true', help='Always re-read files instead of using the hash cache')
+
+    hash_cache_parser = subparsers.add_parser('hash-cache', help='Show file hash cache statistics')
+    hash_cache_parser.add_argument('--clear', action='store_true', help='Drop every cached digest')
     
     # Algorithms
     algorithms_parser = subparsers.add_parser('algorithms')
 
+    # Benchmarks
+    bench_parser = subparsers.add_parser('bench', help='Measure engine throughput (MB/s, ops/s) on this machine')
+    bench_parser.add_argument('--engines', required=False, help=f"Comma-separated subset of: {','.join(ENGINES)}")
+    bench_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Timed runs per measurement (median reported)')
+    bench_parser.add_argument('--cached', action='store_true', help='Return the last saved results without running')
+
     # Logs
     logs_parser = subparsers.add_parser('get-logs')
+    logs_parser.add_argument('--count', type=int, default=20, help='Number of entries to return')
+    logs_parser.add_argument('--before', type=int, required=False, help='Cursor (next_before) from a previous page')
     log_stats_parser = subparsers.add_parser('get-log-stats')
+    for log_query_parser in (logs_parser, log_stats_parser):
+        log_query_parser.add_argument('--since', required=False, help='Only entries at or after this ISO timestamp (UTC)')
+        log_query_parser.add_argument('--until', required=False, help='Only entries at or before this ISO timestamp (UTC)')
+        log_query_parser.add_argument('--operation', required=False, help='Only entries for this operation (e.g. DECODE_VIDEO)')
+        log_query_parser.add_argument('--status', dest='log_status', required=False, help='Only entries with this status (e.g. FAILED)')
+        log_query_parser.add_argument('--filename', required=False, help='Only entries for this file name')
+    migrate_logs_parser = subparsers.add_parser('migrate-logs', help='Import JSON-lines logs into the SQLite journal')
+    rotate_logs_parser = subparsers.add_parser('rotate-logs', help='Archive the live log into a compressed segment')
+
+    # Local HTTP service
+    serve_parser = subparsers.add_parser('serve', help='Serve the operations over HTTP on the loopback interface')
+    serve_parser.add_argument('--host', default='127.0.0.1', help='Loopback address to bind')
+    serve_parser.add_argument('--port', type=int, default=8765, help='TCP port (0 picks a free one)')
 
     # RSA commands
     rsa_parser = subparsers.add_parser('rsa', help='RSA key management')
@@ -587,6 +902,7 @@ def main():
 
     rsa_generate_parser = rsa_subparsers.add_parser('generate-keys', help='Generate RSA key pair')
     rsa_generate_parser.add_argument('--output-dir', required=False, help='Directory to save the generated keys')
+    rsa_generate_parser.add_argument('--bits', type=int, default=DEFAULT_KEY_SIZE, choices=SUPPORTED_KEY_SIZES, help='RSA key size')
     
     rsa_import_parser = rsa_subparsers.add_parser('import-keys', help='Import RSA key pair')
     rsa_import_parser.add_argument('--pub-file', required=True, help='Path to public key file')
@@ -600,7 +916,19 @@ def main():
 
     rsa_decrypt_parser = rsa_subparsers.add_parser('decrypt', help='Decrypt a message with RSA')
     rsa_decrypt_parser.add_argument('--ciphertext', required=True, help='Ciphertext to decrypt')
-    
+
+    rsa_pool_fill_parser = rsa_subparsers.add_parser('pool-fill', help='Pre-generate RSA key pairs into the key pool')
+    rsa_pool_fill_parser.add_argument('--bits', type=int, default=DEFAULT_KEY_SIZE, choices=SUPPORTED_KEY_SIZES, help='RSA key size')
+    rsa_pool_fill_parser.add_argument('--count', type=int, default=DEFAULT_POOL_TARGET, help='Number of keys to keep ready')
+    rsa_pool_fill_parser.add_argument('--background', action='store_true', help='Fill the pool in a detached process')
+
+    rsa_subparsers.add_parser('pool-status', help='Show the number of pre-generated RSA keys')
+
+    rsa_subparsers.add_parser('key-stats', help='Show RSA key store cache statistics')
+    return parser
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
     
     if not args.command:
@@ -608,41 +936,11 @@ def main():
         return
     
     try:
-        # Route to appropriate handler
-        if args.command == 'encode-image':
-            result = process_image_encode(args)
-        elif args.command == 'decode-image':
-            result = process_image_decode(args)
-        elif args.command == 'encode-audio':
-            result = process_audio_encode(args)
-        elif args.command == 'decode-audio':
-            result = process_audio_decode(args)
-        elif args.command == 'encode-video':
-            result = process_video_encode(args)
-        elif args.command == 'decode-video':
-            result = process_video_decode(args)
-        elif args.command == 'encode-text':
-            result = process_text_encode(args)
-        elif args.command == 'decode-text':
-            result = process_text_decode(args)
-        elif args.command == 'encrypt':
-            result = process_encrypt(args)
-        elif args.command == 'decrypt':
-            result = process_decrypt(args)
-        elif args.command == 'hash':
-            result = process_hash(args)
-        elif args.command == 'verify-hash':
-            result = process_verify_hash(args)
-        elif args.command == 'algorithms':
-            result = process_algorithms(args)
-        elif args.command == 'get-logs':
-            result = process_get_logs(args)
-        elif args.command == 'get-log-stats':
-            result = process_get_log_stats(args)
-        elif args.command == 'rsa':
-            result = process_rsa_command(args)
+        if args.profile:
+            result, profile = run_profiled(args.profile, args.command, dispatch, args)
+            result["profile"] = profile
         else:
-            result = {"status": "error", "message": f"Unknown command: {args.command}"}
+            result = dispatch(args)
         
         # Output result as JSON
         print(json.dumps(result))
@@ -0,0 +1 @@
+"""Performance benchmarks for StegoCrypt Suite (run with pytest-benchmark)."""
@@ -0,0 +1,35 @@
+"""
+Fixtures for the StegoCrypt Suite benchmark suite.
+
+Benchmarks are skipped in ordinary test runs; run them with
+`python scripts/run_tests.py --type benchmark` (or pytest --benchmark-only),
+which also saves a JSON baseline and fails on regressions against the
+previous one.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from .covers import CoverFactory
+
+BENCHMARK_DIR = Path(__file__).parent
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("benchmark_only", default=False):
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run with --benchmark-only")
+    for item in items:
+        if BENCHMARK_DIR in Path(item.path).parents:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def covers(tmp_path_factory):
+    """Session-wide factory of synthetic covers."""
+    return CoverFactory(tmp_path_factory.mktemp("covers"))
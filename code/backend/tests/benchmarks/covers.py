@@ -0,0 +1,75 @@
+"""
+Synthetic cover generation for the benchmark suite.
+
+The quick tier keeps a full benchmark run to a few minutes; the full tier
+(STEGOCRYPT_BENCH_FULL=1) adds the large covers: images up to 50 MP,
+WAVs up to one hour and 720p video.
+"""
+
+import os
+
+import pytest
+
+import benchmark
+from benchmark import make_image, make_wav, make_cover_text, make_data
+
+BENCH_FULL = os.environ.get("STEGOCRYPT_BENCH_FULL") == "1"
+
+IMAGE_MEGAPIXELS = ([0.1, 1], [5, 12, 50])
+WAV_SECONDS = ([1, 10], [60, 600, 3600])
+VIDEO_SHAPES = ([(320, 240, 30)], [(1280, 720, 300)])
+TEXT_WORDS = ([10_000], [1_000_000])
+TEXT_MEGABYTES = ([10], [50])
+# The generated cover text averages about 6.4 bytes per word
+WORDS_PER_MEGABYTE = 157_000
+DATA_MEGABYTES = ([1, 16], [64, 256])
+
+# Payload hidden by the steganography benchmarks (the image decoder stops
+# after 1000 characters, so keep it well below that)
+MESSAGE = benchmark.MESSAGE
+
+
+def sizes(tier, label=str):
+    """Parametrize over a (quick, full) size tier; full sizes are slow and opt-in."""
+    quick, full = tier
+    full_marks = [
+        pytest.mark.slow,
+        pytest.mark.skipif(not BENCH_FULL, reason="set STEGOCRYPT_BENCH_FULL=1 for the full size sweep"),
+    ]
+    return ([pytest.param(value, id=label(value)) for value in quick]
+            + [pytest.param(value, id=label(value), marks=full_marks) for value in full])
+
+
+def make_avi(path, width, height, frames):
+    if not benchmark.make_avi(path, width, height, frames):
+        pytest.skip("OpenCV has no FFV1 encoder on this machine")
+
+
+class CoverFactory:
+    """Creates each synthetic cover once per session and returns its path."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._made = {}
+
+    def _get(self, name, make, *args):
+        path = self.directory / name
+        if name not in self._made:
+            make(path, *args)
+            self._made[name] = path
+        return str(path)
+
+    def image(self, megapixels):
+        return self._get(f"cover_{megapixels}mp.png", make_image, megapixels)
+
+    def wav(self, seconds):
+        return self._get(f"cover_{seconds}s.wav", make_wav, seconds)
+
+    def avi(self, width, height, frames):
+        return self._get(f"cover_{width}x{height}x{frames}.avi", make_avi, width, height, frames)
+
+    def text(self, words):
+        return self._get(f"cover_{words}w.txt", make_cover_text, words)
+
+    def data(self, megabytes):
+        return self._get(f"data_{megabytes}mb.bin", make_data, megabytes)
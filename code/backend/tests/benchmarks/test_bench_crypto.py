@@ -0,0 +1,105 @@
+"""
+Benchmarks for key derivation and AES, RSA and X25519 encryption throughput.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from Crypto.PublicKey import RSA
+
+from cryptography.aes_crypto import get_key_from_password, encrypt_aes, decrypt_aes
+from cryptography.rsa_crypto import encrypt_rsa_payload, decrypt_rsa_payload, max_oaep_message_size
+
+from .covers import DATA_MEGABYTES, sizes
+
+try:
+    # Needs the pyca/cryptography package, which the local cryptography
+    # package can shadow; the module exits when it is unavailable
+    from filesecuritywithx25519 import X25519FileEncryption
+except (ImportError, SystemExit):
+    X25519FileEncryption = None
+
+PASSWORD = "benchmark password"
+PAYLOAD_BYTES = [1024, 1024 * 1024]
+
+
+@pytest.fixture(scope="module")
+def rsa_key():
+    return RSA.generate(2048)
+
+
+class TestKeyDerivationBenchmarks:
+    """PBKDF2 with and without the derived key cache."""
+
+    def test_pbkdf2_random_salt(self, benchmark):
+        key, _ = benchmark(get_key_from_password, PASSWORD)
+        assert len(key) == 16
+
+    def test_pbkdf2_cached_salt(self, benchmark):
+        salt = os.urandom(16)
+        key, _ = benchmark(get_key_from_password, PASSWORD, salt)
+        assert len(key) == 16
+
+
+class TestAESBenchmarks:
+    """AES encrypt/decrypt throughput."""
+
+    @pytest.mark.parametrize("size", PAYLOAD_BYTES, ids=lambda n: f"{n}B")
+    def test_encrypt_aes(self, benchmark, size):
+        key, _ = get_key_from_password(PASSWORD, b"\0" * 16)
+        benchmark.extra_info["bytes"] = size
+        assert benchmark(encrypt_aes, key, "A" * size)
+
+    @pytest.mark.parametrize("size", PAYLOAD_BYTES, ids=lambda n: f"{n}B")
+    def test_decrypt_aes(self, benchmark, size):
+        key, _ = get_key_from_password(PASSWORD, b"\0" * 16)
+        ciphertext = encrypt_aes(key, "A" * size)
+        benchmark.extra_info["bytes"] = size
+        assert len(benchmark(decrypt_aes, key, ciphertext)) == size
+
+
+class TestRSABenchmarks:
+    """RSA-OAEP for single-block messages and the hybrid envelope beyond that."""
+
+    def test_encrypt_oaep_block(self, benchmark, rsa_key):
+        message = "A" * max_oaep_message_size(rsa_key)
+        assert benchmark(encrypt_rsa_payload, rsa_key.publickey(), message)
+
+    def test_decrypt_oaep_block(self, benchmark, rsa_key):
+        message = "A" * max_oaep_message_size(rsa_key)
+        ciphertext = encrypt_rsa_payload(rsa_key.publickey(), message)
+        assert benchmark(decrypt_rsa_payload, rsa_key, ciphertext) == message
+
+    @pytest.mark.parametrize("size", PAYLOAD_BYTES, ids=lambda n: f"{n}B")
+    def test_hybrid_round_trip(self, benchmark, rsa_key, size):
+        message = "A" * size
+        benchmark.extra_info["bytes"] = size
+
+        def round_trip():
+            return decrypt_rsa_payload(rsa_key, encrypt_rsa_payload(rsa_key.publickey(), message))
+
+        assert benchmark(round_trip) == message
+
+
+@pytest.mark.skipif(X25519FileEncryption is None, reason="filesecuritywithx25519 needs pyca/cryptography")
+class TestX25519Benchmarks:
+    """X25519 KEM + AES-GCM file encryption."""
+
+    @pytest.mark.parametrize("megabytes", sizes(DATA_MEGABYTES, lambda mb: f"{mb}MB"))
+    def test_encrypt_decrypt_file(self, benchmark, covers, megabytes, tmp_path):
+        engine = X25519FileEncryption()
+        public_key, private_key, _ = engine.generate_keypair()
+        source = covers.data(megabytes)
+        encrypted = str(tmp_path / "data.x25f")
+        decrypted = str(tmp_path / "data.out")
+        benchmark.extra_info["bytes"] = os.path.getsize(source)
+
+        def round_trip():
+            engine.encrypt_file(source, encrypted, public_key)
+            return engine.decrypt_file(encrypted, decrypted, private_key)
+
+        benchmark.pedantic(round_trip, rounds=3, iterations=1)
+        assert os.path.getsize(decrypted) == os.path.getsize(source)
@@ -0,0 +1,114 @@
+"""
+Benchmarks for file hashing and log queries.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import logs
+from hash_cache import HashCache
+from hashing import hash_file, merkle_hash_file, get_supported_algorithms
+from log_journal import LogJournal
+
+from .covers import DATA_MEGABYTES, sizes
+
+LOG_ENTRIES = 50_000
+OPERATIONS = ("ENCODE_IMAGE", "DECODE_IMAGE", "ENCODE_VIDEO", "DECODE_VIDEO", "HASH", "ENCRYPT")
+
+
+def synthetic_entries(count):
+    start = datetime(2026, 1, 1)
+    for n in range(count):
+        yield {
+            "timestamp": (start + timedelta(seconds=n * 10)).isoformat(),
+            "operation": OPERATIONS[n % len(OPERATIONS)],
+            "status": "FAILED" if n % 17 == 0 else "SUCCESS",
+            "details": {"filename": f"file_{n % 500}.png", "timing": {"duration_ms": n % 900 + 1}},
+        }
+
+
+class TestHashingBenchmarks:
+    """Streaming file hashing throughput per algorithm."""
+
+    @pytest.mark.parametrize("algorithm", get_supported_algorithms())
+    @pytest.mark.parametrize("megabytes", sizes(DATA_MEGABYTES, lambda mb: f"{mb}MB"))
+    def test_hash_file(self, benchmark, covers, megabytes, algorithm):
+        path = covers.data(megabytes)
+        benchmark.extra_info["bytes"] = os.path.getsize(path)
+        digests = benchmark.pedantic(hash_file, args=(path, [algorithm]), rounds=3, iterations=1)
+        assert algorithm in digests
+
+    @pytest.mark.parametrize("megabytes", sizes(DATA_MEGABYTES, lambda mb: f"{mb}MB"))
+    def test_merkle_hash_file(self, benchmark, covers, megabytes):
+        path = covers.data(megabytes)
+        benchmark.extra_info["bytes"] = os.path.getsize(path)
+        tree = benchmark.pedantic(merkle_hash_file, args=(path,), kwargs={"leaf_size": 1024 * 1024},
+                                  rounds=3, iterations=1)
+        assert tree["root"]
+
+    def test_hash_cache_hit(self, benchmark, covers, tmp_path):
+        cache = HashCache(str(tmp_path / "cache.sqlite3"))
+        path = covers.data(DATA_MEGABYTES[0][-1])
+        cache.get_file_digest(path)
+        assert benchmark(cache.get_file_digest, path)
+        cache.close()
+
+
+@pytest.fixture(scope="module")
+def jsonl_log(tmp_path_factory):
+    """A JSON-lines log of LOG_ENTRIES entries split across rotated segments."""
+    directory = tmp_path_factory.mktemp("logs")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(logs, "LOG_DIR", str(directory))
+        patch.setattr(logs, "LOG_FILE", str(directory / "stegocrypt.log"))
+        patch.setattr(logs, "SEGMENT_INDEX_FILE", str(directory / "segments.json"))
+        patch.setattr(logs, "ROTATION_LOCK_FILE", str(directory / ".rotate.lock"))
+        patch.setattr(logs, "STATS_CHECKPOINT_FILE", str(directory / "stats_checkpoint.json"))
+        patch.setattr(logs, "LOG_RETENTION_DAYS", 0)
+        entries = list(synthetic_entries(LOG_ENTRIES))
+        per_segment = LOG_ENTRIES // 5
+        for start in range(0, LOG_ENTRIES, per_segment):
+            with open(logs.LOG_FILE, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(e) + "\n" for e in entries[start:start + per_segment])
+            if start + per_segment < LOG_ENTRIES:
+                logs.rotate_log()
+        yield entries
+
+
+@pytest.fixture(scope="module")
+def journal(tmp_path_factory):
+    store = LogJournal(str(tmp_path_factory.mktemp("journal") / "journal.sqlite3"))
+    store.insert_many(synthetic_entries(LOG_ENTRIES))
+    yield store
+    store.close()
+
+
+class TestLogQueryBenchmarks:
+    """Log reads on the JSON-lines files and the SQLite journal."""
+
+    def test_jsonl_recent_page(self, benchmark, jsonl_log):
+        assert len(benchmark(logs.get_logs, 20)) == 20
+
+    def test_jsonl_time_range(self, benchmark, jsonl_log):
+        since = jsonl_log[LOG_ENTRIES // 10]["timestamp"]
+        until = jsonl_log[LOG_ENTRIES // 10 + 100]["timestamp"]
+        assert len(benchmark(logs.get_logs, 200, None, since, until)) == 101
+
+    def test_jsonl_incremental_stats(self, benchmark, jsonl_log):
+        assert benchmark(logs.get_log_stats)["total_operations"] == LOG_ENTRIES
+
+    def test_jsonl_filtered_stats(self, benchmark, jsonl_log):
+        stats = benchmark(logs.get_log_stats, None, None, "DECODE_VIDEO", "FAILED")
+        assert stats["total_operations"] > 0
+
+    def test_journal_filtered_stats(self, benchmark, journal):
+        stats = benchmark(journal.stats, None, None, "DECODE_VIDEO", "FAILED")
+        assert stats["total_operations"] > 0
+
+    def test_journal_filename_history(self, benchmark, journal):
+        assert len(benchmark(journal.get_page, 20, filename="file_42.png")["logs"]) == 20
@@ -0,0 +1,125 @@
+"""
+Benchmarks for encoding and decoding with every carrier type.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from steganography.image_stego import encode_image, decode_image
+from steganography.audio_stego import encode_audio, decode_audio
+from steganography.video_stego import encode_video, decode_video
+from steganography.text_stego import encode_text_data, decode_text_data
+
+from .covers import (
+    IMAGE_MEGAPIXELS,
+    WAV_SECONDS,
+    VIDEO_SHAPES,
+    TEXT_WORDS,
+    TEXT_MEGABYTES,
+    WORDS_PER_MEGABYTE,
+    MESSAGE,
+    sizes,
+)
+
+# Large covers take seconds per call, so use a fixed number of rounds
+ROUNDS = 3
+
+
+def run(benchmark, func, *args, carrier_bytes):
+    benchmark.extra_info["carrier_bytes"] = carrier_bytes
+    return benchmark.pedantic(func, args=args, rounds=ROUNDS, iterations=1, warmup_rounds=0)
+
+
+class TestImageBenchmarks:
+    """Image LSB encode/decode from 0.1 to 50 megapixels."""
+
+    @pytest.mark.parametrize("megapixels", sizes(IMAGE_MEGAPIXELS, lambda mp: f"{mp}MP"))
+    def test_encode_image(self, benchmark, covers, megapixels):
+        path = covers.image(megapixels)
+        encoded = run(benchmark, encode_image, path, MESSAGE, carrier_bytes=os.path.getsize(path))
+        assert encoded.startswith(b"\x89PNG")
+
+    @pytest.mark.parametrize("megapixels", sizes(IMAGE_MEGAPIXELS, lambda mp: f"{mp}MP"))
+    def test_decode_image(self, benchmark, covers, megapixels, tmp_path):
+        stego_path = tmp_path / "stego.png"
+        stego_path.write_bytes(encode_image(covers.image(megapixels), MESSAGE))
+        decoded = run(benchmark, decode_image, str(stego_path), carrier_bytes=stego_path.stat().st_size)
+        assert decoded == MESSAGE
+
+
+class TestAudioBenchmarks:
+    """WAV LSB encode/decode from one second to one hour."""
+
+    @pytest.mark.parametrize("seconds", sizes(WAV_SECONDS, lambda s: f"{s}s"))
+    def test_encode_audio(self, benchmark, covers, seconds):
+        path = covers.wav(seconds)
+        encoded = run(benchmark, encode_audio, path, MESSAGE, carrier_bytes=os.path.getsize(path))
+        assert encoded[:4] == b"RIFF"
+
+    @pytest.mark.parametrize("seconds", sizes(WAV_SECONDS, lambda s: f"{s}s"))
+    def test_decode_audio(self, benchmark, covers, seconds, tmp_path):
+        stego_path = tmp_path / "stego.wav"
+        stego_path.write_bytes(encode_audio(covers.wav(seconds), MESSAGE))
+        decoded = run(benchmark, decode_audio, str(stego_path), carrier_bytes=stego_path.stat().st_size)
+        assert decoded == MESSAGE
+
+
+class TestVideoBenchmarks:
+    """Lossless AVI LSB encode/decode."""
+
+    @pytest.mark.parametrize("shape", sizes(VIDEO_SHAPES, lambda s: "{}x{}x{}f".format(*s)))
+    def test_encode_video(self, benchmark, covers, shape):
+        path = covers.avi(*shape)
+        encoded = run(benchmark, encode_video, path, MESSAGE, carrier_bytes=os.path.getsize(path))
+        assert encoded
+
+    @pytest.mark.parametrize("shape", sizes(VIDEO_SHAPES, lambda s: "{}x{}x{}f".format(*s)))
+    def test_decode_video(self, benchmark, covers, shape):
+        video_bytes = encode_video(covers.avi(*shape), MESSAGE)
+        decoded = run(benchmark, decode_video, video_bytes, carrier_bytes=len(video_bytes))
+        assert decoded == MESSAGE
+
+
+class TestTextBenchmarks:
+    """Zero-width character encode/decode on large cover texts."""
+
+    @pytest.mark.parametrize("words", sizes(TEXT_WORDS, lambda w: f"{w}words"))
+    def test_encode_text(self, benchmark, covers, words):
+        with open(covers.text(words), encoding="utf-8") as f:
+            cover_text = f.read()
+        encoded = run(benchmark, encode_text_data, MESSAGE, cover_text, carrier_bytes=len(cover_text.encode()))
+        assert len(encoded) > len(cover_text)
+
+    @pytest.mark.parametrize("words", sizes(TEXT_WORDS, lambda w: f"{w}words"))
+    def test_decode_text(self, benchmark, covers, words):
+        with open(covers.text(words), encoding="utf-8") as f:
+            stego_text = encode_text_data(MESSAGE, f.read())
+        decoded = run(benchmark, decode_text_data, stego_text, carrier_bytes=len(stego_text.encode()))
+        assert decoded == MESSAGE
+
+    @staticmethod
+    def full_payload(words):
+        # One character per cover word, leaving one word for the terminator
+        alphabet = "U2FsdGVkX1+/0123456789="
+        return (alphabet * (words // len(alphabet) + 1))[:words - 1]
+
+    @pytest.mark.parametrize("megabytes", sizes(TEXT_MEGABYTES, lambda mb: f"{mb}MB"))
+    def test_encode_text_full_payload(self, benchmark, covers, megabytes):
+        words = megabytes * WORDS_PER_MEGABYTE
+        with open(covers.text(words), encoding="utf-8") as f:
+            cover_text = f.read()
+        message = self.full_payload(words)
+        encoded = run(benchmark, encode_text_data, message, cover_text, carrier_bytes=len(cover_text.encode()))
+        assert len(encoded) > len(cover_text)
+
+    @pytest.mark.parametrize("megabytes", sizes(TEXT_MEGABYTES, lambda mb: f"{mb}MB"))
+    def test_decode_text_full_payload(self, benchmark, covers, megabytes):
+        words = megabytes * WORDS_PER_MEGABYTE
+        message = self.full_payload(words)
+        with open(covers.text(words), encoding="utf-8") as f:
+            stego_text = encode_text_data(message, f.read())
+        decoded = run(benchmark, decode_text_data, stego_text, carrier_bytes=len(stego_text.encode()))
+        assert decoded == message
@@ -0,0 +1,109 @@
+"""
+Test suite for the StegoCrypt Suite asyncio facade.
+Tests pool dispatch, inline hashing, limits and cancellation.
+"""
+
+import pytest
+import tempfile
+import asyncio
+import time
+import subprocess
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "Backend"))
+
+from stegocrypt import aio
+from hashing import hash_file, hash_message
+
+
+class TestAio:
+    """Test the asyncio facade."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        aio.configure(processes=1, threads=2, max_in_flight=4)
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        asyncio.run(aio.shutdown())
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_text_round_trip_on_process_pool(self):
+        """Test that encryption and steganography run on the process pool."""
+        async def round_trip():
+            ciphertext = await aio.encrypt_message("async secret", "AES", "pw")
+            stego = await aio.encode_text(ciphertext, "a b c d e f g h i j " * 10)
+            recovered = await aio.decode_text(stego)
+            return await aio.decrypt_message(recovered, "AES", "pw")
+
+        assert asyncio.run(round_trip()) == "async secret"
+        assert aio._process_pool is not None
+
+    def test_import_leaves_cli_unloaded(self):
+        """Test that importing the facade does not import the CLI, which reconfigures stdout."""
+        backend = str(Path(__file__).parent.parent)
+        code = "import sys; from stegocrypt import aio; print('stegocrypt_cli' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], cwd=backend, capture_output=True, text=True)
+        assert result.stdout.strip() == "False", result.stderr
+
+    def test_small_hashes_run_inline(self):
+        """Test that small inputs are hashed without starting a pool."""
+        small = self.temp_dir / "small.bin"
+        small.write_bytes(b"x" * 1024)
+
+        async def hashes():
+            return await aio.hash_message("hello"), await aio.hash_file(str(small))
+
+        digest, file_digests = asyncio.run(hashes())
+        assert digest == hash_message("hello")
+        assert file_digests == hash_file(str(small))
+        assert aio._thread_pool is None and aio._process_pool is None
+
+    def test_large_file_hash_uses_thread_pool(self):
+        """Test that larger files are hashed on the thread pool."""
+        large = self.temp_dir / "large.bin"
+        large.write_bytes(b"y" * (aio.INLINE_HASH_BYTES + 1))
+
+        result = asyncio.run(aio.hash_file(str(large), ["sha256", "md5"]))
+
+        assert result == hash_file(str(large), ["sha256", "md5"])
+        assert aio._thread_pool is not None
+
+    def test_waiting_call_can_be_cancelled(self):
+        """Test that a call waiting for an in-flight slot is cancelled without running."""
+        aio.configure(max_in_flight=1)
+        ran = []
+
+        def work(label):
+            time.sleep(0.2)
+            ran.append(label)
+            return label
+
+        async def scenario():
+            first = asyncio.create_task(aio.run_io(work, "first"))
+            await asyncio.sleep(0.05)
+            second = asyncio.create_task(aio.run_io(work, "second"))
+            await asyncio.sleep(0.05)
+            second.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await second
+            return await first
+
+        assert asyncio.run(scenario()) == "first"
+        assert ran == ["first"]
+
+    def test_limits(self):
+        """Test that limits are reported and validated."""
+        aio.configure(processes=2, max_in_flight=8)
+        assert aio.get_limits() == {"processes": 2, "threads": 2, "max_in_flight": 8}
+        with pytest.raises(ValueError):
+            aio.configure(threads=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
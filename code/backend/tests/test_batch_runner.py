@@ -0,0 +1,133 @@
+"""
+Test suite for StegoCrypt Suite batch jobs.
+Tests manifest parsing, the process pool runner and resuming from the journal.
+"""
+
+import pytest
+import tempfile
+import json
+import base64
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "Backend"))
+
+from batch_runner import load_jobs, read_journal, run_batch
+from cryptography.message_crypto import decrypt_message
+from steganography.text_stego import decode_text_data
+
+COVER_TEXT = "the quick brown fox jumps over the lazy dog " * 40
+
+
+class TestBatchRunner:
+    """Test batch manifests and the process pool runner."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "cover.txt").write_text(COVER_TEXT, encoding="utf-8")
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def write_manifest(self, jobs, name="jobs.json"):
+        path = self.temp_dir / name
+        path.write_text(json.dumps(jobs), encoding="utf-8")
+        return str(path)
+
+    def text_job(self, output, input_file="cover.txt"):
+        return {"carrier": "text", "input": input_file, "output": output,
+                "message": "batch secret", "algorithm": "AES", "password": "pw"}
+
+    def test_load_json_and_csv_manifests(self):
+        """Test that both formats load, with paths resolved against the manifest."""
+        json_path = self.write_manifest({"jobs": [
+            {"carrier": "Image", "input": "a.png", "output": "out/a", "message": "m", "algorithm": "RSA"},
+        ]})
+        csv_path = self.temp_dir / "jobs.csv"
+        csv_path.write_text("carrier,input,output,message,algorithm,password\n"
+                            "audio,b.wav,out/b.wav,m,AES,pw\n", encoding="utf-8")
+
+        (image_job,) = load_jobs(json_path)
+        (audio_job,) = load_jobs(str(csv_path))
+
+        assert image_job["carrier"] == "image"
+        assert image_job["output"] == str(self.temp_dir / "out" / "a.png")
+        assert image_job["id"] == image_job["output"]
+        assert audio_job["input"] == str(self.temp_dir / "b.wav")
+        assert audio_job["password"] == "pw"
+
+    def test_invalid_manifests(self):
+        """Test that incomplete jobs, unknown carriers and duplicate ids are rejected."""
+        incomplete = {"carrier": "text", "input": "cover.txt", "output": "x.txt"}
+        with pytest.raises(ValueError, match="missing message, algorithm"):
+            load_jobs(self.write_manifest([incomplete]))
+        with pytest.raises(ValueError, match="unsupported carrier"):
+            load_jobs(self.write_manifest([{**self.text_job("x.txt"), "carrier": "pdf"}]))
+        with pytest.raises(ValueError, match="duplicate id"):
+            load_jobs(self.write_manifest([self.text_job("x.txt"), self.text_job("x.txt")]))
+
+    def test_run_batch_reports_each_job(self):
+        """Test that every job produces a record and successful outputs decode."""
+        manifest = self.write_manifest([
+            self.text_job("out/one.txt"),
+            self.text_job("out/two.txt"),
+            self.text_job("out/three.txt", input_file="missing.txt"),
+        ])
+        records = []
+
+        summary = run_batch(manifest, workers=2, progress=records.append)
+
+        assert (summary["total"], summary["succeeded"], summary["failed"], summary["skipped"]) == (3, 2, 1, 0)
+        by_status = {}
+        for record in records:
+            by_status.setdefault(record["status"], []).append(record)
+        assert len(by_status["success"]) == 2 and len(by_status["error"]) == 1
+        assert sorted(record["done"] for record in records) == [1, 2, 3]
+        stego = (self.temp_dir / "out" / "one.txt").read_text(encoding="utf-8")
+        assert decode_text_data(stego)
+        assert set(read_journal(summary["journal"])) == {str(self.temp_dir / "out" / name)
+                                                          for name in ("one.txt", "two.txt")}
+
+    def test_jobs_use_their_own_salt(self):
+        """Test that jobs sharing a password do not share an AES salt."""
+        manifest = self.write_manifest([self.text_job("out/one.txt"), self.text_job("out/two.txt")])
+        run_batch(manifest, workers=1)
+
+        payloads = [decode_text_data((self.temp_dir / "out" / name).read_text(encoding="utf-8"))
+                    for name in ("one.txt", "two.txt")]
+        salts = {base64.b64decode(payload)[:16] for payload in payloads}
+        assert len(salts) == 2
+        assert all(decrypt_message(payload, "AES", "pw") == "batch secret" for payload in payloads)
+
+    def test_resume_skips_completed_jobs(self):
+        """Test that a re-run only processes jobs missing from the journal or their output."""
+        manifest = self.write_manifest([self.text_job("out/one.txt"), self.text_job("out/two.txt")])
+        run_batch(manifest, workers=1)
+        (self.temp_dir / "out" / "two.txt").unlink()
+        # A crash mid-write leaves a partial last line in the journal
+        with open(manifest + ".journal", "a", encoding="utf-8") as f:
+            f.write('{"id": "trunc')
+
+        summary = run_batch(manifest, workers=1)
+
+        assert (summary["succeeded"], summary["skipped"]) == (1, 1)
+        assert (self.temp_dir / "out" / "two.txt").exists()
+
+    def test_no_resume_runs_everything(self):
+        """Test that resume=False starts a fresh journal."""
+        manifest = self.write_manifest([self.text_job("out/one.txt")])
+        run_batch(manifest, workers=1)
+
+        summary = run_batch(manifest, workers=1, resume=False)
+
+        assert (summary["succeeded"], summary["skipped"]) == (1, 0)
+        assert len(read_journal(summary["journal"])) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
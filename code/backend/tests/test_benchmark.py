@@ -0,0 +1,82 @@
+"""
+Test suite for the StegoCrypt Suite `bench` engine benchmarks.
+Tests measurements, result caching and engine selection.
+"""
+
+import pytest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "Backend"))
+
+import benchmark
+from benchmark import run_benchmarks, load_cached_results
+
+
+class TestBench:
+    """Test on-device engine benchmarks."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    @pytest.fixture(autouse=True)
+    def small_workloads(self, monkeypatch):
+        monkeypatch.setattr(benchmark, "BENCH_CACHE_FILE", str(self.temp_dir / "bench_results.json"))
+        monkeypatch.setattr(benchmark, "DATA_MEGABYTES", 1)
+        monkeypatch.setattr(benchmark, "TEXT_WORDS", 500)
+
+    def test_reports_throughput_per_engine(self):
+        """Test that engines report MB/s and ops/s."""
+        report = run_benchmarks(["text_zwc", "hash"], repeat=1)
+
+        text = report["results"]["text_zwc"]
+        assert text["encode"]["mb_per_s"] > 0 and text["decode"]["ops_per_s"] > 0
+        hashes = report["results"]["hash"]
+        assert "sha256" in hashes
+        assert hashes["sha256"]["bytes"] == 1024 * 1024
+        assert report["machine"]["cpu_count"] and report["repeat"] == 1
+
+    def test_results_are_cached_and_merged(self):
+        """Test that re-running one engine keeps the cached results of the others."""
+        assert load_cached_results() is None
+        run_benchmarks(["text_zwc"], repeat=1)
+        run_benchmarks(["hash"], repeat=1)
+
+        cached = load_cached_results()
+        assert set(cached["results"]) == {"text_zwc", "hash"}
+
+    def test_no_save(self):
+        """Test that save=False leaves the cache untouched."""
+        run_benchmarks(["text_zwc"], repeat=1, save=False)
+        assert load_cached_results() is None
+
+    def test_unavailable_engine_is_reported(self, monkeypatch):
+        """Test that a failing engine is reported without aborting the run."""
+        def broken(workdir, repeat):
+            raise RuntimeError("encoder missing")
+
+        monkeypatch.setitem(benchmark._RUNNERS, "video_lsb", broken)
+        report = run_benchmarks(["video_lsb", "text_zwc"], repeat=1)
+
+        assert report["results"]["video_lsb"] == {"status": "error", "message": "encoder missing"}
+        assert "encode" in report["results"]["text_zwc"]
+
+    def test_invalid_arguments(self):
+        """Test that unknown engines and a zero repeat count are rejected."""
+        with pytest.raises(ValueError):
+            run_benchmarks(["quantum"])
+        with pytest.raises(ValueError):
+            run_benchmarks(["hash"], repeat=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,123 @@
+"""
+Test suite for StegoCrypt Suite capacity analysis.
+Tests header-only capacities against the engines and directory scans.
+"""
+
+import pytest
+import tempfile
+import struct
+from pathlib import Path
+import sys
+import numpy as np
+from PIL import Image
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "Backend"))
+
+from capacity import analyze_carrier, count_words, max_message_bytes, scan_capacity
+from cryptography.message_crypto import encrypt_message
+from steganography.image_stego import encode_image
+from steganography.text_stego import encode_text_data
+from validation.errors import CapacityError
+
+
+class TestCapacity:
+    """Test carrier capacity analysis."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.image_path = self.temp_dir / "cover.png"
+        pixels = np.random.randint(0, 256, (20, 30, 3), dtype=np.uint8)
+        Image.fromarray(pixels, "RGB").save(self.image_path)
+        self.text_path = self.temp_dir / "cover.txt"
+        self.text_path.write_text("alpha beta\r\n  gamma\tdelta " * 50, encoding="utf-8")
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_image_capacity_matches_engine(self):
+        """Test that the reported payload is exactly what encode_image accepts."""
+        report = analyze_carrier(str(self.image_path))
+        assert (report["width"], report["height"]) == (30, 20)
+        payload = report["capacity"][0]["payload_bytes"]
+        assert payload == 20 * 30 * 3 // 8 - len("*^*^*")
+
+        encode_image(str(self.image_path), "x" * payload)
+        with pytest.raises(CapacityError):
+            encode_image(str(self.image_path), "x" * (payload + 1))
+
+    def test_text_capacity_matches_engine(self):
+        """Test word counting across chunks and both text modes."""
+        assert count_words(str(self.text_path), chunk_size=3) == 200
+        cover = self.text_path.read_text(encoding="utf-8")
+        legacy, binary2, binary3 = analyze_carrier(str(self.text_path))["capacity"]
+
+        encode_text_data("x" * legacy["payload_bytes"], cover)
+        with pytest.raises(CapacityError):
+            encode_text_data("x" * (legacy["payload_bytes"] + 1), cover)
+        for entry in (binary2, binary3):
+            encode_text_data("x" * entry["payload_bytes"], cover, "binary", entry["bits_per_symbol"])
+            with pytest.raises(CapacityError):
+                encode_text_data("x" * (entry["payload_bytes"] + 1), cover, "binary", entry["bits_per_symbol"])
+
+    def write_avi(self, name, avih_frames, dmlh_frames=None, extra_segment=False):
+        """Write just the RIFF headers of an AVI (32x24), optionally OpenDML."""
+        avih = struct.pack("<14I", 40000, 0, 0, 0, avih_frames, 0, 1, 0, 32, 24, 0, 0, 0, 0)
+        chunks = b"avih" + struct.pack("<I", len(avih)) + avih
+        if dmlh_frames is not None:
+            dmlh = struct.pack("<I", dmlh_frames) + bytes(244)
+            odml = b"odml" + b"dmlh" + struct.pack("<I", len(dmlh)) + dmlh
+            chunks += b"LIST" + struct.pack("<I", len(odml)) + odml
+        hdrl = b"hdrl" + chunks
+        body = b"AVI " + b"LIST" + struct.pack("<I", len(hdrl)) + hdrl
+        data = b"RIFF" + struct.pack("<I", len(body)) + body
+        if extra_segment:
+            avix = b"AVIX" + b"LIST" + struct.pack("<I", 4) + b"movi"
+            data += b"RIFF" + struct.pack("<I", len(avix)) + avix
+        path = self.temp_dir / name
+        path.write_bytes(data)
+        return str(path)
+
+    def test_avi_frame_counts(self):
+        """Test that OpenDML files use the dmlh total, not the first segment's avih count."""
+        plain = analyze_carrier(self.write_avi("plain.avi", 10))
+        assert (plain["frames"], plain["estimated"]) == (10, False)
+
+        opendml = analyze_carrier(self.write_avi("odml.avi", 10, dmlh_frames=5000, extra_segment=True))
+        assert (opendml["frames"], opendml["estimated"]) == (5000, False)
+        assert opendml["carrier_bits"] == 5000 * 32 * 24 * 3
+
+        unknown = analyze_carrier(self.write_avi("avix.avi", 10, extra_segment=True))
+        assert (unknown["frames"], unknown["estimated"]) == (10, True)
+
+    def test_encryption_overhead(self):
+        """Test that the largest AES message fills the payload without overflowing."""
+        for payload_chars in (100, 400, 1000):
+            size = max_message_bytes(payload_chars, "AES")
+            assert len(encrypt_message("x" * size, "AES", "pw")) <= payload_chars
+            assert len(encrypt_message("x" * (size + 3), "AES", "pw")) > payload_chars
+        # One OAEP block of a 2048-bit key is 344 base64 characters
+        assert max_message_bytes(343, "RSA") == 0
+        assert max_message_bytes(344, "RSA") == 256 - 42
+
+    def test_scan_directory(self):
+        """Test scanning a tree: known extensions only, errors reported per file."""
+        (self.temp_dir / "notes.bin").write_bytes(b"ignored")
+        (self.temp_dir / "broken.png").write_bytes(b"not a png")
+        records = []
+
+        summary = scan_capacity([str(self.temp_dir)], progress=records.append)
+
+        assert summary == {"files": 2, "errors": 1}
+        by_name = {Path(record["path"]).name: record for record in records}
+        assert set(by_name) == {"cover.png", "cover.txt", "broken.png"}
+        assert by_name["broken.png"]["type"] == "error"
+        assert by_name["cover.txt"]["carrier"] == "text"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,295 @@
+"""
+Test suite for StegoCrypt Suite hashing utilities.
+Tests message hashing and streaming file hashing.
+"""
+
+import pytest
+import tempfile
+import hashlib
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "Backend"))
+
+import hashing
+from hash_cache import HashCache
+from manifest import hash_tree, verify_manifest, parse_manifest, format_manifest_line, _run_pool
+from stegocrypt_cli import build_parser, process_hash
+from hashing import (
+    hash_message,
+    hash_file,
+    verify_file_hash,
+    get_supported_algorithms,
+    merkle_hash_file,
+    merkle_rehash_file,
+    merkle_leaves_for_range,
+)
+
+
+class TestMessageHashing:
+    """Test in-memory message hashing."""
+
+    def test_known_digest(self):
+        """Test a known SHA-256 digest."""
+        assert hash_message("abc") == hashlib.sha256(b"abc").hexdigest()
+
+    def test_unsupported_algorithm(self):
+        """Test that unknown algorithms are rejected."""
+        with pytest.raises(ValueError):
+            hash_message("abc", "crc32")
+
+
+class TestFileHashing:
+    """Test streaming file hashing."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.data = bytes(range(256)) * 5000
+        self.test_file = self.temp_dir / "data.bin"
+        self.test_file.write_bytes(self.data)
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_all_algorithms_single_pass(self, monkeypatch):
+        """Test that every supported digest matches hashlib across buffer boundaries."""
+        monkeypatch.setattr(hashing, "FILE_READ_BUFFER_SIZE", 4096 + 7)
+        digests = hash_file(str(self.test_file), get_supported_algorithms())
+
+        for name in get_supported_algorithms():
+            assert digests[name] == hashlib.new(name, self.data).hexdigest()
+
+    def test_sha3_alias(self):
+        """Test that 'sha3' maps to SHA3-256."""
+        digests = hash_file(str(self.test_file), "sha3")
+        assert digests == {"sha3_256": hashlib.sha3_256(self.data).hexdigest()}
+
+    def test_verify_file_hash(self):
+        """Test file hash verification."""
+        digest = hashlib.sha256(self.data).hexdigest()
+        assert verify_file_hash(str(self.test_file), digest.upper())
+        assert not verify_file_hash(str(self.test_file), "0" * 64)
+
+
+class TestMerkleHashing:
+    """Test parallel Merkle tree hashing."""
+
+    LEAF_SIZE = 1024
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.test_file = self.temp_dir / "data.bin"
+        self.test_file.write_bytes(bytes(range(256)) * 20)  # 5 leaves, last one partial
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_tree_structure(self):
+        """Test leaf digests and root for a small tree."""
+        tree = merkle_hash_file(str(self.test_file), leaf_size=self.LEAF_SIZE, workers=2)
+        data = self.test_file.read_bytes()
+
+        assert len(tree["leaves"]) == 5
+        assert tree["leaves"][4] == hashlib.sha256(b"\x00" + data[4096:]).hexdigest()
+        assert tree["root"] != tree["leaves"][0]
+
+    def test_deterministic_across_worker_counts(self):
+        """Test that the root does not depend on the thread count."""
+        one = merkle_hash_file(str(self.test_file), leaf_size=self.LEAF_SIZE, workers=1)
+        many = merkle_hash_file(str(self.test_file), leaf_size=self.LEAF_SIZE, workers=8)
+        assert one == many
+
+    def test_rehash_only_changed_leaves(self):
+        """Test that a partial rewrite needs only the touched leaves re-read."""
+        tree = merkle_hash_file(str(self.test_file), leaf_size=self.LEAF_SIZE)
+        with open(self.test_file, "r+b") as f:
+            f.seek(2000)
+            f.write(b"rewritten")
+
+        changed = merkle_leaves_for_range(2000, 9, self.LEAF_SIZE)
+        updated = merkle_rehash_file(str(self.test_file), tree["leaves"], changed, leaf_size=self.LEAF_SIZE)
+        full = merkle_hash_file(str(self.test_file), leaf_size=self.LEAF_SIZE)
+
+        assert changed == [1]
+        assert updated == full
+        assert updated["root"] != tree["root"]
+
+    def test_rehash_after_append(self):
+        """Test that leaves added by growing the file are hashed automatically."""
+        tree = merkle_hash_file(str(self.test_file), leaf_size=self.LEAF_SIZE)
+        with open(self.test_file, "ab") as f:
+            f.write(b"x" * 3000)
+
+        updated = merkle_rehash_file(str(self.test_file), tree["leaves"], [], leaf_size=self.LEAF_SIZE)
+        assert updated == merkle_hash_file(str(self.test_file), leaf_size=self.LEAF_SIZE)
+
+    def test_cli_tree_options(self):
+        """Test that the CLI --tree flag needs --file and a single algorithm."""
+        parser = build_parser()
+        result = process_hash(parser.parse_args(["hash", "--file", str(self.test_file), "--tree"]))
+        assert result["status"] == "success"
+        assert result["hash"] == merkle_hash_file(str(self.test_file))["root"]
+
+        result = process_hash(parser.parse_args(
+            ["hash", "--file", str(self.test_file), "--algorithm", "sha256,md5", "--tree"]))
+        assert result["status"] == "error" and "single" in result["message"]
+        result = process_hash(parser.parse_args(["hash", "--message", "hello", "--tree"]))
+        assert result["status"] == "error" and "--file" in result["message"]
+
+
+class TestHashCache:
+    """Test the persistent content hash cache."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.test_file = self.temp_dir / "media.bin"
+        self.test_file.write_bytes(b"carrier" * 1000)
+        self.cache = HashCache(str(self.temp_dir / "cache.sqlite3"), max_entries=2)
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        self.cache.close()
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_unchanged_file_is_not_reread(self, monkeypatch):
+        """Test that a second lookup is served without hashing."""
+        digest = self.cache.get_file_digest(str(self.test_file))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was re-read")
+        monkeypatch.setattr("hash_cache.hash_file", fail)
+
+        assert self.cache.get_file_digest(str(self.test_file)) == digest
+        assert self.cache.stats()["hits"] == 1
+        assert self.cache.stats()["misses"] == 1
+
+    def test_modified_file_is_rehashed(self):
+        """Test that a size or mtime change invalidates the entry."""
+        self.cache.get_file_digest(str(self.test_file))
+        self.test_file.write_bytes(b"changed")
+
+        digest = self.cache.get_file_digest(str(self.test_file))
+        assert digest == hashlib.sha256(b"changed").hexdigest()
+        assert self.cache.stats()["misses"] == 2
+
+    def test_writes_are_batched(self):
+        """Test that lookups commit nothing until a flush, then write everything at once."""
+        import sqlite3
+        other = sqlite3.connect(self.cache.db_path)
+        try:
+            digest = self.cache.get_file_digest(str(self.test_file))
+            assert other.execute("SELECT COUNT(*) FROM file_digests").fetchone()[0] == 0
+            # Served from the pending rows before they are written
+            assert self.cache.get_file_digest(str(self.test_file)) == digest
+
+            self.cache.flush()
+
+            assert other.execute("SELECT digest FROM file_digests").fetchall() == [(digest,)]
+            counters = dict(other.execute("SELECT name, value FROM cache_counters").fetchall())
+            assert counters == {"hits": 1, "misses": 1}
+        finally:
+            other.close()
+
+    def test_row_count_survives_rehash(self):
+        """Test that replacing a stale row does not inflate the running row count."""
+        self.cache.get_file_digest(str(self.test_file))
+        self.cache.flush()
+        self.test_file.write_bytes(b"changed")
+        self.cache.get_file_digest(str(self.test_file))
+        self.cache.flush()
+        assert self.cache._rows == 1 == self.cache.stats()["entries"]
+
+    def test_lru_eviction(self):
+        """Test that the cache stays within its size cap."""
+        self.cache.get_file_digests(str(self.test_file), ["md5", "sha1", "sha256"])
+        assert self.cache.stats()["entries"] == 2
+
+
+class TestManifest:
+    """Test directory tree hashing and manifest verification."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.root = self.temp_dir / "tree"
+        (self.root / "sub").mkdir(parents=True)
+        (self.root / "a.txt").write_bytes(b"alpha")
+        (self.root / "sub" / "b.bin").write_bytes(b"beta" * 100)
+        self.manifest = self.temp_dir / "tree.sha256"
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_hash_tree_writes_sha256sum_manifest(self):
+        """Test that the manifest lists every file in sha256sum format."""
+        records = []
+        summary = hash_tree(str(self.root), manifest_path=str(self.manifest), workers=2,
+                            use_cache=False, progress=records.append)
+
+        assert summary["files"] == 2 and summary["errors"] == 0
+        assert len(records) == 2
+        assert self.manifest.read_text().splitlines() == [
+            f"{hashlib.sha256(b'alpha').hexdigest()}  a.txt",
+            f"{hashlib.sha256(b'beta' * 100).hexdigest()}  sub/b.bin",
+        ]
+
+    def test_verify_manifest_reports_changes(self):
+        """Test that modified and missing files are reported."""
+        hash_tree(str(self.root), manifest_path=str(self.manifest), use_cache=False)
+        (self.root / "a.txt").write_bytes(b"tampered")
+        (self.root / "sub" / "b.bin").unlink()
+
+        records = []
+        summary = verify_manifest(str(self.manifest), root=str(self.root), use_cache=False,
+                                  progress=records.append)
+
+        assert summary == {"ok": 0, "failed": 1, "missing": 1, "algorithm": "sha256", "valid": False}
+        assert {r["path"]: r["status"] for r in records} == {"a.txt": "FAILED", "sub/b.bin": "MISSING"}
+
+    def test_pool_reports_in_completion_order(self):
+        """Test that one slow item does not hold back results submitted after it."""
+        import threading
+        release = threading.Event()
+        order = []
+
+        def work(item):
+            if item == 0:
+                release.wait(5)
+            return item
+
+        def on_result(item, future):
+            order.append(future.result())
+            if len(order) == 3:
+                release.set()
+
+        _run_pool(iter(range(4)), work, on_result, workers=2)
+        assert order[-1] == 0 and sorted(order) == [0, 1, 2, 3]
+
+    def test_escaped_paths_round_trip(self):
+        """Test coreutils-style escaping of unusual file names."""
+        self.manifest.write_text(format_manifest_line("ab" * 32, "odd\\name\nx"))
+        assert list(parse_manifest(str(self.manifest))) == [("ab" * 32, "odd\\name\nx")]
+
+        line = format_manifest_line("ab" * 32, "carriage\rreturn")
+        assert line == "\\" + "ab" * 32 + "  carriage\\rreturn\n"
+        self.manifest.write_text(line, newline="\n")
+        assert list(parse_manifest(str(self.manifest))) == [("ab" * 32, "carriage\rreturn")]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
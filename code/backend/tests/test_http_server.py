@@ -0,0 +1,168 @@
+"""
+Test suite for the StegoCrypt Suite local HTTP service.
+Tests access control, JSON commands and streamed carrier uploads.
+"""
+
+import pytest
+import json
+import threading
+import http.client
+from pathlib import Path
+from urllib.parse import quote
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "Backend"))
+
+from http_server import create_server, command_argv, host_name, server_url
+from hashing import hash_message
+
+COVER_TEXT = "the quick brown fox jumps over the lazy dog " * 40
+
+
+class TestHTTPServer:
+    """Test the loopback HTTP service."""
+
+    def setup_method(self):
+        """Start a server on a free port."""
+        self.server = create_server(port=0, token="test-token")
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=30)
+
+    def teardown_method(self):
+        """Stop the server."""
+        self.connection.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def request(self, method, path, body=None, headers=None, token="test-token"):
+        headers = dict(headers or {})
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        if isinstance(body, dict):
+            body = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        self.connection.request(method, path, body, headers)
+        response = self.connection.getresponse()
+        return response, response.read()
+
+    def test_requires_token_and_loopback_host(self):
+        """Test that requests without the token or with a foreign Host are refused."""
+        response, _ = self.request("GET", "/v1/health", token=None)
+        assert response.status == 401
+        response, _ = self.request("GET", "/v1/health", headers={"Host": "evil.example:80"})
+        assert response.status == 403
+        response, body = self.request("GET", "/v1/health")
+        assert response.status == 200 and json.loads(body)["status"] == "success"
+        for host in ("[::1]", "[::1]:8765", "localhost"):
+            response, _ = self.request("GET", "/v1/health", headers={"Host": host})
+            assert response.status == 200, host
+        for host in ("[::1", "[::1]evil", "[::2]:80"):
+            response, _ = self.request("GET", "/v1/health", headers={"Host": host})
+            assert response.status == 403, host
+
+    def test_host_name(self):
+        """Test Host header parsing, bracketed IPv6 literals included."""
+        assert host_name("127.0.0.1:8765") == "127.0.0.1"
+        assert host_name("localhost") == "localhost"
+        assert host_name("[::1]") == "::1"
+        assert host_name("[::1]:8765") == "::1"
+        assert host_name("[::1") == ""
+
+    def test_refuses_non_loopback_address(self):
+        """Test that the server cannot be bound to a public interface."""
+        with pytest.raises(ValueError):
+            create_server("0.0.0.0", 0)
+
+    @pytest.mark.parametrize("host", ["::1", "[::1]"])
+    def test_ipv6_loopback(self, host):
+        """Test binding the IPv6 loopback address and bracketing it in the URL."""
+        try:
+            server = create_server(host, 0, token="test-token")
+        except OSError:
+            pytest.skip("IPv6 loopback not available")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = server_url(server)
+            assert url == f"http://[::1]:{server.server_address[1]}"
+            connection = http.client.HTTPConnection("::1", server.server_address[1], timeout=30)
+            connection.request("GET", "/v1/health", headers={"Authorization": "Bearer test-token"})
+            assert connection.getresponse().status == 200
+            connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_commands_on_one_keep_alive_connection(self):
+        """Test JSON commands, reusing a single connection."""
+        response, body = self.request("POST", "/v1/commands/hash", {"message": "hello", "algorithm": "sha256"})
+        assert response.status == 200
+        assert json.loads(body)["hash"] == hash_message("hello", "sha256")
+
+        response, body = self.request("POST", "/v1/commands/encrypt",
+                                      {"method": "AES", "message": "-starts with a dash", "password": "pw"})
+        ciphertext = json.loads(body)["ciphertext"]
+        response, body = self.request("POST", "/v1/commands/decrypt",
+                                      {"method": "AES", "ciphertext": ciphertext, "password": "pw"})
+        assert json.loads(body)["message"] == "-starts with a dash"
+
+        response, body = self.request("POST", "/v1/commands/algorithms")
+        assert "sha256" in json.loads(body)["hashing"]
+
+    def test_invalid_commands(self):
+        """Test that bad arguments and CLI-only commands are rejected."""
+        response, _ = self.request("POST", "/v1/commands/encrypt", {"message": "no method"})
+        assert response.status == 400
+        response, _ = self.request("POST", "/v1/commands/hash-tree", {"root": "."})
+        assert response.status == 403
+        response, body = self.request("POST", "/v1/commands/decrypt",
+                                      {"method": "AES", "ciphertext": "bm9wZQ==", "password": "pw"})
+        assert response.status == 422 and json.loads(body)["status"] == "error"
+
+    def test_server_side_paths_are_refused(self):
+        """Test that commands and options touching server-side files are CLI-only."""
+        for path, arguments in (
+            ("rsa/export-keys", {"output_dir": "/tmp/stolen"}),
+            ("rsa/import-keys", {"pub_file": "a.pem", "priv_file": "b.pem"}),
+            ("encode-text", {"message": "m", "algorithm": "AES", "password": "pw",
+                             "input_file": "in.txt", "output_file": "/tmp/out.txt", "stream": True}),
+            ("hash", {"file": "/etc/passwd"}),
+            ("rsa/generate-keys", {"output_dir": "/tmp/keys"}),
+            ("rsa/pool-fill", {"background": True}),
+            ("rsa", {}),
+        ):
+            response, body = self.request("POST", f"/v1/commands/{path}", arguments)
+            assert response.status == 403, path
+            assert json.loads(body)["status"] == "error"
+
+    def test_chunked_text_encode_then_decode(self):
+        """Test a chunked carrier upload returning raw stego bytes, and decoding them."""
+        data = COVER_TEXT.encode("utf-8")
+        chunks = (data[i:i + 100] for i in range(0, len(data), 100))
+        headers = {
+            "X-StegoCrypt-Algorithm": "AES",
+            "X-StegoCrypt-Message": quote("secret ✓"),
+            "X-StegoCrypt-Password": "pw",
+        }
+        # http.client sends an iterable body with chunked transfer encoding
+        response, stego = self.request("POST", "/v1/carriers/text/encode", chunks, headers)
+        assert response.status == 200
+        assert response.getheader("Content-Type").startswith("text/plain")
+        assert len(stego) > len(data)
+
+        response, body = self.request("POST", "/v1/carriers/text/decode", stego,
+                                      {"X-StegoCrypt-Algorithm": "AES", "X-StegoCrypt-Password": "pw"})
+        assert response.status == 200
+        assert json.loads(body)["message"] == "secret ✓"
+
+    def test_command_argv(self):
+        """Test the JSON to argv conversion."""
+        argv = command_argv(["rsa", "encrypt"], {"message": "-x", "no_cache": True, "tree": False})
+        assert argv == ["rsa", "encrypt", "--message=-x", "--no-cache"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
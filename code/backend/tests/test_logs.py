@@ -0,0 +1,491 @@
+"""
+Test suite for StegoCrypt Suite logging utilities.
+Tests log retrieval, pagination and statistics.
+"""
+
+import pytest
+import tempfile
+import json
+import gzip
+import logging
+import queue
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "Backend"))
+
+import logs
+from log_journal import LogJournal
+from utilities import timing
+
+
+class TestGetLogs:
+    """Test tail-based log retrieval."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.log_file = self.temp_dir / "stegocrypt.log"
+        lines = [json.dumps({"operation": "OP", "status": "SUCCESS", "details": {"n": i}}) for i in range(50)]
+        lines.insert(10, "not json")
+        self.log_file.write_text("\n".join(lines) + "\n")
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    @pytest.fixture(autouse=True)
+    def patch_log_file(self, monkeypatch):
+        monkeypatch.setattr(logs, "LOG_FILE", str(self.log_file))
+        monkeypatch.setattr(logs, "SEGMENT_INDEX_FILE", str(self.temp_dir / "segments.json"))
+        monkeypatch.setattr(logs, "TAIL_BLOCK_SIZE", 97)
+
+    def test_last_entries_oldest_first(self):
+        """Test that the newest entries are returned in file order."""
+        entries = logs.get_logs(5)
+        assert [e["details"]["n"] for e in entries] == [45, 46, 47, 48, 49]
+
+    def test_pagination_covers_whole_log(self):
+        """Test that following next_before pages back through every entry once."""
+        seen = []
+        before = None
+        while True:
+            page = logs.get_logs_page(7, before)
+            seen = [e["details"]["n"] for e in page["logs"]] + seen
+            before = page["next_before"]
+            if before is None:
+                break
+
+        assert seen == list(range(50))
+
+    def test_missing_log_file(self, monkeypatch):
+        """Test that a missing log yields no entries."""
+        monkeypatch.setattr(logs, "LOG_FILE", str(self.temp_dir / "missing.log"))
+        assert logs.get_logs_page() == {"logs": [], "next_before": None}
+
+
+class TestLogStats:
+    """Test incremental log statistics."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.log_file = self.temp_dir / "stegocrypt.log"
+        self.log_file.write_text("")
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    @pytest.fixture(autouse=True)
+    def patch_log_files(self, monkeypatch):
+        monkeypatch.setattr(logs, "LOG_FILE", str(self.log_file))
+        monkeypatch.setattr(logs, "SEGMENT_INDEX_FILE", str(self.temp_dir / "segments.json"))
+        monkeypatch.setattr(logs, "ROTATION_LOCK_FILE", str(self.temp_dir / ".rotate.lock"))
+        monkeypatch.setattr(logs, "STATS_CHECKPOINT_FILE", str(self.temp_dir / "stats_checkpoint.json"))
+
+    def append(self, operation, status, filename=None):
+        details = {"filename": filename} if filename else {}
+        with open(self.log_file, "a") as f:
+            f.write(json.dumps({"operation": operation, "status": status, "details": details}) + "\n")
+
+    def test_counts_by_operation_and_status(self):
+        """Test totals and the per-operation breakdown."""
+        self.append("ENCODE_IMAGE", "STARTED", "a.png")
+        self.append("ENCODE_IMAGE", "SUCCESS", "a.png")
+        self.append("HASH", "FAILED")
+
+        stats = logs.get_log_stats()
+        assert stats["total_operations"] == 3
+        assert stats["files_processed"] == 2
+        assert stats["by_operation"] == {
+            "ENCODE_IMAGE": {"STARTED": 1, "SUCCESS": 1},
+            "HASH": {"FAILED": 1},
+        }
+
+    def test_only_new_lines_are_parsed(self, monkeypatch):
+        """Test that a second call folds in only the appended bytes."""
+        self.append("HASH", "SUCCESS")
+        logs.get_log_stats()
+
+        parsed = []
+        original = logs._fold_lines
+        monkeypatch.setattr(logs, "_fold_lines", lambda stats, data: (parsed.append(data), original(stats, data)))
+        self.append("DECODE_TEXT", "SUCCESS")
+
+        stats = logs.get_log_stats()
+        assert stats["total_operations"] == 2
+        assert len(parsed) == 1 and b"DECODE_TEXT" in parsed[0] and b"HASH" not in parsed[0]
+
+    def test_partial_line_waits_for_newline(self):
+        """Test that a line still being written is not counted yet."""
+        self.append("HASH", "SUCCESS")
+        with open(self.log_file, "a") as f:
+            f.write('{"operation": "HA')
+
+        assert logs.get_log_stats()["total_operations"] == 1
+        with open(self.log_file, "a") as f:
+            f.write('SH", "status": "SUCCESS"}\n')
+        assert logs.get_log_stats()["total_operations"] == 2
+
+    def test_latency_percentiles_per_operation(self):
+        """Test p50/p95/p99 estimates from the recorded durations."""
+        with open(self.log_file, "a") as f:
+            for ms in range(1, 101):
+                entry = {"operation": "HASH", "status": "SUCCESS", "details": {"timing": {"duration_ms": ms}}}
+                f.write(json.dumps(entry) + "\n")
+        self.append("HASH", "STARTED")
+
+        latency = logs.get_log_stats()["latency"]["HASH"]
+        assert latency["count"] == 100
+        for label, exact in (("p50_ms", 50), ("p95_ms", 95), ("p99_ms", 99)):
+            assert exact <= latency[label] <= exact * 1.1
+
+    def test_latency_estimate_bound(self):
+        """Test that a percentile estimate is never below, and at most 10% above, the true value."""
+        for ms in (0.05, 0.9, 1, 7.3, 123.456, 5000, 86400000):
+            histogram = {}
+            timing.add_latency(histogram, ms)
+            estimate = timing.summarize_latency(histogram)["p50_ms"]
+            # Estimates are rounded to the microsecond
+            assert ms - 0.0005 <= estimate <= ms * 1.1 + 0.0005
+
+    def test_missing_log_has_every_key(self, monkeypatch):
+        """Test that stats for a log that does not exist yet have the usual shape."""
+        self.append("HASH", "SUCCESS")
+        expected_keys = set(logs.get_log_stats())
+        monkeypatch.setattr(logs, "LOG_FILE", str(self.temp_dir / "missing.log"))
+        monkeypatch.setattr(logs, "STATS_CHECKPOINT_FILE", str(self.temp_dir / "missing.json"))
+
+        stats = logs.get_log_stats()
+        assert set(stats) == expected_keys
+        assert (stats["total_operations"], stats["latency"], stats["dropped_entries"]) == (0, {}, 0)
+
+    def test_replaced_log_is_recounted(self):
+        """Test that a truncated or replaced log resets the counters."""
+        for _ in range(3):
+            self.append("HASH", "SUCCESS")
+        logs.get_log_stats()
+
+        self.log_file.write_text("")
+        self.append("ENCRYPT", "SUCCESS")
+        stats = logs.get_log_stats()
+        assert stats["total_operations"] == 1
+        assert stats["by_operation"] == {"ENCRYPT": {"SUCCESS": 1}}
+
+
+class TestLogRotation:
+    """Test rotation into gzip segments and reads across them."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.log_file = self.temp_dir / "stegocrypt.log"
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    @pytest.fixture(autouse=True)
+    def patch_log_files(self, monkeypatch):
+        monkeypatch.setattr(logs, "LOG_DIR", str(self.temp_dir))
+        monkeypatch.setattr(logs, "LOG_FILE", str(self.log_file))
+        monkeypatch.setattr(logs, "SEGMENT_INDEX_FILE", str(self.temp_dir / "segments.json"))
+        monkeypatch.setattr(logs, "ROTATION_LOCK_FILE", str(self.temp_dir / ".rotate.lock"))
+        monkeypatch.setattr(logs, "STATS_CHECKPOINT_FILE", str(self.temp_dir / "stats_checkpoint.json"))
+        monkeypatch.setattr(logs, "LOG_RETENTION_DAYS", 0)
+
+    def append(self, n, day="2026-01-01"):
+        entry = {"timestamp": f"{day}T00:00:{n % 60:02d}", "operation": "OP", "status": "SUCCESS", "details": {"n": n}}
+        with open(self.log_file, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def test_rotate_creates_gzip_segment(self):
+        """Test that rotation archives the live log and starts a new one."""
+        for n in range(3):
+            self.append(n)
+
+        assert logs.rotate_log()
+        assert not self.log_file.exists()
+        segments = json.loads((self.temp_dir / "segments.json").read_text())["segments"]
+        assert len(segments) == 1
+        assert segments[0]["first_timestamp"] == "2026-01-01T00:00:00"
+        assert segments[0]["last_timestamp"] == "2026-01-01T00:00:02"
+        with gzip.open(self.temp_dir / segments[0]["file"], "rt") as f:
+            assert len(f.read().splitlines()) == 3
+        assert not logs.rotate_log()
+
+    def test_pagination_spans_segments(self):
+        """Test that cursors page from the live log back through archives."""
+        for batch in range(3):
+            for n in range(batch * 5, batch * 5 + 5):
+                self.append(n)
+            if batch < 2:
+                logs.rotate_log()
+
+        seen = []
+        before = None
+        while True:
+            page = logs.get_logs_page(4, before)
+            seen = [e["details"]["n"] for e in page["logs"]] + seen
+            before = page["next_before"]
+            if before is None:
+                break
+
+        assert seen == list(range(15))
+
+    def test_stats_survive_rotation(self):
+        """Test that totals include entries that were rotated away."""
+        self.append(0)
+        logs.get_log_stats()
+        self.append(1)
+        logs.rotate_log()
+        self.append(2)
+
+        assert logs.get_log_stats()["total_operations"] == 3
+
+    def test_rotation_during_stats_update(self, monkeypatch):
+        """Test that a rotation attempted mid-update neither loses nor double-counts entries."""
+        for n in range(60):
+            self.append(n)
+        logs.get_log_stats()
+        self.append(60)
+
+        rotated = []
+        original = logs._fold_lines
+
+        def fold_then_rotate(stats, data):
+            original(stats, data)
+            if not rotated:
+                rotated.append(logs.rotate_log())
+
+        monkeypatch.setattr(logs, "_fold_lines", fold_then_rotate)
+        assert logs.get_log_stats()["total_operations"] == 61
+        # The update held the rotation lock, so the rotation waits for the next write
+        assert rotated == [False]
+        monkeypatch.setattr(logs, "_fold_lines", original)
+
+        assert logs.rotate_log()
+        self.append(61)
+        assert logs.get_log_stats()["total_operations"] == 62
+
+    def test_rotation_from_another_thread(self):
+        """Test stats updates racing rotations on the log writer's behalf."""
+        import threading
+        stop = threading.Event()
+        # Only the log writer appends or rotates, never both at once
+        writer = threading.Lock()
+
+        def rotate_continuously():
+            while not stop.is_set():
+                with writer:
+                    logs.rotate_log()
+
+        for n in range(20):
+            self.append(n)
+        rotator = threading.Thread(target=rotate_continuously)
+        rotator.start()
+        try:
+            for n in range(20, 200):
+                with writer:
+                    self.append(n)
+                logs.get_log_stats()
+        finally:
+            stop.set()
+            rotator.join()
+        assert logs.get_log_stats()["total_operations"] == 200
+
+    def test_time_range_skips_segments(self, monkeypatch):
+        """Test that segments outside since/until are never decompressed."""
+        self.append(0, "2026-01-01")
+        logs.rotate_log()
+        self.append(1, "2026-01-02")
+        logs.rotate_log()
+        self.append(2, "2026-01-03")
+
+        opened = []
+        original = logs.gzip.open
+        monkeypatch.setattr(logs.gzip, "open", lambda path, *a: (opened.append(path), original(path, *a))[1])
+        entries = logs.get_logs(10, since="2026-01-02", until="2026-01-02T23:59:59")
+
+        assert [e["details"]["n"] for e in entries] == [1]
+        assert len(opened) == 1
+
+    def test_retention_keeps_newest_segments(self, monkeypatch):
+        """Test that only LOG_ARCHIVE_RETENTION archives are kept."""
+        monkeypatch.setattr(logs, "LOG_ARCHIVE_RETENTION", 2)
+        for n in range(4):
+            self.append(n)
+            logs.rotate_log()
+
+        assert len(list(self.temp_dir.glob("*.log.gz"))) == 2
+        assert [e["details"]["n"] for e in logs.get_logs(10)] == [2, 3]
+
+    def test_retention_drops_expired_segments(self, monkeypatch):
+        """Test that archives older than LOG_RETENTION_DAYS are deleted."""
+        monkeypatch.setattr(logs, "LOG_RETENTION_DAYS", 30)
+        self.append(0, "2000-01-01")
+        logs.rotate_log()
+        self.append(1, datetime.utcnow().date().isoformat())
+        logs.rotate_log()
+
+        assert [e["details"]["n"] for e in logs.get_logs(10)] == [1]
+
+
+class TestQueuedLogging:
+    """Test the non-blocking queued writer."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.log_file = self.temp_dir / "stegocrypt.log"
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    @pytest.fixture
+    def temp_log(self, monkeypatch):
+        logs.flush_logs()
+        monkeypatch.setattr(logs, "LOG_DIR", str(self.temp_dir))
+        monkeypatch.setattr(logs, "LOG_FILE", str(self.log_file))
+        monkeypatch.setattr(logs, "SEGMENT_INDEX_FILE", str(self.temp_dir / "segments.json"))
+        monkeypatch.setattr(logs.handler, "baseFilename", str(self.log_file))
+        logs.handler.close()
+        yield
+        logs.flush_logs()
+        logs.handler.close()
+
+    def test_log_operation_is_written_in_background(self, temp_log):
+        """Test that queued entries are readable once flushed."""
+        logs.log_operation("HASH", "STARTED", {"filename": "a.txt"})
+        logs.log_operation("HASH", "SUCCESS", {"filename": "a.txt"})
+
+        entries = logs.get_logs(10)
+        assert [(e["operation"], e["status"]) for e in entries] == [("HASH", "STARTED"), ("HASH", "SUCCESS")]
+
+    def test_terminal_entry_carries_timing(self, temp_log):
+        """Test that phase spans between STARTED and SUCCESS are logged."""
+        logs.log_operation("ENCRYPT", "STARTED")
+        with timing.phase("kdf"):
+            timing.record_size("payload_bytes", 42)
+
+        logs.log_operation("ENCRYPT", "SUCCESS", {"method": "AES"})
+        started, finished = logs.get_logs(2)
+        assert "timing" not in started["details"]
+        assert finished["details"]["method"] == "AES"
+        assert set(finished["details"]["timing"]["phases_ms"]) == {"kdf"}
+        assert finished["details"]["timing"]["payload_bytes"] == 42
+        assert finished["details"]["timing"]["duration_ms"] >= finished["details"]["timing"]["phases_ms"]["kdf"]
+
+    def test_full_queue_drops_and_counts(self):
+        """Test that enqueueing never blocks and overflow is counted."""
+        handler = logs.DroppingQueueHandler(queue.Queue(2))
+        for n in range(5):
+            handler.handle(logging.makeLogRecord({"msg": {"n": n}}))
+
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 3
+
+    def test_listener_writes_queued_records_as_one_batch(self):
+        """Test that records already waiting are handed over together."""
+        batches = []
+
+        class Target(logging.Handler):
+            def emit_batch(self, records):
+                batches.append([r.msg["n"] for r in records])
+
+        log_queue = queue.Queue()
+        for n in range(5):
+            log_queue.put(logging.makeLogRecord({"msg": {"n": n}, "levelno": logging.INFO}))
+        listener = logs.BatchingQueueListener(log_queue, Target(), respect_handler_level=True)
+        listener.start()
+        listener.stop()
+
+        assert batches == [[0, 1, 2, 3, 4]]
+
+
+class TestLogJournal:
+    """Test the SQLite operation journal backend."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.journal = LogJournal(str(self.temp_dir / "journal.sqlite3"))
+        self.journal.insert_many([
+            {"timestamp": f"2026-01-0{day}T12:00:00", "operation": op, "status": status,
+             "details": {"filename": name} if name else {}}
+            for day, op, status, name in [
+                (1, "DECODE_VIDEO", "FAILED", "a.mp4"),
+                (2, "DECODE_VIDEO", "SUCCESS", "a.mp4"),
+                (3, "DECODE_VIDEO", "FAILED", "b.mp4"),
+                (4, "HASH", "SUCCESS", None),
+                (5, "DECODE_VIDEO", "FAILED", "a.mp4"),
+            ]
+        ])
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        self.journal.close()
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_stats_with_filters(self):
+        """Test counts pushed down as indexed WHERE clauses."""
+        stats = self.journal.stats(since="2026-01-02", operation="DECODE_VIDEO", status="FAILED")
+        assert stats == {"total_operations": 2, "files_processed": 2,
+                         "by_operation": {"DECODE_VIDEO": {"FAILED": 2}}, "latency": {}}
+        assert self.journal.stats()["files_processed"] == 4
+
+    def test_filename_history_pages(self):
+        """Test paging through one file's history, oldest first per page."""
+        page = self.journal.get_page(2, filename="a.mp4")
+        assert [e["timestamp"][:10] for e in page["logs"]] == ["2026-01-02", "2026-01-05"]
+
+        older = self.journal.get_page(2, before=page["next_before"], filename="a.mp4")
+        assert [e["timestamp"][:10] for e in older["logs"]] == ["2026-01-01"]
+        assert older["next_before"] is None
+
+    def test_migrate_jsonl_is_idempotent(self, monkeypatch):
+        """Test importing existing JSON-lines logs, then re-running the migration."""
+        log_file = self.temp_dir / "stegocrypt.log"
+        monkeypatch.setattr(logs, "LOG_DIR", str(self.temp_dir))
+        monkeypatch.setattr(logs, "LOG_FILE", str(log_file))
+        monkeypatch.setattr(logs, "SEGMENT_INDEX_FILE", str(self.temp_dir / "segments.json"))
+        monkeypatch.setattr(logs, "JOURNAL_FILE", str(self.temp_dir / "migrated.sqlite3"))
+        log_file.write_text("\n".join(
+            json.dumps({"timestamp": f"2026-02-0{n}T00:00:00", "operation": "HASH", "status": "SUCCESS",
+                        "details": {}}) for n in range(1, 4)
+        ) + "\nnot json\n")
+
+        assert logs.migrate_logs_to_journal()["imported"] == 3
+        assert logs.migrate_logs_to_journal()["imported"] == 0
+        assert logs.get_journal().stats()["total_operations"] == 3
+
+    def test_jsonl_backend_filters(self, monkeypatch):
+        """Test that the JSON-lines backend applies the same filters by scanning."""
+        log_file = self.temp_dir / "stegocrypt.log"
+        monkeypatch.setattr(logs, "LOG_FILE", str(log_file))
+        monkeypatch.setattr(logs, "SEGMENT_INDEX_FILE", str(self.temp_dir / "segments.json"))
+        log_file.write_text("".join(
+            json.dumps({"timestamp": "2026-03-01T00:00:00", "operation": op, "status": "FAILED",
+                        "details": {"filename": "x.png"}}) + "\n" for op in ("ENCODE_IMAGE", "HASH", "HASH")
+        ))
+
+        assert [e["operation"] for e in logs.get_logs(10, operation="HASH")] == ["HASH", "HASH"]
+        assert logs.get_log_stats(operation="HASH", filename="x.png")["total_operations"] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
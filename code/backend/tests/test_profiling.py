@@ -0,0 +1,101 @@
+"""
+Test suite for StegoCrypt Suite profiling hooks.
+Tests CPU and memory profile reports.
+"""
+
+import pytest
+import tempfile
+import pstats
+import time
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "Backend"))
+
+import profiling
+from profiling import run_profiled
+
+
+_kept = []
+
+
+def busy(n):
+    return {"status": "success", "total": sum(i * i for i in range(n))}
+
+
+def allocate(n):
+    _kept[:] = [bytes(1024) for _ in range(n)]
+    return {"status": "success"}
+
+
+def allocate_temporary(n):
+    temporary = [bytes(1024) for _ in range(n)]
+    time.sleep(0.2)
+    return {"status": "success", "count": len(temporary)}
+
+
+class TestProfiling:
+    """Test cProfile/tracemalloc wrappers."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    @pytest.fixture(autouse=True)
+    def patch_profile_dir(self, monkeypatch):
+        monkeypatch.setattr(profiling, "PROFILE_DIR", str(self.temp_dir))
+
+    def test_cpu_profile_writes_pstats_file(self):
+        """Test that the .prof report loads with pstats and names the profiled function."""
+        result, info = run_profiled("cpu", "encode-image", busy, 10000)
+
+        assert result["total"] == sum(i * i for i in range(10000))
+        assert info["mode"] == "cpu" and info["report"].endswith(".prof")
+        assert Path(info["report"]).parent == self.temp_dir
+        functions = {func[2] for func in pstats.Stats(info["report"]).stats}
+        assert "busy" in functions
+
+    def test_mem_profile_reports_peak_and_sites(self):
+        """Test that the tracemalloc report records peak usage and allocation sites."""
+        result, info = run_profiled("mem", "encode-video", allocate, 500)
+
+        assert result["status"] == "success"
+        assert info["peak_bytes"] >= 500 * 1024
+        report = Path(info["report"]).read_text()
+        assert "peak_bytes:" in report and "test_profiling.py" in report
+
+    def test_mem_profile_snapshots_the_peak(self):
+        """Test that allocations freed before exit still show up near the peak."""
+        result, info = run_profiled("mem", "encode-video", allocate_temporary, 5000)
+
+        assert result["count"] == 5000
+        # Snapshots are taken every PEAK_SNAPSHOT_GROWTH step, so within one step of the peak
+        assert info["peak_bytes"] >= 5000 * 1024 > info["retained_bytes"]
+        assert info["peak_snapshot_bytes"] * profiling.PEAK_SNAPSHOT_GROWTH >= info["peak_bytes"] * 0.95
+        report = Path(info["report"]).read_text()
+        near_peak = report.split("still held at exit")[0]
+        assert "near the peak" in near_peak and "test_profiling.py" in near_peak
+
+    def test_old_reports_are_pruned(self, monkeypatch):
+        """Test that only PROFILE_RETENTION reports are kept."""
+        monkeypatch.setattr(profiling, "PROFILE_RETENTION", 2)
+        for _ in range(4):
+            run_profiled("cpu", "hash", busy, 10)
+
+        assert len(list(self.temp_dir.iterdir())) == 2
+
+    def test_unknown_mode(self):
+        """Test that unsupported modes are rejected."""
+        with pytest.raises(ValueError):
+            run_profiled("io", "hash", busy, 10)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,108 @@
+"""
+Test suite for StegoCrypt Suite payload presence scanning.
+Tests the PNG scanline reader and detection on encoded and clean covers.
+"""
+
+import pytest
+import tempfile
+import wave
+from pathlib import Path
+import sys
+import numpy as np
+from PIL import Image
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "Backend"))
+
+from scanner import _png_channel_prefix, probe_carrier, scan_carriers
+from cryptography.message_crypto import encrypt_message
+from steganography.image_stego import encode_image
+from steganography.text_stego import encode_text_data
+
+COVER_TEXT = "the quick brown fox jumps over the lazy dog " * 100
+
+
+class TestScanner:
+    """Test payload presence probes."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.ciphertext = encrypt_message("hello", "AES", "pw")
+        pixels = np.random.randint(0, 256, (40, 60, 3), dtype=np.uint8)
+        self.clean_image = self.temp_dir / "clean.png"
+        Image.fromarray(pixels, "RGB").save(self.clean_image)
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_png_scanline_reader_matches_pil(self):
+        """Test that partially inflated PNG rows match a full decode, for every filter type."""
+        yy, xx = np.mgrid[0:30, 0:7]
+        gradient = np.stack([(xx * 3 + yy * 5 + c * 17) % 256 for c in range(4)], -1).astype(np.uint8)
+        for mode, options in (("RGB", {}), ("RGBA", {"optimize": True}), ("RGB", {"compress_level": 1})):
+            path = self.temp_dir / "gradient.png"
+            Image.fromarray(gradient[..., :len(mode)], mode).save(path, **options)
+            for count in (1, 20, 384):
+                expected = np.asarray(Image.open(path).convert("RGB")).reshape(-1)[:count]
+                assert np.array_equal(_png_channel_prefix(str(path), count), expected)
+
+    def test_image_detection(self):
+        """Test detection of long (ciphertext) and short (delimited) image payloads."""
+        stego = self.temp_dir / "stego.png"
+        stego.write_bytes(encode_image(str(self.clean_image), self.ciphertext))
+        short = self.temp_dir / "short.png"
+        short.write_bytes(encode_image(str(self.clean_image), "hi there"))
+
+        assert probe_carrier(str(self.clean_image)) == {"carrier": "image", "detected": False}
+        assert probe_carrier(str(stego))["detected"]
+        assert probe_carrier(str(short))["payload_bytes"] == len("hi there")
+
+    def test_audio_detection(self):
+        """Test the partial WAV read against LSBs set like encode_audio sets them."""
+        frames = bytearray(np.random.randint(0, 256, 8000, dtype=np.uint8).tobytes())
+        clean = self.temp_dir / "clean.wav"
+        stego = self.temp_dir / "stego.wav"
+        bits = "".join(format(ord(c), "08b") for c in self.ciphertext + "###")
+        for path, data in ((clean, bytes(frames)),
+                           (stego, bytes((b & 0xFE) | int(bit) for b, bit in zip(frames, bits)) + frames[len(bits):])):
+            with wave.open(str(path), "wb") as out:
+                out.setnchannels(2)
+                out.setsampwidth(2)
+                out.setframerate(8000)
+                out.writeframes(data)
+
+        assert not probe_carrier(str(clean))["detected"]
+        assert probe_carrier(str(stego))["detected"]
+
+    def test_text_detection(self):
+        """Test both text modes and a clean text."""
+        assert probe_carrier(str(self.write_text("clean.txt", COVER_TEXT)))["detected"] is False
+        legacy = probe_carrier(str(self.write_text("legacy.txt", encode_text_data("hi", COVER_TEXT))))
+        assert legacy["signature"] == "text_legacy" and legacy["payload_bytes"] == 2
+        binary = probe_carrier(str(self.write_text("binary.txt", encode_text_data(self.ciphertext, COVER_TEXT, "binary"))))
+        assert binary["signature"] == "text_binary" and binary["payload_bytes"] == len(self.ciphertext)
+
+    def test_scan_directory(self):
+        """Test a directory scan: lossy and unknown files are skipped, counts add up."""
+        (self.temp_dir / "stego.png").write_bytes(encode_image(str(self.clean_image), self.ciphertext))
+        (self.temp_dir / "photo.jpg").write_bytes(b"not scanned")
+        (self.temp_dir / "broken.png").write_bytes(b"not a png")
+        records = []
+
+        summary = scan_carriers([str(self.temp_dir)], progress=records.append)
+
+        assert summary == {"files": 2, "detected": 1, "errors": 1}
+        assert {Path(record["path"]).name for record in records} == {"clean.png", "stego.png", "broken.png"}
+
+    def write_text(self, name, content):
+        path = self.temp_dir / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -8,6 +8,7 @@ import tempfile
 import os
 from pathlib import Path
 import sys
+from io import BytesIO
 import numpy as np
 from PIL import Image
 
@@ -15,7 +16,12 @@ from PIL import Image
 sys.path.insert(0, str(Path(__file__).parent.parent / "Backend"))
 
 from steganography.image_stego import encode_image, decode_image
+from steganography.text_stego import (
+    encode_text_data, decode_text_data, encode_text_bytes, decode_text_bytes,
+    encode_text_stream, decode_text_stream, encode_text_file, decode_text_file, BINARY_ALPHABET, ZWC,
+)
 from utilities.text_utils import text_to_bin, add_delimiter
+from validation.errors import CapacityError, ValidationError
 
 
 class TestImageSteganography:
@@ -64,44 +70,34 @@ class TestImageSteganography:
         """Test image encoding functionality."""
         test_message = "Test secret message"
         
-        # Test that encoding doesn't crash
-        try:
-            encode_image(str(self.test_image_path), str(self.output_image_path), test_message)
-            assert self.output_image_path.exists()
-        except Exception as e:
-            pytest.fail(f"Image encoding failed: {e}")
+        encoded = encode_image(str(self.test_image_path), test_message)
+        
+        assert encoded.startswith(b"\x89PNG")
+        with Image.open(BytesIO(encoded)) as img:
+            assert img.size == (10, 10)
     
     def test_image_decoding(self):
         """Test image decoding functionality."""
         test_message = "Test secret message"
         
         # Encode first
-        encode_image(str(self.test_image_path), str(self.output_image_path), test_message)
+        self.output_image_path.write_bytes(encode_image(str(self.test_image_path), test_message))
         
         # Then decode
-        try:
-            decoded = decode_image(str(self.output_image_path))
-            # Note: This might fail if the encoding/decoding isn't working properly
-            # In a real test, you'd want to mock or fix the actual implementation
-            assert decoded is not None or decoded is None  # Either result is acceptable for now
-        except Exception as e:
-            pytest.fail(f"Image decoding failed: {e}")
+        assert decode_image(str(self.output_image_path)) == test_message
     
     def test_empty_message(self):
         """Test handling of empty messages."""
         with pytest.raises(Exception):
-            encode_image(str(self.test_image_path), str(self.output_image_path), "")
+            encode_image(str(self.test_image_path), "")
     
     def test_large_message(self):
         """Test handling of large messages."""
         large_message = "A" * 1000
         
-        try:
-            encode_image(str(self.test_image_path), str(self.output_image_path), large_message)
-            assert self.output_image_path.exists()
-        except Exception as e:
-            # Large messages might fail due to capacity limits
-            pytest.skip(f"Large message test skipped: {e}")
+        # 1000 characters need far more than the 300 LSBs of a 10x10 image
+        with pytest.raises(CapacityError):
+            encode_image(str(self.test_image_path), large_message)
 
 
 class TestAudioSteganography:
@@ -218,6 +214,130 @@ class TestTextSteganography:
         except ImportError as e:
             pytest.skip(f"Text steganography dependencies not available: {e}")
 
+    def test_text_encoding_format_is_unchanged(self):
+        """Test that encoding matches stego text produced by earlier releases."""
+        # One word per character: 4-bit type tag and shifted code as six
+        # zero-width characters, then a terminator word; whitespace collapses
+        expected = (
+            "one\u202c\u200e\u200c\u202c\u200e\u200c two\u202c\u200e\u200c\u202d\u200e\u202c"
+            " three\u200c\u202d\u202c\u202c\u200c\u200c four\u200c\u202d\u202c\u202d\u200c\u200c"
+            " five\u200c\u202d\u202c\u200e\u202c\u202c six\u202c\u200e\u202c\u200c\u200e\u200e"
+            " seven\u202d\u202d\u202d\u202d\u202d\u202d eight"
+        )
+        assert encode_text_data("Hi @5z", "one two  three\nfour five six seven eight") == expected
+        assert decode_text_data(expected) == "Hi @5z"
+
+    def test_text_round_trip(self):
+        """Test encoding and decoding a base64-style payload."""
+        cover = self.test_text_path.read_text(encoding="utf-8") * 10
+        message = "U2FsdGVk+/=0123456789"
+
+        stego = encode_text_data(message, cover)
+
+        assert decode_text_data(stego) == message
+        assert decode_text_data(cover) == ""
+
+    def test_text_capacity_and_unsupported_characters(self):
+        """Test that oversized messages and unmappable characters are rejected."""
+        with pytest.raises(CapacityError):
+            encode_text_data("x" * 100, "too few words")
+        with pytest.raises(ValueError):
+            encode_text_data("line\nbreak", "a b c d e f g h i j k l m n o p")
+
+    def test_binary_mode_round_trip(self):
+        """Test binary mode with full Unicode text and arbitrary bytes."""
+        cover = self.test_text_path.read_text(encoding="utf-8") * 50
+        message = "naïve café ✓ 日本語 🎉\nsecond line"
+
+        for bits in (2, 3):
+            for per_word in (1, 7, 12):
+                stego = encode_text_data(message, cover, "binary", bits, per_word)
+                assert decode_text_data(stego) == message
+
+        payload = bytes(range(256))
+        assert decode_text_bytes(encode_text_bytes(payload, cover)) == payload
+        assert decode_text_bytes(cover) is None
+
+    def test_binary_mode_is_denser(self):
+        """Test that binary mode needs far fewer cover words than legacy mode."""
+        message = "U2FsdGVkX1+/0123456789=" * 20
+        cover = "word " * 1000
+
+        def carrying_words(stego):
+            return sum(1 for word in stego.split(" ") if len(word) > len("word"))
+
+        legacy = carrying_words(encode_text_data(message, cover))
+        binary = carrying_words(encode_text_data(message, cover, "binary"))
+        assert binary * 4 < legacy
+        with pytest.raises(CapacityError):
+            encode_text_data(message * 10, cover, "binary", 2, 1)
+
+    def test_cover_with_hidden_characters(self):
+        """Test that covers with natural zero-width characters round-trip and ours are rejected."""
+        # Emoji ZWJ sequence, ZWSP and word joiner occur in ordinary text
+        cover = "coding \U0001F469\u200d\U0001F4BB all day\u200b long and\u2060 more " * 40
+        message = "naïve ✓"
+        for bits in (2, 3):
+            stego = encode_text_data(message, cover, "binary", bits)
+            assert decode_text_data(stego) == message
+            assert decode_text_stream(stego[i:i + 5] for i in range(0, len(stego), 5)) == message
+
+        for stray in ("\u2062", "\u200c"):
+            with pytest.raises(ValidationError):
+                encode_text_data(message, cover + stray, "binary")
+            with pytest.raises(ValidationError):
+                encode_text_data(message, stray + cover)
+            with pytest.raises(ValidationError):
+                list(encode_text_stream(message, ["head ", stray + cover], "binary"))
+
+    def test_streaming_preserves_whitespace(self):
+        """Test the streaming encoder against the in-memory decoder, chunk boundaries anywhere."""
+        cover = "First  line\r\n\tindented   words\n\nnaïve café " * 20
+        for mode, message in (("legacy", "U2FsdGVk+/="), ("binary", "日本語 ✓")):
+            for size in (1, 7, 4096):
+                chunks = [cover[i:i + size] for i in range(0, len(cover), size)]
+                stego = "".join(encode_text_stream(message, chunks, mode))
+
+                hidden = set(ZWC.values()) | set(BINARY_ALPHABET)
+                assert "".join(c for c in stego if c not in hidden) == cover
+                assert decode_text_data(stego) == message
+                assert decode_text_stream(stego[i:i + size] for i in range(0, len(stego), size)) == message
+
+        with pytest.raises(CapacityError):
+            list(encode_text_stream("x" * 50, ["a b", " c"]))
+
+    def test_streaming_long_words(self):
+        """Test many chunks without whitespace: words spanning chunks are not buffered."""
+        cover = "a" * 200000 + " b\u200dc " + "d" * 200000 + " e f g h"
+        for mode, message in (("legacy", "hi"), ("binary", "ok")):
+            chunks = [cover[i:i + 10] for i in range(0, len(cover), 10)]
+            pieces = list(encode_text_stream(message, chunks, mode, symbols_per_word=20))
+            assert max(map(len, pieces)) < 200
+            stego = "".join(pieces)
+            assert stego.startswith("a" * 200000) and decode_text_data(stego) == message
+            assert decode_text_stream(stego[i:i + 10] for i in range(0, len(stego), 10)) == message
+
+    def test_stream_decode_stops_after_payload(self):
+        """Test that decoding reads no further than the hidden message."""
+        def chunks():
+            yield encode_text_data("hi", "a b c d e") + " "
+            raise AssertionError("read past the payload")
+
+        assert decode_text_stream(chunks()) == "hi"
+        assert decode_text_stream(["no hidden words"]) == ""
+
+    def test_text_file_streaming(self):
+        """Test file to file encoding with a small chunk size."""
+        self.test_text_path.write_text("one two\r\nthree four five six seven\n" * 10, encoding="utf-8", newline="")
+
+        encode_text_file("secret", str(self.test_text_path), str(self.output_text_path), chunk_size=5)
+
+        assert decode_text_file(str(self.output_text_path), chunk_size=3) == "secret"
+        assert self.output_text_path.read_bytes().count(b"\r\n") == 10
+        with pytest.raises(CapacityError):
+            encode_text_file("x" * 500, str(self.test_text_path), str(self.output_text_path) + "2")
+        assert not Path(str(self.output_text_path) + "2.tmp").exists()
+
 
 class TestSteganographyIntegration:
     """Test integration between steganography modules."""
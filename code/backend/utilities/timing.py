@@ -0,0 +1,103 @@
+"""Per-operation phase timing and latency histograms."""
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Timing state for the operation running in the current thread or task
+_current = ContextVar("stegocrypt_operation_timing", default=None)
+
+# Latency histogram buckets grow geometrically, and percentiles are reported
+# as the upper bound of their bucket, so an estimate is at most 10% above
+# the true value at any scale. Changing the growth renumbers the buckets
+# already stored in the stats checkpoint and the journal.
+LATENCY_BUCKET_GROWTH = 1.1
+
+
+class OperationTiming:
+    """Accumulates phase durations and byte counts for one operation."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.sizes = {}
+
+    def as_fields(self) -> dict:
+        duration = time.perf_counter() - self.started
+        fields = {
+            "duration_ms": round(duration * 1000, 3),
+            "phases_ms": {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()},
+        }
+        fields.update(self.sizes)
+        processed = self.sizes.get("carrier_bytes", self.sizes.get("payload_bytes"))
+        if processed and duration > 0:
+            fields["throughput_bps"] = round(processed / duration)
+        return fields
+
+
+def begin_operation() -> OperationTiming:
+    """Start timing a new operation in the current context."""
+    timing = OperationTiming()
+    _current.set(timing)
+    return timing
+
+
+def end_operation():
+    """Stop timing the current operation and return its fields, or None if none was started."""
+    timing = _current.get()
+    if timing is None:
+        return None
+    _current.set(None)
+    return timing.as_fields()
+
+
+@contextmanager
+def phase(name):
+    """Time a block as the named phase of the current operation (no-op outside one)."""
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.phases[name] = timing.phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def record_size(name, size):
+    """Record a byte count (e.g. payload_bytes, carrier_bytes) for the current operation."""
+    timing = _current.get()
+    if timing is not None:
+        timing.sizes[name] = timing.sizes.get(name, 0) + size
+
+
+def latency_bucket(duration_ms):
+    """Histogram bucket index for a duration."""
+    return math.ceil(math.log(max(duration_ms, 0.001), LATENCY_BUCKET_GROWTH))
+
+
+def add_latency(histogram, duration_ms):
+    """Count a duration in a sparse {bucket: count} histogram (JSON-friendly keys)."""
+    key = str(latency_bucket(duration_ms))
+    histogram[key] = histogram.get(key, 0) + 1
+
+
+def summarize_latency(histogram):
+    """Count and p50/p95/p99/max estimates (upper bucket bounds, in ms) for a histogram."""
+    buckets = sorted((int(key), count) for key, count in histogram.items())
+    total = sum(count for _, count in buckets)
+    summary = {"count": total}
+    if not total:
+        return summary
+    for label, quantile in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+        rank = math.ceil(quantile * total)
+        seen = 0
+        for bucket, count in buckets:
+            seen += count
+            if seen >= rank:
+                summary[label] = round(LATENCY_BUCKET_GROWTH ** bucket, 3)
+                break
+    summary["max_ms"] = round(LATENCY_BUCKET_GROWTH ** buckets[-1][0], 3)
+    return summary
@@ -18,12 +18,12 @@ def ensure_image_capacity(required_bits: int, width: int, height: int):
         raise CapacityError(f"Message too large: needs {required_bits} bits, capacity {cap} bits")
 
 
-def text_capacity_bits(num_words: int) -> int:
-    return num_words * 12
+def text_capacity_bits(num_words: int, bits_per_word: int = 12) -> int:
+    return num_words * bits_per_word
 
 
-def ensure_text_capacity(required_bits: int, num_words: int):
-    cap = text_capacity_bits(num_words)
+def ensure_text_capacity(required_bits: int, num_words: int, bits_per_word: int = 12):
+    cap = text_capacity_bits(num_words, bits_per_word)
     if required_bits > cap:
         raise CapacityError(f"Message too large for cover text: needs {required_bits} bits, capacity {cap} bits")
 